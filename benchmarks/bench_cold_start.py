@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+CLI Cold-Start Benchmark
+Measures main.py wall time in a fresh interpreter with the stdlib and pandas CSV engines
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+warnings.simplefilter('ignore', DeprecationWarning)
+
+from synthetic_portfolio import write_legacy_csv, write_multistage_csv
+
+# Reports how long importing the generator takes and whether that pulled in pandas
+IMPORT_PROBE = """import sys, time
+start = time.perf_counter()
+import src.gantt_generator
+print(time.perf_counter() - start, 'pandas' in sys.modules)
+"""
+
+
+def import_time() -> tuple:
+    """Seconds to import src.gantt_generator in a fresh interpreter, and whether pandas was imported"""
+    result = subprocess.run([sys.executable, '-c', IMPORT_PROBE], cwd=ROOT, capture_output=True, text=True, check=True)
+    seconds, pandas_loaded = result.stdout.split()
+    return float(seconds), pandas_loaded == 'True'
+
+
+def cold_start(csv_path: Path, output_path: Path, engine: str, runs: int) -> float:
+    """Median wall time of generating one chart with main.py, interpreter start-up included"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(ROOT / 'main.py'), str(csv_path), str(output_path), '--no-cache', '--engine', engine],
+            cwd=ROOT, capture_output=True, check=True
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CLI cold-start time per CSV engine')
+    parser.add_argument(
+        '--rows',
+        help='Comma-separated synthetic row counts besides the bundled mock data (default: 1000,5000,20000)',
+        default='1000,5000,20000'
+    )
+    parser.add_argument('--runs', help='Runs per measurement; the median is reported (default: 5)', type=int, default=5)
+    args = parser.parse_args()
+
+    seconds, pandas_loaded = import_time()
+    print(f"Importing src.gantt_generator: {seconds * 1000:.0f}ms (pandas {'imported' if pandas_loaded else 'not imported'})")
+    print()
+
+    print(f"{'input':>28} {'size':>10} {'stdlib':>9} {'pandas':>9} {'saved':>9}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        inputs = [('mock_three_months.csv', ROOT / 'data' / 'mock_three_months.csv')]
+        for rows in [int(value) for value in args.rows.split(',')]:
+            legacy_path = Path(tmp_dir) / f'legacy_{rows}.csv'
+            multistage_path = Path(tmp_dir) / f'multistage_{rows}.csv'
+            write_legacy_csv(legacy_path, rows)
+            write_multistage_csv(multistage_path, rows, 6)
+            inputs += [(f'legacy {rows}', legacy_path), (f'multi-stage {rows}', multistage_path)]
+
+        output_path = Path(tmp_dir) / 'chart.html'
+        for label, csv_path in inputs:
+            stdlib_time = cold_start(csv_path, output_path, 'stdlib', args.runs)
+            pandas_time = cold_start(csv_path, output_path, 'pandas', args.runs)
+            print(f"{label:>28} {csv_path.stat().st_size / 1024:>8.0f}KB {stdlib_time:>8.3f}s {pandas_time:>8.3f}s "
+                  f"{pandas_time - stdlib_time:>+8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
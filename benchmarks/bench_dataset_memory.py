@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Processed Data Memory Benchmark
+Compares memory per project of GanttDataset against the nested record dicts
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+warnings.simplefilter('ignore', DeprecationWarning)
+
+from src.data_processor import ProjectDataProcessor
+from synthetic_portfolio import write_legacy_csv, write_multistage_csv
+
+
+def measure(build) -> tuple:
+    """Return (result, bytes still allocated by build(), seconds taken)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, allocated, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark memory of processed project data')
+    parser.add_argument('--rows', help='Rows per file (default: 50000)', type=int, default=50000)
+    parser.add_argument('--stages', help='Stages per multi-stage project (default: 8)', type=int, default=8)
+    args = parser.parse_args()
+
+    processor = ProjectDataProcessor()
+
+    print(f"{'format':>12} {'model':>10} {'bytes/project':>14} {'build':>9} {'date range':>11}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = Path(tmp_dir) / 'legacy.csv'
+        multistage_path = Path(tmp_dir) / 'multistage.csv'
+        write_legacy_csv(legacy_path, args.rows)
+        write_multistage_csv(multistage_path, args.rows, args.stages)
+
+        for label, csv_path in [('legacy', legacy_path), ('multi-stage', multistage_path)]:
+            df = processor.load_csv(str(csv_path))
+
+            dataset, dataset_bytes, dataset_time = measure(lambda: processor.process_to_dataset(df))
+            start = time.perf_counter()
+            processor.get_date_range(dataset)
+            dataset_range_time = time.perf_counter() - start
+
+            records, records_bytes, records_time = measure(lambda: processor.process_to_gantt_data(df))
+            start = time.perf_counter()
+            processor.get_date_range(records)
+            records_range_time = time.perf_counter() - start
+
+            print(f"{label:>12} {'dataset':>10} {dataset_bytes / args.rows:>14,.0f} {dataset_time:>8.3f}s {dataset_range_time:>10.4f}s")
+            print(f"{label:>12} {'records':>10} {records_bytes / args.rows:>14,.0f} {records_time:>8.3f}s {records_range_time:>10.4f}s")
+            del dataset, records
+
+
+if __name__ == "__main__":
+    main()
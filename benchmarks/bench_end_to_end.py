@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+End-to-End Pipeline Benchmark
+Times every phase of chart generation on synthetic portfolios and checks the results against a stored baseline
+"""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+warnings.simplefilter('ignore', DeprecationWarning)
+
+from src.bundler import BUNDLE_MODES
+from src.payload import PAYLOAD_FORMATS
+from synthetic_portfolio import PORTFOLIO_FORMATS, ensure_portfolio
+
+RESULTS_VERSION = 2
+BASELINE_PATH = Path(__file__).resolve().parent / 'baseline.json'
+
+# Phases in pipeline order; process + records together are process_to_gantt_data()
+PHASES = ['load', 'validate', 'process', 'records', 'date_range', 'serialize', 'render', 'write']
+
+# Allowed relative growth per metric before a case counts as a regression
+DEFAULT_THRESHOLDS = {'time': 0.25, 'memory': 0.20, 'size': 0.05}
+# Timings below this many seconds are too noisy to compare
+MIN_COMPARED_SECONDS = 0.05
+# Records serialized and parsed by the reference workload
+REFERENCE_ROWS = 50000
+
+
+def run_reference() -> None:
+    """
+    Print the memory footprint after the pipeline's imports and the time of a fixed workload as JSON
+
+    The workload uses json and pandas only, none of this repository's code, so it
+    measures the machine rather than the pipeline.
+    """
+    import importlib
+    import io
+    import pandas as pd
+    # The modules run_child() imports, so the footprint matches what every case starts from
+    for module in ('src.bundler', 'src.data_processor', 'src.gantt_generator'):
+        importlib.import_module(module)
+
+    # ru_maxrss is in kilobytes on Linux
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    start = time.perf_counter()
+    rows = [{'name': f'Project {i}', 'start': f'2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}', 'progress': i % 101}
+            for i in range(REFERENCE_ROWS)]
+    json.dumps(rows, indent=2)
+    df = pd.read_csv(io.StringIO(pd.DataFrame(rows).to_csv(index=False)))
+    pd.to_datetime(df['start'])
+    print(json.dumps({'seconds': time.perf_counter() - start, 'rss_mb': rss_mb}))
+
+
+def run_child(csv_path: str, output_path: str, payload_format: str, bundle: str) -> None:
+    """Run the pipeline once in this process, one phase at a time, and print the measurements as JSON"""
+    import pandas as pd
+    from src.bundler import render_shared_assets
+    from src.data_processor import ProjectDataProcessor
+    from src.gantt_generator import GanttChartGenerator, build_template_context
+
+    processor = ProjectDataProcessor()
+    generator = GanttChartGenerator(payload_format=payload_format, use_cache=False, bundle=bundle)
+    phases = {}
+
+    def timed(phase, step):
+        start = time.perf_counter()
+        result = step()
+        phases[phase] = time.perf_counter() - start
+        return result
+
+    # load_csv() split into parsing and validation
+    df = timed('load', lambda: pd.read_csv(csv_path))
+    timed('validate', lambda: (processor._validate_columns(df), processor._validate_data_types(df)))
+    dataset = timed('process', lambda: processor.process_to_dataset(df))
+    timed('records', dataset.to_records)
+    date_range = timed('date_range', lambda: processor.get_date_range(dataset))
+
+    renderer = generator.choose_renderer(len(dataset), dataset.stage_count)
+    context = timed('serialize', lambda: build_template_context(dataset, date_range, payload_format, renderer))
+    html_content = timed('render', lambda: generator._load_template().render(
+        **context, shared_assets=render_shared_assets(bundle, Path(output_path))))
+
+    def write():
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+    timed('write', write)
+
+    print(json.dumps({
+        'projects': len(dataset),
+        'stages': int(dataset.stage_count),
+        'renderer': renderer,
+        'phases': phases,
+        'total_seconds': sum(phases.values()),
+        # ru_maxrss is in kilobytes on Linux
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'payload_bytes': len(context['project_data'].encode('utf-8')),
+        'output_bytes': Path(output_path).stat().st_size
+    }))
+
+
+def measure(csv_path: Path, output_path: Path, payload_format: str, bundle: str) -> dict:
+    """Run one case in a fresh interpreter so imports, caches and peak RSS are not shared between runs"""
+    return run_fresh('--child', str(csv_path), str(output_path), payload_format, bundle)
+
+
+def run_fresh(*args: str) -> dict:
+    """Run this script with args in a fresh interpreter and return the JSON it prints last"""
+    result = subprocess.run([sys.executable, __file__, *args], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def best_of(runs: list) -> dict:
+    """Combine repeated runs of one case, keeping the fastest time of each phase and the lowest peak"""
+    best = dict(runs[0])
+    best['phases'] = {phase: min(run['phases'][phase] for run in runs) for phase in PHASES}
+    best['total_seconds'] = min(run['total_seconds'] for run in runs)
+    best['peak_rss_mb'] = min(run['peak_rss_mb'] for run in runs)
+    return best
+
+
+def parse_case(spec: str) -> tuple:
+    """Parse 'legacy' or 'multistage:<stages>' into (format, stages)"""
+    portfolio_format, _, stages = spec.partition(':')
+    if portfolio_format not in PORTFOLIO_FORMATS:
+        raise ValueError(f"Unknown portfolio format '{portfolio_format}'. Must be one of {PORTFOLIO_FORMATS}")
+    if portfolio_format == 'legacy':
+        return portfolio_format, ''
+    return portfolio_format, stages or '6'
+
+
+def case_key(portfolio_format: str, stages: str, rows: int) -> str:
+    """Stable name of one case in results and baseline files"""
+    return f"{portfolio_format}:{stages}/{rows}" if stages else f"{portfolio_format}/{rows}"
+
+
+def compare(results: dict, baseline: dict, thresholds: dict) -> list:
+    """
+    Regressions of results against baseline, as readable strings
+
+    Times and peak memory may grow by their threshold before counting; output and
+    payload sizes are deterministic, so their threshold only absorbs intended changes.
+    Cases missing from either file are skipped.
+
+    When both files hold a reference measurement, the baseline is first carried
+    over to this machine: times are scaled by the ratio of the reference workload
+    times, and peak memory is shifted by the difference in the footprint of the
+    imports, so a baseline recorded elsewhere stays comparable.
+    """
+    time_scale, memory_offset = 1.0, 0.0
+    ours, theirs = results.get('reference'), baseline.get('reference')
+    if ours and theirs:
+        time_scale = ours['seconds'] / theirs['seconds']
+        memory_offset = ours['rss_mb'] - theirs['rss_mb']
+
+    regressions = []
+    for key, case in results['cases'].items():
+        reference = baseline.get('cases', {}).get(key)
+        if reference is None:
+            continue
+        checks = [(f"{phase} time", case['phases'][phase], reference['phases'].get(phase), 'time')
+                  for phase in PHASES]
+        checks += [
+            ('total time', case['total_seconds'], reference.get('total_seconds'), 'time'),
+            ('peak memory', case['peak_rss_mb'], reference.get('peak_rss_mb'), 'memory'),
+            ('payload size', case['payload_bytes'], reference.get('payload_bytes'), 'size'),
+            ('output size', case['output_bytes'], reference.get('output_bytes'), 'size')
+        ]
+        for label, value, reference_value, kind in checks:
+            if not reference_value:
+                continue
+            if kind == 'time':
+                reference_value *= time_scale
+            elif kind == 'memory':
+                reference_value += memory_offset
+            if kind == 'time' and max(value, reference_value) < MIN_COMPARED_SECONDS:
+                continue
+            change = value / reference_value - 1
+            if change > thresholds[kind]:
+                precision = ',.0f' if kind == 'size' else ',.3f'
+                regressions.append(f"{key}: {label} {reference_value:{precision}} -> {value:{precision}} "
+                                   f"(+{change:.0%}, threshold {thresholds[kind]:.0%})")
+    return regressions
+
+
+def main():
+    if len(sys.argv) == 6 and sys.argv[1] == '--child':
+        run_child(*sys.argv[2:])
+        return
+    if sys.argv[1:] == ['--reference']:
+        run_reference()
+        return
+
+    parser = argparse.ArgumentParser(description='Benchmark every phase of chart generation end to end')
+    parser.add_argument(
+        '--cases',
+        help="Comma-separated portfolios: 'legacy' or 'multistage:<stages>', where stages may be "
+             "a per-project range such as 2-10 (default: legacy,multistage:6,multistage:2-10)",
+        default='legacy,multistage:6,multistage:2-10'
+    )
+    parser.add_argument(
+        '--rows',
+        help='Comma-separated row counts (default: 1000,10000,100000; add 1000000 for the full sweep)',
+        default='1000,10000,100000'
+    )
+    parser.add_argument('--repeat', help='Runs per case; the best of each is kept (default: 3)', type=int, default=3)
+    parser.add_argument(
+        '--payload',
+        help='Embedded payload format (default: json)',
+        choices=PAYLOAD_FORMATS,
+        default='json'
+    )
+    parser.add_argument(
+        '--bundle',
+        help='How shared scripts are included (default: inline)',
+        choices=BUNDLE_MODES,
+        default='inline'
+    )
+    parser.add_argument(
+        '--data-dir',
+        help='Directory for generated portfolios, reused across runs (default: a temporary directory)'
+    )
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    parser.add_argument(
+        '--baseline',
+        help=f'Baseline results to compare against (default: {BASELINE_PATH.name} next to this script)',
+        default=str(BASELINE_PATH)
+    )
+    parser.add_argument('--update-baseline', help='Store these results as the new baseline', action='store_true')
+    parser.add_argument(
+        '--time-threshold',
+        help=f"Allowed relative slowdown per phase (default: {DEFAULT_THRESHOLDS['time']})",
+        type=float, default=DEFAULT_THRESHOLDS['time']
+    )
+    parser.add_argument(
+        '--memory-threshold',
+        help=f"Allowed relative growth of peak memory (default: {DEFAULT_THRESHOLDS['memory']})",
+        type=float, default=DEFAULT_THRESHOLDS['memory']
+    )
+    parser.add_argument(
+        '--size-threshold',
+        help=f"Allowed relative growth of payload and output size (default: {DEFAULT_THRESHOLDS['size']})",
+        type=float, default=DEFAULT_THRESHOLDS['size']
+    )
+    args = parser.parse_args()
+
+    try:
+        cases = [parse_case(spec) for spec in args.cases.split(',')]
+    except ValueError as e:
+        parser.error(str(e))
+    row_counts = [int(value) for value in args.rows.split(',')]
+
+    results = {
+        'version': RESULTS_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': f"{platform.system()} {platform.machine()}",
+        'payload': args.payload,
+        'bundle': args.bundle,
+        'repeat': args.repeat,
+        'reference': None,
+        'cases': {}
+    }
+
+    # Machine speed and import footprint, to compare against a baseline recorded elsewhere
+    references = [run_fresh('--reference') for _ in range(args.repeat)]
+    results['reference'] = {
+        'seconds': min(reference['seconds'] for reference in references),
+        'rss_mb': min(reference['rss_mb'] for reference in references)
+    }
+    print(f"Reference workload {results['reference']['seconds']:.3f}s, "
+          f"{results['reference']['rss_mb']:.0f}MB after imports")
+
+    print(f"{'case':>24} " + ' '.join(f"{phase:>10}" for phase in PHASES)
+          + f" {'total':>9} {'peak':>8} {'payload':>13} {'output':>13}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = Path(args.data_dir) if args.data_dir else Path(tmp_dir)
+        output_path = Path(tmp_dir) / 'chart.html'
+        for rows in row_counts:
+            for portfolio_format, stages in cases:
+                csv_path = ensure_portfolio(data_dir, portfolio_format, rows, stages or '6')
+                runs = [measure(csv_path, output_path, args.payload, args.bundle) for _ in range(args.repeat)]
+                case = best_of(runs)
+                case.update(format=portfolio_format, stage_spec=stages, rows=rows,
+                            csv_bytes=csv_path.stat().st_size)
+                key = case_key(portfolio_format, stages, rows)
+                results['cases'][key] = case
+                print(f"{key:>24} " + ' '.join(f"{case['phases'][phase]:>9.3f}s" for phase in PHASES)
+                      + f" {case['total_seconds']:>8.2f}s {case['peak_rss_mb']:>6.0f}MB"
+                      f" {case['payload_bytes']:>13,} {case['output_bytes']:>13,}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f"Results written to {args.output}")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f"Baseline updated: {baseline_path}")
+        return
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --update-baseline to create one")
+        return
+
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+    thresholds = {'time': args.time_threshold, 'memory': args.memory_threshold, 'size': args.size_threshold}
+    regressions = compare(results, baseline, thresholds)
+    compared = len(set(results['cases']) & set(baseline.get('cases', {})))
+    if regressions:
+        print(f"{len(regressions)} regression(s) against {baseline_path.name}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"No regressions against {baseline_path.name} ({compared} case(s) compared)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Legacy Format Processing Benchmark
+Measures how validation and Gantt record generation scale with row count
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+warnings.simplefilter('ignore', DeprecationWarning)
+
+from src.data_processor import ProjectDataProcessor
+from synthetic_portfolio import ensure_portfolio
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark legacy-format processing against row count')
+    parser.add_argument(
+        '--rows',
+        help='Comma-separated row counts (default: 1000,10000,50000,200000)',
+        default='1000,10000,50000,200000'
+    )
+    args = parser.parse_args()
+
+    row_counts = [int(value) for value in args.rows.split(',')]
+    processor = ProjectDataProcessor()
+
+    print(f"{'rows':>10} {'load_csv':>10} {'process':>10} {'rows/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in row_counts:
+            csv_path = ensure_portfolio(Path(tmp_dir), 'legacy', rows)
+
+            start = time.perf_counter()
+            df = processor.load_csv(str(csv_path))
+            load_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            processor.process_to_gantt_data(df)
+            process_time = time.perf_counter() - start
+
+            throughput = rows / (load_time + process_time)
+            print(f"{rows:>10} {load_time:>9.3f}s {process_time:>9.3f}s {throughput:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Multi-Stage Format Processing Benchmark
+Compares per-row cost of multi-stage projects against legacy two-stage rows
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+warnings.simplefilter('ignore', DeprecationWarning)
+
+from src.data_processor import ProjectDataProcessor
+from synthetic_portfolio import write_legacy_csv, write_multistage_csv
+
+
+def time_pipeline(processor: ProjectDataProcessor, csv_path: Path) -> float:
+    """Time load_csv + process_to_gantt_data for one file"""
+    start = time.perf_counter()
+    df = processor.load_csv(str(csv_path))
+    processor.process_to_gantt_data(df)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark multi-stage processing against legacy rows')
+    parser.add_argument('--rows', help='Rows per file (default: 20000)', type=int, default=20000)
+    parser.add_argument(
+        '--stages',
+        help='Comma-separated stage counts (default: 2,6,8,10)',
+        default='2,6,8,10'
+    )
+    args = parser.parse_args()
+
+    processor = ProjectDataProcessor()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = Path(tmp_dir) / 'legacy.csv'
+        write_legacy_csv(legacy_path, args.rows)
+        legacy_time = time_pipeline(processor, legacy_path)
+        legacy_per_row = legacy_time / args.rows * 1e6
+
+        print(f"{'format':>12} {'stages':>7} {'total':>9} {'us/row':>9} {'vs legacy':>10}")
+        print(f"{'legacy':>12} {2:>7} {legacy_time:>8.3f}s {legacy_per_row:>9.1f} {'1.0x':>10}")
+
+        for stages in [int(value) for value in args.stages.split(',')]:
+            csv_path = Path(tmp_dir) / f'multistage_{stages}.csv'
+            write_multistage_csv(csv_path, args.rows, stages)
+            elapsed = time_pipeline(processor, csv_path)
+            per_row = elapsed / args.rows * 1e6
+            print(f"{'multi-stage':>12} {stages:>7} {elapsed:>8.3f}s {per_row:>9.1f} {per_row / legacy_per_row:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Normalized Stages Benchmark
+Compares loading multi-stage projects from JSON stages cells against a projects
+table plus a stages table, and against a single long-format table
+"""
+
+import argparse
+import csv
+import json
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+warnings.simplefilter('ignore', DeprecationWarning)
+
+from src.data_processor import NORMALIZED_PROJECT_COLUMNS, ProjectDataProcessor
+from synthetic_portfolio import write_multistage_csv
+
+STAGE_COLUMNS = ['name', 'start', 'end', 'progress', 'status']
+
+
+def write_normalized_csvs(json_path: Path, projects_path: Path, stages_path: Path, long_path: Path) -> None:
+    """Rewrite a multi-stage CSV as a projects and a stages table, and as one long-format table"""
+    with open(json_path, newline='', encoding='utf-8') as source, \
+            open(projects_path, 'w', newline='', encoding='utf-8') as projects_file, \
+            open(stages_path, 'w', newline='', encoding='utf-8') as stages_file, \
+            open(long_path, 'w', newline='', encoding='utf-8') as long_file:
+        projects, stages, long = csv.writer(projects_file), csv.writer(stages_file), csv.writer(long_file)
+        projects.writerow(NORMALIZED_PROJECT_COLUMNS)
+        stages.writerow(['project_id'] + STAGE_COLUMNS)
+        long.writerow(NORMALIZED_PROJECT_COLUMNS + STAGE_COLUMNS)
+        for i, row in enumerate(csv.DictReader(source)):
+            project = [f'P{i}'] + [row[column] for column in NORMALIZED_PROJECT_COLUMNS[1:]]
+            projects.writerow(project)
+            for stage in json.loads(row['stages']):
+                values = [stage[column] for column in STAGE_COLUMNS]
+                stages.writerow([f'P{i}'] + values)
+                long.writerow(project + values)
+
+
+def time_json(path: Path):
+    """Time load_csv + process_to_dataset on the JSON-cell file"""
+    processor = ProjectDataProcessor()
+    start = time.perf_counter()
+    dataset = processor.process_to_dataset(processor.load_csv(str(path)))
+    return time.perf_counter() - start, dataset
+
+
+def time_two_file(projects_path: Path, stages_path: Path):
+    """Time load_normalized + process_normalized_to_dataset on the projects and stages tables"""
+    processor = ProjectDataProcessor()
+    start = time.perf_counter()
+    dataset = processor.process_normalized_to_dataset(*processor.load_normalized(str(projects_path), str(stages_path)))
+    return time.perf_counter() - start, dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark normalized stage tables against JSON stages cells')
+    parser.add_argument('--rows', help='Projects per file (default: 100000)', type=int, default=100000)
+    parser.add_argument('--stages', help='Stages per project (default: 6)', type=int, default=6)
+    parser.add_argument('--repeat', help='Runs per input, best one reported (default: 3)', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        json_path, projects_path = tmp / 'multistage.csv', tmp / 'projects.csv'
+        stages_path, long_path = tmp / 'stages.csv', tmp / 'long.csv'
+        write_multistage_csv(json_path, args.rows, args.stages)
+        write_normalized_csvs(json_path, projects_path, stages_path, long_path)
+
+        inputs = [
+            ('json cells', lambda: time_json(json_path), json_path.stat().st_size),
+            ('two-file', lambda: time_two_file(projects_path, stages_path),
+             projects_path.stat().st_size + stages_path.stat().st_size),
+            ('long-format', lambda: time_json(long_path), long_path.stat().st_size)
+        ]
+
+        print(f"{args.rows:,} projects x {args.stages} stages, best of {args.repeat}")
+        print(f"{'input':>12} {'size':>9} {'total':>9} {'stages/s':>11} {'vs json':>8}")
+        baseline = None
+        reference = None
+        for label, run, size in inputs:
+            best = None
+            for _ in range(args.repeat):
+                elapsed, dataset = run()
+                best = elapsed if best is None else min(best, elapsed)
+            if baseline is None:
+                baseline, reference = best, dataset.to_records()
+            elif dataset.to_records() != reference:
+                print(f"{label}: records differ from the JSON-cell input")
+                sys.exit(1)
+            print(f"{label:>12} {size / 1e6:>7.1f}MB {best:>8.3f}s {dataset.stage_count / best:>11,.0f} "
+                  f"{baseline / best:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
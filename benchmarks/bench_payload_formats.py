@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Embedded Payload Format Benchmark
+Compares size, serialization time and browser-side decode time of each payload format
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+warnings.simplefilter('ignore', DeprecationWarning)
+
+from src.data_processor import ProjectDataProcessor
+from src.payload import PAYLOAD_FORMATS, render_project_data
+from synthetic_portfolio import write_legacy_csv, write_multistage_csv
+
+# Evaluates the payload expression the way a page does and reports the parse/decode time
+NODE_HARNESS = """const window = globalThis;
+const started = Date.now();
+const projectData = {expression};
+console.log(Date.now() - started, projectData.length);
+"""
+
+
+def decode_time(expression: str, tmp_dir: str) -> str:
+    """Milliseconds node needs to evaluate the payload expression, or 'n/a' without node"""
+    node = shutil.which('node')
+    if not node:
+        return 'n/a'
+    script_path = Path(tmp_dir) / 'decode.js'
+    script_path.write_text(NODE_HARNESS.replace('{expression}', expression), encoding='utf-8')
+    result = subprocess.run([node, str(script_path)], capture_output=True, text=True)
+    if result.returncode != 0:
+        return 'error'
+    return f"{int(result.stdout.split()[0]) / 1000:.3f}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark embedded payload formats')
+    parser.add_argument('--rows', help='Rows per file (default: 50000)', type=int, default=50000)
+    parser.add_argument('--stages', help='Stages per multi-stage project (default: 6)', type=int, default=6)
+    args = parser.parse_args()
+
+    processor = ProjectDataProcessor()
+
+    print(f"{'format':>12} {'payload':>13} {'bytes':>14} {'serialize':>10} {'decode':>9}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = Path(tmp_dir) / 'legacy.csv'
+        multistage_path = Path(tmp_dir) / 'multistage.csv'
+        write_legacy_csv(legacy_path, args.rows)
+        write_multistage_csv(multistage_path, args.rows, args.stages)
+
+        for label, csv_path in [('legacy', legacy_path), ('multi-stage', multistage_path)]:
+            dataset = processor.process_to_dataset(processor.load_csv(str(csv_path)))
+            for payload_format in PAYLOAD_FORMATS:
+                start = time.perf_counter()
+                expression = render_project_data(dataset, payload_format)
+                elapsed = time.perf_counter() - start
+                print(f"{label:>12} {payload_format:>13} {len(expression.encode('utf-8')):>14,} "
+                      f"{elapsed:>9.3f}s {decode_time(expression, tmp_dir):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Streaming Ingestion Memory Benchmark
+Compares peak memory of whole-file and chunked chart generation as the CSV grows
+"""
+
+import argparse
+import contextlib
+import io
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+warnings.simplefilter('ignore', DeprecationWarning)
+
+from synthetic_portfolio import write_legacy_csv
+
+
+def run_child(csv_path: str, output_path: str, chunk_size: int) -> None:
+    """Generate one chart in this process and report elapsed time and peak RSS"""
+    from src.gantt_generator import GanttChartGenerator
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        GanttChartGenerator().generate_chart(csv_path, output_path, chunk_size=chunk_size or None)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{elapsed:.3f} {peak_mb:.1f}")
+
+
+def measure(csv_path: Path, output_path: Path, chunk_size: int) -> tuple:
+    """Run one generation in a fresh interpreter so peak RSS is not shared between runs"""
+    result = subprocess.run(
+        [sys.executable, __file__, '--child', str(csv_path), str(output_path), str(chunk_size)],
+        capture_output=True, text=True, check=True
+    )
+    elapsed, peak_mb = result.stdout.split()
+    return float(elapsed), float(peak_mb)
+
+
+def main():
+    if len(sys.argv) == 5 and sys.argv[1] == '--child':
+        run_child(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return
+
+    parser = argparse.ArgumentParser(description='Benchmark peak memory of whole-file vs chunked generation')
+    parser.add_argument(
+        '--rows',
+        help='Comma-separated row counts (default: 50000,100000,200000,400000)',
+        default='50000,100000,200000,400000'
+    )
+    parser.add_argument('--chunk-size', help='Rows per chunk (default: 20000)', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'whole time':>11} {'whole peak':>11} {'chunk time':>11} {'chunk peak':>11}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in [int(value) for value in args.rows.split(',')]:
+            csv_path = Path(tmp_dir) / f'legacy_{rows}.csv'
+            output_path = Path(tmp_dir) / 'chart.html'
+            write_legacy_csv(csv_path, rows)
+
+            whole_time, whole_peak = measure(csv_path, output_path, 0)
+            chunk_time, chunk_peak = measure(csv_path, output_path, args.chunk_size)
+            print(f"{rows:>10} {whole_time:>10.2f}s {whole_peak:>9.0f}MB {chunk_time:>10.2f}s {chunk_peak:>9.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
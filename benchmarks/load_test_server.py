@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Chart Server Load Test
+Fires concurrent requests at `main.py serve` and reports throughput, latency percentiles and response codes
+"""
+
+import argparse
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def fetch(url: str, headers: dict) -> tuple:
+    """GET url; returns (status, body bytes, ETag, seconds)"""
+    request = urllib.request.Request(url, headers=headers)
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=120) as response:
+            body = response.read()
+            status, etag = response.status, response.headers.get('ETag')
+    except urllib.error.HTTPError as e:
+        # 304 and error statuses arrive as exceptions
+        body = e.read()
+        status, etag = e.code, e.headers.get('ETag')
+    return status, len(body), etag, time.perf_counter() - start
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(root: str, workers: int) -> tuple:
+    """Start main.py serve on a free port and wait until it answers; returns (process, base URL)"""
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, str(ROOT / 'main.py'), 'serve', root, '--port', str(port), '--workers', str(workers)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"{base_url}/", timeout=1).read()
+            return process, base_url
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("Server did not start within 30s")
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(url: str, requests: int, concurrency: int, headers: dict) -> dict:
+    """Send requests GETs with concurrency in flight; returns the summary"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda _: fetch(url, headers), range(requests)))
+    elapsed = time.perf_counter() - start
+    latencies = [seconds for _, _, _, seconds in results]
+    return {
+        'seconds': elapsed,
+        'statuses': Counter(status for status, _, _, _ in results),
+        'bytes': sum(size for _, size, _, _ in results),
+        'latencies': latencies
+    }
+
+
+def report(label: str, summary: dict, requests: int) -> None:
+    latencies = summary['latencies']
+    statuses = ', '.join(f"{status} x{count}" for status, count in sorted(summary['statuses'].items()))
+    print(f"{label}: {requests / summary['seconds']:,.1f} req/s, {summary['bytes'] / summary['seconds'] / 1e6:,.1f} MB/s "
+          f"[{statuses}]")
+    print(f"  latency mean {statistics.mean(latencies) * 1000:.1f}ms, p50 {percentile(latencies, 0.5) * 1000:.1f}ms, "
+          f"p95 {percentile(latencies, 0.95) * 1000:.1f}ms, p99 {percentile(latencies, 0.99) * 1000:.1f}ms, "
+          f"max {max(latencies) * 1000:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test the local chart server')
+    parser.add_argument(
+        '--url',
+        help='Base URL of a running server (default: start one with --serve)',
+        default=None
+    )
+    parser.add_argument(
+        '--serve',
+        help='Start `main.py serve` on this directory or file for the test (default: data)',
+        default='data'
+    )
+    parser.add_argument(
+        '--input',
+        help='Input path under the server root to request (default: mock_three_months.csv)',
+        default='mock_three_months.csv'
+    )
+    parser.add_argument('--query', help="Extra query string, e.g. 'style=dark&priority=High'", default='')
+    parser.add_argument('--requests', help='Requests per phase (default: 500)', type=int, default=500)
+    parser.add_argument('--concurrency', help='Requests in flight (default: 16)', type=int, default=16)
+    parser.add_argument('--workers', help='Server worker threads when started here (default: 8)', type=int, default=8)
+    args = parser.parse_args()
+
+    process = None
+    base_url = args.url
+    if base_url is None:
+        process, base_url = start_server(args.serve, args.workers)
+    url = f"{base_url.rstrip('/')}/chart?input={urllib.request.quote(args.input)}"
+    if args.query:
+        url += f"&{args.query}"
+
+    try:
+        print(f"Target: {url}")
+        status, size, etag, seconds = fetch(url, {})
+        print(f"First request (cold): {status}, {size:,} bytes in {seconds * 1000:.1f}ms")
+        if status != 200:
+            sys.exit(1)
+        print(f"{args.requests} requests per phase, {args.concurrency} in flight")
+        print()
+
+        phases = [
+            ('identity', {}),
+            ('gzip', {'Accept-Encoding': 'gzip'}),
+            ('conditional (If-None-Match)', {'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        ]
+        for label, headers in phases:
+            report(label, run(url, args.requests, args.concurrency, headers), args.requests)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
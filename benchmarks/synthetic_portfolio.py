@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Synthetic Portfolio Generator
+Writes deterministic legacy or multi-stage project CSVs of any size for benchmarking
+"""
+
+import argparse
+import csv
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional, Tuple
+
+PORTFOLIO_FORMATS = ['legacy', 'multistage']
+
+CATEGORIES = ['Infrastructure', 'Marketing Campaign', 'Product Launch', 'Research & Analysis', 'Software Development']
+PRIORITIES = ['Critical', 'High', 'Medium', 'Low']
+TEAMS = ['SRE Team', 'Content Team', 'Design Team', 'Backend Team', 'Frontend Team', 'Security Team']
+STAGE_NAMES = ['Planning', 'Analysis', 'Design', 'Development', 'Testing', 'Audit', 'Migration', 'Deployment', 'Review', 'Handover']
+
+
+def write_legacy_csv(path: Path, rows: int, seed: int = 42) -> None:
+    """Write a deterministic legacy-format CSV with the given number of rows"""
+    rng = random.Random(seed)
+    base = date(2024, 1, 1)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            'project_name', 'category', 'priority', 'preparing_start', 'preparing_end',
+            'execution_end', 'progress_percent', 'description', 'team_lead'
+        ])
+        for i in range(rows):
+            start = base + timedelta(days=rng.randint(0, 720))
+            preparing_end = start + timedelta(days=rng.randint(1, 30))
+            execution_end = preparing_end + timedelta(days=rng.randint(1, 120))
+            writer.writerow([
+                f'Project {i}', rng.choice(CATEGORIES), rng.choice(PRIORITIES),
+                start.isoformat(), preparing_end.isoformat(), execution_end.isoformat(),
+                rng.randint(0, 100), 'Synthetic benchmark project', rng.choice(TEAMS)
+            ])
+
+
+def write_multistage_csv(path: Path, rows: int, stages: int, seed: int = 42, max_stages: int = None) -> None:
+    """
+    Write a deterministic multi-stage CSV where every project has the given stage count
+
+    With max_stages, each project instead gets between stages and max_stages stages.
+    """
+    rng = random.Random(seed)
+    base = date(2024, 1, 1)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['project_name', 'category', 'priority', 'description', 'team_lead', 'stages'])
+        for i in range(rows):
+            current = base + timedelta(days=rng.randint(0, 720))
+            project_stages = []
+            stage_count = rng.randint(stages, max_stages) if max_stages else stages
+            for stage_idx in range(stage_count):
+                end = current + timedelta(days=rng.randint(1, 30))
+                project_stages.append({
+                    'name': STAGE_NAMES[stage_idx % len(STAGE_NAMES)],
+                    'start': current.isoformat(),
+                    'end': end.isoformat(),
+                    'progress': rng.randint(0, 100),
+                    'status': rng.choice(['normal', 'normal', 'warning', 'delayed'])
+                })
+                current = end
+            writer.writerow([
+                f'Project {i}', rng.choice(CATEGORIES), rng.choice(PRIORITIES),
+                'Synthetic benchmark project', rng.choice(TEAMS), json.dumps(project_stages)
+            ])
+
+
+def parse_stages(spec: str) -> Tuple[int, Optional[int]]:
+    """Parse a stage count ('6') or an inclusive per-project range ('2-10')"""
+    low, _, high = spec.partition('-')
+    stages, max_stages = int(low), int(high) if high else None
+    if stages < 1 or (max_stages is not None and max_stages < stages):
+        raise ValueError(f"Invalid stage count '{spec}'")
+    return stages, max_stages
+
+
+def portfolio_name(portfolio_format: str, rows: int, stages: str = '6', seed: int = 42) -> str:
+    """File name identifying one generated portfolio, so generated files can be reused"""
+    if portfolio_format == 'legacy':
+        return f"legacy_{rows}_seed{seed}.csv"
+    return f"multistage_{stages}_{rows}_seed{seed}.csv"
+
+
+def write_portfolio_csv(path: Path, portfolio_format: str, rows: int, stages: str = '6', seed: int = 42) -> None:
+    """
+    Write a deterministic portfolio CSV
+
+    The same arguments always produce the same bytes. stages is ignored for the
+    legacy format, whose projects always have a Preparing and an Execution stage.
+    """
+    if portfolio_format not in PORTFOLIO_FORMATS:
+        raise ValueError(f"Unknown portfolio format '{portfolio_format}'. Must be one of {PORTFOLIO_FORMATS}")
+    if portfolio_format == 'legacy':
+        write_legacy_csv(path, rows, seed)
+    else:
+        stage_count, max_stages = parse_stages(stages)
+        write_multistage_csv(path, rows, stage_count, seed, max_stages)
+
+
+def ensure_portfolio(data_dir: Path, portfolio_format: str, rows: int, stages: str = '6', seed: int = 42) -> Path:
+    """Path of the portfolio CSV in data_dir, generating it unless it is already there"""
+    path = Path(data_dir) / portfolio_name(portfolio_format, rows, stages, seed)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write under a temporary name so an interrupted run never leaves a truncated portfolio
+        partial_path = path.with_suffix('.partial')
+        write_portfolio_csv(partial_path, portfolio_format, rows, stages, seed)
+        partial_path.replace(path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a deterministic synthetic project portfolio CSV')
+    parser.add_argument('output', help='Path of the CSV file to write')
+    parser.add_argument(
+        '--format',
+        help='Portfolio format (default: multistage)',
+        choices=PORTFOLIO_FORMATS,
+        default='multistage'
+    )
+    parser.add_argument('--rows', help='Number of projects (default: 1000)', type=int, default=1000)
+    parser.add_argument(
+        '--stages',
+        help="Stages per multi-stage project, or a per-project range such as '2-10' (default: 6)",
+        default='6'
+    )
+    parser.add_argument('--seed', help='Random seed (default: 42)', type=int, default=42)
+    args = parser.parse_args()
+
+    try:
+        write_portfolio_csv(Path(args.output), args.format, args.rows, args.stages, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Wrote {args.rows} {args.format} projects to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
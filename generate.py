@@ -2,13 +2,22 @@
 """
 Quick Gantt Chart Generator
 Generates to the same output file each time for easy iteration
+
+Usage:
+  python generate.py [csv_file] [--standalone | --frappe] [--watch]
+
+With --watch the script keeps running and regenerates the chart on every save
+of the CSV file, reprocessing only the rows that changed.
 """
 
+import logging
 import sys
 from pathlib import Path
-from src.gantt_generator import GanttChartGenerator
+from src.gantt_generator import STYLES, GanttChartGenerator
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     # Default settings - try mock data first, fallback to extended data
     if Path("data/mock_three_months.csv").exists():
         csv_file = "data/mock_three_months.csv"  # Use fresh mock data by default
@@ -20,16 +29,21 @@ def main():
     style = "default"
     
     # Check for command line arguments
-    if len(sys.argv) > 1:
-        csv_file = sys.argv[1]
+    args = sys.argv[1:]
+    watch = "--watch" in args
+    if watch:
+        args.remove("--watch")
     
-    if len(sys.argv) > 2:
-        if sys.argv[2] == "--standalone":
+    if len(args) > 0:
+        csv_file = args[0]
+    
+    if len(args) > 1:
+        if args[1] == "--standalone":
             standalone = True
-            output_file = "output/gantt_chart_standalone.html"
-        elif sys.argv[2] == "--frappe":
+            output_file = f"output/{STYLES['standalone']['output']}"
+        elif args[1] == "--frappe":
             style = "frappe"
-            output_file = "output/gantt_chart_frappe.html"
+            output_file = f"output/{STYLES['frappe']['output']}"
     
     # Validate input file
     csv_path = Path(csv_file)
@@ -51,6 +65,13 @@ def main():
         style_text = f" ({style} style)" if style != "default" else ""
         print(f"Generating Gantt chart{style_text} from {csv_file}...")
         generator = GanttChartGenerator(standalone=standalone, style=style)
+        
+        if watch:
+            # Watch mode reprocesses rows with pandas; only import it when needed
+            from src.watch import watch_chart
+            watch_chart(str(csv_path), str(output_path), generator)
+            return
+        
         generator.generate_chart(str(csv_path), str(output_path))
         
         print(f"\nSuccess! Chart saved to: {output_path}")
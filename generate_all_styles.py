@@ -5,9 +5,30 @@ Creates all 6 design variants from a single CSV input file
 """
 
 import sys
+import time
 import argparse
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from src.gantt_generator import GanttChartGenerator
+from src.gantt_generator import (
+    GALLERY_STYLES, RENDERERS, STYLES, GanttChartGenerator, build_template_context, load_project_data,
+    select_renderer
+)
+from src.bundler import BUNDLE_MODES
+from src.cache import ProcessedDataCache
+from src.metrics import PipelineMetrics, profiled
+from src.payload import PAYLOAD_FORMATS
+
+
+def render_style(style_name: str, context: dict, output_path: str, use_cache: bool = True,
+                 bundle: str = 'hashed', trace_memory: bool = False) -> tuple:
+    """Render one style from the shared template context; returns (output path, seconds, written, metrics)"""
+    start = time.perf_counter()
+    metrics = PipelineMetrics(trace_memory=trace_memory)
+    generator = GanttChartGenerator(style=style_name, use_cache=use_cache, bundle=bundle, metrics=metrics)
+    output_file = generator.render_to_file(context, output_path)
+    return output_file, time.perf_counter() - start, not generator.last_write_skipped, metrics.to_dict()
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -16,6 +37,10 @@ def main():
         epilog="""
 Example:
   python generate_all_styles.py data/sample_projects.csv
+  python generate_all_styles.py data/large_portfolio.csv --workers 3 --processes
+  python generate_all_styles.py data/sample_projects.csv --no-cache
+  python generate_all_styles.py data/sample_projects.csv --bundle inline
+  python generate_all_styles.py data/large_portfolio.csv --profile --metrics-json output/metrics.json
   
 Output Files:
   - output/1_default_design.html
@@ -24,6 +49,7 @@ Output Files:
   - output/4_colorful_design.html
   - output/5_interactive_design.html
   - output/6_frappe_design.html
+  - output/assets/cqss-bundle.<hash>.min.js (shared by all six)
         """
     )
     
@@ -44,7 +70,72 @@ Output Files:
         action='store_true'
     )
     
+    parser.add_argument(
+        '--payload',
+        help='Embedded data format: json (default), compact or compact-gzip',
+        choices=PAYLOAD_FORMATS,
+        default='json'
+    )
+    
+    parser.add_argument(
+        '--renderer',
+        help='Chart renderer: auto (default; canvas for very large charts), svg or canvas',
+        choices=RENDERERS,
+        default='auto'
+    )
+    
+    parser.add_argument(
+        '--rollups',
+        help='Embed per-category and per-team summary bars for the grouped, zoomed-out view (default style)',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        help='Number of styles rendered concurrently (default: one per style)',
+        type=int,
+        default=len(GALLERY_STYLES)
+    )
+    
+    parser.add_argument(
+        '--processes',
+        help='Render on a process pool instead of a thread pool',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--bundle',
+        help='Shared scripts: hashed (default; one file cached across all styles) or inline (self-contained pages)',
+        choices=BUNDLE_MODES,
+        default='hashed'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        help='Always reprocess the CSV and rewrite every output, ignoring the build cache',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        help='Print the time and memory peak of every phase (tracing allocations slows generation down)',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--metrics-json',
+        help='Write per-phase timings, row and stage counts and bytes of every style to this JSON file',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--cprofile',
+        help='Write cProfile statistics of the main thread to this file (view with python -m pstats)',
+        default=None
+    )
+    
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     
     # Validate input file
     csv_path = Path(args.csv_file)
@@ -58,12 +149,8 @@ Output Files:
     
     # Define style configurations
     styles = [
-        {'name': 'default', 'output': '1_default_design.html', 'title': 'Default Design'},
-        {'name': 'minimal', 'output': '2_minimal_design.html', 'title': 'Minimal Design'},
-        {'name': 'dark', 'output': '3_dark_design.html', 'title': 'Dark Design'},
-        {'name': 'colorful', 'output': '4_colorful_design.html', 'title': 'Colorful Design'},
-        {'name': 'interactive', 'output': '5_interactive_design.html', 'title': 'Interactive Design'},
-        {'name': 'frappe', 'output': '6_frappe_design.html', 'title': 'Frappe Design'}
+        {'name': name, 'output': STYLES[name]['gallery_output'], 'title': STYLES[name]['title']}
+        for name in GALLERY_STYLES
     ]
     
     print(f"Generating all 6 Gantt chart styles from {csv_path}...")
@@ -71,23 +158,60 @@ Output Files:
     print()
     
     generated_files = []
+    failed_styles = []
+    
+    metrics = PipelineMetrics(trace_memory=args.profile)
     
     try:
-        for style_config in styles:
-            style_name = style_config['name']
-            output_filename = style_config['output']
-            style_title = style_config['title']
-            
-            output_path = output_dir / output_filename
-            
-            print(f"  Generating {style_title} ({style_name})...")
-            
-            # Create generator for this style
-            generator = GanttChartGenerator(style=style_name)
-            generator.generate_chart(str(csv_path), str(output_path))
-            
-            generated_files.append(output_path)
-            print(f"    OK {output_path}")
+        # Load and process the data once for all styles
+        start = time.perf_counter()
+        cache = None if args.no_cache else ProcessedDataCache()
+        with profiled(args.cprofile):
+            dataset, date_range = load_project_data(str(csv_path), cache, metrics)
+            renderer = select_renderer(len(dataset), dataset.stage_count, args.renderer)
+            with metrics.phase('serialize'):
+                context = build_template_context(dataset, date_range, args.payload, renderer, args.rollups)
+        cache_text = "" if cache is None else f" (cache {'hit' if cache.hits else 'miss'})"
+        print(f"  Processed {len(dataset)} projects in {time.perf_counter() - start:.2f}s{cache_text}")
+        if renderer == 'canvas':
+            print(f"  Using canvas renderer ({len(dataset)} projects, {dataset.stage_count} stages)")
+        print(f"  Rendering {len(styles)} styles with {args.workers} {'process' if args.processes else 'thread'} worker(s)...")
+        
+        executor_class = ProcessPoolExecutor if args.processes else ThreadPoolExecutor
+        with executor_class(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(render_style, style_config['name'], context, str(output_dir / style_config['output']),
+                                not args.no_cache, args.bundle, args.profile): style_config
+                for style_config in styles
+            }
+            for future in as_completed(futures):
+                style_config = futures[future]
+                try:
+                    output_path, elapsed, written, style_metrics = future.result()
+                except Exception as style_error:
+                    failed_styles.append(style_config['name'])
+                    print(f"    FAILED {style_config['title']} ({style_config['name']}): {style_error}")
+                    continue
+                generated_files.append(output_path)
+                metrics.add_child(style_config['name'], style_metrics)
+                unchanged_text = "" if written else " (unchanged)"
+                print(f"    OK {style_config['title']} ({style_config['name']}) {output_path} [{elapsed:.2f}s]{unchanged_text}")
+        
+        # Keep the gallery order in the summary regardless of completion order
+        generated_files.sort()
+        
+        if args.profile:
+            print(f"\nShared phases:\n{metrics.summary()}")
+            for style_config in styles:
+                style_metrics = metrics.children.get(style_config['name'])
+                if style_metrics:
+                    phases = ', '.join(f"{name} {totals['seconds']:.3f}s" for name, totals in style_metrics['phases'].items())
+                    print(f"  {style_config['name']}: {phases}")
+        if args.metrics_json:
+            metrics.write_json(args.metrics_json)
+            print(f"Metrics written to {args.metrics_json}")
+        if args.cprofile:
+            print(f"Profile written to {args.cprofile}")
         
         print()
         print(f"Success! Generated {len(generated_files)} Gantt chart files:")
@@ -110,6 +234,10 @@ Output Files:
     except Exception as e:
         print(f"Error: {str(e)}")
         sys.exit(1)
+    
+    if failed_styles:
+        print(f"\nError: {len(failed_styles)} style(s) failed: {', '.join(failed_styles)}")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Batch Gantt Chart Generator
+Generates one chart per CSV file for a whole directory, glob or manifest of inputs
+
+Files are processed on a pool of worker processes. Each worker imports pandas
+and compiles the template once and then handles many files, so the per-file
+cost is only reading, processing and rendering.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from src.bundler import BUNDLE_MODES
+from src.cache import ProcessedDataCache
+from src.gantt_generator import RENDERERS, STYLES, GanttChartGenerator, load_project_data
+from src.payload import PAYLOAD_FORMATS
+
+# Generators and caches reused by every file a worker process handles
+_worker_generators = {}
+_worker_cache = None
+
+
+def generate_one(csv_file: str, output_file: str, style: str, payload_format: str, use_cache: bool,
+                 renderer: str = 'auto', rollups: bool = False, bundle: str = 'hashed') -> dict:
+    """Generate one chart in a worker process; failures are returned, not raised"""
+    global _worker_cache
+    start = time.perf_counter()
+    try:
+        generator_key = (style, payload_format, use_cache, renderer, rollups, bundle)
+        generator = _worker_generators.get(generator_key)
+        if generator is None:
+            generator = GanttChartGenerator(style=style, payload_format=payload_format, use_cache=use_cache,
+                                            renderer=renderer, rollups=rollups, bundle=bundle)
+            _worker_generators[generator_key] = generator
+        if use_cache and _worker_cache is None:
+            _worker_cache = ProcessedDataCache()
+
+        dataset, date_range = load_project_data(csv_file, _worker_cache if use_cache else None)
+        generator.write_file(dataset, date_range, output_file)
+        return {
+            'csv_file': csv_file,
+            'output_file': output_file,
+            'projects': len(dataset),
+            'seconds': time.perf_counter() - start,
+            'written': not generator.last_write_skipped,
+            'error': None
+        }
+    except Exception as e:
+        return {
+            'csv_file': csv_file,
+            'output_file': output_file,
+            'projects': 0,
+            'seconds': time.perf_counter() - start,
+            'written': False,
+            'error': str(e)
+        }
+
+
+def collect_inputs(inputs: list, manifest: str = None, recursive: bool = False) -> list:
+    """
+    Expand directories, glob patterns and a manifest into (csv path, output name or None) pairs
+
+    Manifest lines hold a CSV path, optionally followed by a tab and an output
+    path; blank lines and lines starting with # are ignored.
+    """
+    jobs = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            pattern = '**/*.csv' if recursive else '*.csv'
+            jobs.extend((csv_path, csv_path.relative_to(path).with_suffix('.html')) for csv_path in sorted(path.glob(pattern)))
+        elif glob.has_magic(item):
+            jobs.extend((Path(match), None) for match in sorted(glob.glob(item, recursive=recursive)))
+        else:
+            jobs.append((path, None))
+
+    if manifest:
+        with open(manifest, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                csv_file, _, output_file = line.partition('\t')
+                jobs.append((Path(csv_file.strip()), Path(output_file.strip()) if output_file.strip() else None))
+    return jobs
+
+
+def plan_outputs(jobs: list, output_dir: Path) -> list:
+    """Assign each input an output path, de-duplicating names that would collide"""
+    planned = []
+    used = set()
+    for csv_path, output_name in jobs:
+        output_file = Path(output_name) if output_name else Path(csv_path.stem + '.html')
+        if not output_file.is_absolute():
+            output_file = output_dir / output_file
+        candidate, counter = output_file, 2
+        while candidate in used:
+            candidate = output_file.with_name(f"{output_file.stem}_{counter}{output_file.suffix}")
+            counter += 1
+        used.add(candidate)
+        planned.append((str(csv_path), str(candidate)))
+    return planned
+
+
+def print_progress(done: int, total: int, failed: int, elapsed: float, interactive: bool) -> None:
+    """Show a single updating progress line (or periodic lines when not attached to a terminal)"""
+    rate = done / elapsed if elapsed > 0 else 0.0
+    line = f"[{done:>{len(str(total))}}/{total}] {done / total:6.1%}  {rate:6.1f} files/s  failed {failed}"
+    if interactive:
+        print(f"\r{line}", end='' if done < total else '\n', flush=True)
+    elif done == total or done % max(1, total // 20) == 0:
+        print(line, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate one Gantt chart per CSV file using a pool of worker processes',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python generate_batch.py data/teams/
+  python generate_batch.py "data/programs/*.csv" --style minimal --workers 8
+  python generate_batch.py data/ --recursive --output-dir output/nightly
+  python generate_batch.py --manifest nightly.txt --payload compact-gzip
+
+Manifest Format:
+  One CSV path per line, optionally followed by a tab and an output path.
+  Blank lines and lines starting with # are ignored.
+        """
+    )
+    
+    parser.add_argument(
+        'inputs',
+        help='CSV files, directories of CSV files or glob patterns',
+        nargs='*'
+    )
+    
+    parser.add_argument(
+        '--manifest',
+        help='Text file listing CSV inputs (and optional output paths)',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--recursive',
+        help='Search directories and ** glob patterns recursively',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--output-dir',
+        help='Output directory (default: output/batch)',
+        default='output/batch'
+    )
+    
+    parser.add_argument(
+        '--style',
+        help='Gantt chart style for every file (default: default)',
+        choices=list(STYLES),
+        default='default'
+    )
+    
+    parser.add_argument(
+        '--payload',
+        help='Embedded data format: json (default), compact or compact-gzip',
+        choices=PAYLOAD_FORMATS,
+        default='json'
+    )
+    
+    parser.add_argument(
+        '--renderer',
+        help='Chart renderer: auto (default; canvas for very large charts), svg or canvas',
+        choices=RENDERERS,
+        default='auto'
+    )
+    
+    parser.add_argument(
+        '--rollups',
+        help='Embed per-category and per-team summary bars for the grouped, zoomed-out view (default style)',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        help='Number of worker processes (default: number of CPUs)',
+        type=int,
+        default=os.cpu_count() or 1
+    )
+    
+    parser.add_argument(
+        '--queue-size',
+        help='Maximum files queued or in progress at once (default: 2 per worker)',
+        type=int,
+        default=None
+    )
+    
+    parser.add_argument(
+        '--bundle',
+        help='Shared scripts: hashed (default; one cached file per output directory) or inline (self-contained pages)',
+        choices=BUNDLE_MODES,
+        default='hashed'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        help='Always reprocess every CSV and rewrite every output, ignoring the build cache',
+        action='store_true'
+    )
+    
+    args = parser.parse_args()
+    
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    queue_size = args.queue_size if args.queue_size is not None else args.workers * 2
+    if queue_size < 1:
+        parser.error('--queue-size must be at least 1')
+    
+    jobs = collect_inputs(args.inputs, args.manifest, args.recursive)
+    if not jobs:
+        print("Error: No CSV files found")
+        sys.exit(1)
+    
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    planned = plan_outputs(jobs, output_dir)
+    
+    print(f"Generating {len(planned)} Gantt charts ({args.style} style) with {args.workers} worker process(es)...")
+    print(f"Output directory: {output_dir}")
+    print()
+    
+    interactive = sys.stdout.isatty()
+    results = []
+    failed = 0
+    start = time.perf_counter()
+    
+    # Submit lazily so at most queue_size files are pending; memory stays flat for long input lists
+    pending_jobs = iter(planned)
+    in_flight = set()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        while True:
+            while len(in_flight) < queue_size:
+                job = next(pending_jobs, None)
+                if job is None:
+                    break
+                csv_file, output_file = job
+                in_flight.add(executor.submit(generate_one, csv_file, output_file, args.style, args.payload,
+                                              not args.no_cache, args.renderer, args.rollups, args.bundle))
+            if not in_flight:
+                break
+    
+            completed, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in completed:
+                result = future.result()
+                results.append(result)
+                if result['error']:
+                    failed += 1
+                    if interactive:
+                        print()
+                    print(f"    FAILED {result['csv_file']}: {result['error']}")
+                print_progress(len(results), len(planned), failed, time.perf_counter() - start, interactive)
+    
+    wall_time = time.perf_counter() - start
+    
+    # Per-file summary in input order
+    input_order = {output_file: index for index, (_, output_file) in enumerate(planned)}
+    results.sort(key=lambda result: input_order[result['output_file']])
+    print()
+    print("Results:")
+    for result in results:
+        if result['error']:
+            print(f"  FAILED {result['csv_file']} [{result['seconds']:.2f}s]: {result['error']}")
+            continue
+        rate = result['projects'] / result['seconds'] if result['seconds'] > 0 else 0.0
+        unchanged_text = "" if result['written'] else " (unchanged)"
+        print(f"  OK {result['csv_file']} -> {result['output_file']}: {result['projects']} projects "
+              f"[{result['seconds']:.2f}s, {rate:,.0f} projects/s]{unchanged_text}")
+    
+    succeeded = len(results) - failed
+    total_projects = sum(result['projects'] for result in results)
+    print()
+    print(f"Generated {succeeded} of {len(results)} charts in {wall_time:.2f}s "
+          f"({len(results) / wall_time:.1f} files/s, {total_projects / wall_time:,.0f} projects/s)")
+    
+    if failed:
+        print(f"\nError: {failed} file(s) failed")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,117 @@
 #!/usr/bin/env python3
 """
 CQSS Gantt Chart Generator
-Main entry point for generating Gantt charts from CSV project data
+Main entry point for generating Gantt charts from CSV project data, or serving
+them from a local HTTP server with `python main.py serve`
 """
 
 import argparse
+import logging
 import sys
 from pathlib import Path
-from src.gantt_generator import GanttChartGenerator
+from src.bundler import BUNDLE_MODES
+from src.gantt_generator import ENGINES, RENDERERS, STYLES, GanttChartGenerator, resolve_style
+from src.input_formats import INPUT_FORMATS
+from src.metrics import PipelineMetrics, profiled
+from src.payload import PAYLOAD_FORMATS
+
+def serve_main(argv):
+    """Run the chart server: python main.py serve [root] [options]"""
+    parser = argparse.ArgumentParser(
+        prog='main.py serve',
+        description='Serve Gantt charts of every input file under a directory from a local HTTP server',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python main.py serve
+  python main.py serve data --port 8080 --workers 16
+  python main.py serve data/large_portfolio.csv
+
+Charts are served at /chart?input=<path under root>; add style, payload, renderer
+and rollups=1 like the CLI options, and category, priority, team_lead or status
+(repeatable) to filter projects. / lists every input.
+        """
+    )
+    
+    parser.add_argument(
+        'root',
+        help='Directory of CSV, Parquet or Feather files, or a single file (default: data)',
+        nargs='?',
+        default='data'
+    )
+    
+    parser.add_argument(
+        '--host',
+        help='Interface to listen on (default: 127.0.0.1)',
+        default='127.0.0.1'
+    )
+    
+    parser.add_argument(
+        '--port',
+        help='Port to listen on (default: 8000)',
+        type=int,
+        default=8000
+    )
+    
+    parser.add_argument(
+        '--workers',
+        help='Threads handling requests (default: 8)',
+        type=int,
+        default=8
+    )
+    
+    parser.add_argument(
+        '--data-entries',
+        help='Processed inputs kept in memory (default: 8)',
+        type=int,
+        default=8
+    )
+    
+    parser.add_argument(
+        '--page-entries',
+        help='Rendered pages kept in memory (default: 64)',
+        type=int,
+        default=64
+    )
+    
+    parser.add_argument(
+        '--input-format',
+        help='Input file format: auto (default; by extension), csv, arrow-csv, parquet or feather',
+        choices=INPUT_FORMATS,
+        default='auto'
+    )
+    
+    parser.add_argument(
+        '--engine',
+        help='CSV reader: auto (default), stdlib or pandas',
+        choices=ENGINES,
+        default='auto'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        help='Do not use the on-disk processed-data cache (the in-memory caches are always on)',
+        action='store_true'
+    )
+    
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
+    # The server pulls in http.server and the request handling; only import it when serving
+    from src.server import serve
+    try:
+        serve(args.root, host=args.host, port=args.port, workers=args.workers,
+              data_entries=args.data_entries, page_entries=args.page_entries,
+              engine=args.engine, input_format=args.input_format, use_cache=not args.no_cache)
+    except (OSError, ValueError) as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        serve_main(sys.argv[2:])
+        return
+    
     parser = argparse.ArgumentParser(
         description='Generate static HTML Gantt chart from CSV project data',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -22,6 +124,16 @@ Examples:
   python main.py data/sample_projects.csv --style dark --open
   python main.py data/sample_projects.csv --style colorful --open
   python main.py data/sample_projects.csv --style interactive --open
+  python main.py data/large_portfolio.csv --chunk-size 50000
+  python main.py data/large_portfolio.csv --payload compact-gzip
+  python main.py data/large_portfolio.csv --renderer canvas
+  python main.py data/multi_year_portfolio.csv --rollups
+  python main.py data/sample_projects.csv --no-cache
+  python main.py data/sample_projects.csv output/site/chart.html --bundle hashed
+  python main.py data/large_portfolio.csv --profile --metrics-json output/metrics.json
+  python main.py data/sample_projects.parquet
+  python main.py data/projects.csv --stages data/stages.csv
+  python main.py serve data --port 8000   (see python main.py serve --help)
 
 Available Styles:
   default     - Classic Gantt chart design
@@ -35,7 +147,7 @@ Available Styles:
     
     parser.add_argument(
         'csv_file',
-        help='Path to CSV file containing project data'
+        help='Path to CSV, Parquet or Feather file containing project data'
     )
     
     parser.add_argument(
@@ -60,7 +172,7 @@ Available Styles:
     parser.add_argument(
         '--style',
         help='Gantt chart style (default, frappe, minimal, dark, colorful, interactive)',
-        choices=['default', 'frappe', 'minimal', 'dark', 'colorful', 'interactive'],
+        choices=[name for name in STYLES if name != 'standalone'],
         default='default'
     )
     
@@ -70,30 +182,99 @@ Available Styles:
         action='store_true'
     )
     
+    parser.add_argument(
+        '--payload',
+        help='Embedded data format: json (default), compact (columnar, dictionary-encoded) or compact-gzip',
+        choices=PAYLOAD_FORMATS,
+        default='json'
+    )
+    
+    parser.add_argument(
+        '--renderer',
+        help='Chart renderer: auto (default; canvas for very large charts), svg or canvas',
+        choices=RENDERERS,
+        default='auto'
+    )
+    
+    parser.add_argument(
+        '--rollups',
+        help='Embed per-category and per-team summary bars for the grouped, zoomed-out view (default style)',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--chunk-size',
+        help='Stream the CSV in chunks of N rows to keep memory bounded for very large files',
+        type=int,
+        default=None
+    )
+    
+    parser.add_argument(
+        '--bundle',
+        help='Shared scripts: inline (default; self-contained page) or hashed (one cached file per output directory)',
+        choices=BUNDLE_MODES,
+        default='inline'
+    )
+    
+    parser.add_argument(
+        '--input-format',
+        help='Input file format: auto (default; by extension), csv, arrow-csv (CSV parsed by pyarrow), parquet or feather',
+        choices=INPUT_FORMATS,
+        default='auto'
+    )
+    
+    parser.add_argument(
+        '--stages',
+        help='Stages table (one row per stage, keyed by project_id) for a normalized projects table in csv_file',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--engine',
+        help='CSV reader: auto (default; standard library for small files, pandas otherwise), stdlib or pandas',
+        choices=ENGINES,
+        default='auto'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        help='Always reprocess the CSV and rewrite the output, ignoring the build cache',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        help='Print the time and memory peak of every phase (tracing allocations slows generation down)',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--metrics-json',
+        help='Write per-phase timings, row and stage counts and output bytes to this JSON file',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--cprofile',
+        help='Write cProfile statistics of the run to this file (view with python -m pstats)',
+        default=None
+    )
+    
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     
     # Validate input file
     csv_path = Path(args.csv_file)
     if not csv_path.exists():
-        print(f"Error: CSV file not found: {csv_path}")
+        print(f"Error: Input file not found: {csv_path}")
+        sys.exit(1)
+    if args.stages is not None and not Path(args.stages).exists():
+        print(f"Error: Stages file not found: {args.stages}")
         sys.exit(1)
     
     # Set default output file if not provided
     if args.output_file is None:
-        if args.style == 'frappe':
-            default_output = 'output/gantt_chart_frappe.html'
-        elif args.style == 'minimal':
-            default_output = 'output/gantt_chart_minimal.html'
-        elif args.style == 'dark':
-            default_output = 'output/gantt_chart_dark.html'
-        elif args.style == 'colorful':
-            default_output = 'output/gantt_chart_colorful.html'
-        elif args.style == 'interactive':
-            default_output = 'output/gantt_chart_interactive.html'
-        elif args.standalone:
-            default_output = 'output/gantt_chart_standalone.html'
-        else:
-            default_output = 'output/gantt_chart.html'
+        default_output = f"output/{STYLES[resolve_style(args.style, args.standalone)]['output']}"
         args.output_file = default_output
     
     # Create output directory if needed
@@ -102,8 +283,22 @@ Available Styles:
     
     try:
         # Generate Gantt chart
-        generator = GanttChartGenerator(template_path=args.template, standalone=args.standalone, style=args.style)
-        generator.generate_chart(str(csv_path), str(output_path))
+        metrics = PipelineMetrics(trace_memory=args.profile)
+        generator = GanttChartGenerator(template_path=args.template, standalone=args.standalone, style=args.style,
+                                        payload_format=args.payload, use_cache=not args.no_cache,
+                                        renderer=args.renderer, rollups=args.rollups, bundle=args.bundle,
+                                        metrics=metrics, engine=args.engine, input_format=args.input_format)
+        with profiled(args.cprofile):
+            generator.generate_chart(str(csv_path), str(output_path), chunk_size=args.chunk_size,
+                                     stages_file=args.stages)
+        
+        if args.profile:
+            print(f"\nPhase breakdown:\n{metrics.summary()}")
+        if args.metrics_json:
+            metrics.write_json(args.metrics_json)
+            print(f"Metrics written to {args.metrics_json}")
+        if args.cprofile:
+            print(f"Profile written to {args.cprofile}")
         
         print(f"\nSuccess! Open {output_path} in your web browser to view the Gantt chart.")
         
@@ -0,0 +1,233 @@
+"""
+Bundling of the shared scripts every chart page needs
+
+Pages used to fetch config.js and d3-loader.js, which then injected D3 with
+timeouts and retries, plus the component library through a path relative to
+the output directory. The bundle is one script instead: D3, a loader stand-in
+that resolves at once (templates/shared/d3-ready.js) and the minified
+component library (templates/shared/d3-common.js). It is either inlined into
+the page, which then works from anywhere on its own, or written once per output
+directory under a content-hashed name, so the browser caches one copy for every
+chart next to it and a changed bundle never hits a stale cache.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+from .cache import AtomicFile
+
+BUNDLE_MODES = ['inline', 'hashed']
+
+STATIC_DIR = Path(__file__).parent.parent / 'static' / 'js'
+SHARED_DIR = Path(__file__).parent.parent / 'templates' / 'shared'
+
+# Bundle contents in load order, and whether each file still needs minifying
+BUNDLE_FILES = [
+    (STATIC_DIR / 'd3.v7.min.js', False),
+    (SHARED_DIR / 'd3-ready.js', True),
+    (SHARED_DIR / 'd3-common.js', True)
+]
+
+# Hashed bundles are written to this subdirectory of the output directory
+ASSETS_DIRNAME = 'assets'
+
+# Characters after which a '/' starts a regular expression rather than a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw', 'case', 'do', 'else'}
+# Whitespace around these can go without changing how the code tokenizes
+_TIGHT = re.compile(r'[ \t]*([{}()\[\];,:=])[ \t]*')
+_LINE_BREAKS = re.compile(r'[ \t]*\n\s*')
+_SPACES = re.compile(r'[ \t]+')
+# Line breaks made redundant by a following closing or preceding opening bracket, comma or semicolon
+_REDUNDANT_BREAKS = re.compile(r'\n(?=[}\])])|(?<=[{(\[,;])\n')
+_SCRIPT_END = re.compile(r'</(script)', re.IGNORECASE)
+
+
+def _literal_end(source: str, start: int) -> int:
+    """Index just past the string, template or regex literal starting at start"""
+    quote = source[start]
+    i = start + 1
+    in_class = False
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+            continue
+        if quote == '`' and source.startswith('${', i):
+            # Skip the embedded expression, which may hold literals of its own
+            i = _code_end(source, i + 2)
+            continue
+        if quote == '/':
+            if char == '[':
+                in_class = True
+            elif char == ']':
+                in_class = False
+            elif char == '/' and not in_class:
+                i += 1
+                while i < len(source) and (source[i].isalnum() or source[i] == '_'):
+                    i += 1
+                return i
+        elif char == quote:
+            return i + 1
+        i += 1
+    raise ValueError(f"Unterminated literal at offset {start}")
+
+
+def _code_end(source: str, start: int) -> int:
+    """Index just past the closing brace of a template literal expression"""
+    depth = 0
+    i = start
+    while i < len(source):
+        char = source[i]
+        if char in '\'"`':
+            i = _literal_end(source, i)
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            if depth == 0:
+                return i + 1
+            depth -= 1
+        i += 1
+    raise ValueError(f"Unterminated template expression at offset {start}")
+
+
+def _compact(code: str) -> str:
+    """Collapse the whitespace of a code segment (no literals or comments)"""
+    code = _LINE_BREAKS.sub('\n', code)
+    code = _SPACES.sub(' ', code)
+    code = _TIGHT.sub(r'\1', code).replace('=> ', '=>')
+    return _REDUNDANT_BREAKS.sub('', code)
+
+
+def minify_js(source: str) -> str:
+    """
+    Strip comments and redundant whitespace from JavaScript
+
+    A conservative minifier: literals are copied verbatim and line breaks are
+    kept (collapsed to one), so automatic semicolon insertion sees the same
+    statements. Names are not mangled.
+    """
+    output = []
+    code_start = 0
+    last_significant = ''
+    last_word = ''
+    i = 0
+
+    def emit(code: str) -> None:
+        # Segments meet around literals and comments; keep one line break between them at most
+        previous = output[-1] if output else '\n'
+        if code.startswith('\n') and (previous.endswith('\n') or previous[-1:] in '{([,;'):
+            code = code.lstrip('\n')
+        if code:
+            output.append(code)
+
+    def flush(end: int) -> None:
+        emit(_compact(source[code_start:end]))
+
+    while i < len(source):
+        char = source[i]
+        if char == '/' and source.startswith('//', i):
+            flush(i)
+            i = source.find('\n', i)
+            i = len(source) if i < 0 else i
+            code_start = i
+            continue
+        if char == '/' and source.startswith('/*', i):
+            flush(i)
+            end = source.find('*/', i + 2)
+            if end < 0:
+                raise ValueError(f"Unterminated comment at offset {i}")
+            # A comment containing a line break still separates statements
+            emit('\n' if '\n' in source[i:end] else ' ')
+            i = code_start = end + 2
+            continue
+        if char in '\'"`' or (char == '/' and (last_significant in _REGEX_PRECEDERS or last_word in _REGEX_KEYWORDS
+                                               or not last_significant)):
+            flush(i)
+            end = _literal_end(source, i)
+            output.append(source[i:end])
+            i = code_start = end
+            last_significant = 'a'
+            last_word = ''
+            continue
+        if not char.isspace():
+            if char.isalnum() or char in '_$':
+                word_end = i
+                while word_end < len(source) and (source[word_end].isalnum() or source[word_end] in '_$'):
+                    word_end += 1
+                last_word = source[i:word_end]
+                last_significant = 'a'
+                i = word_end
+                continue
+            last_significant = char
+            last_word = ''
+        i += 1
+    flush(len(source))
+
+    return ''.join(output).strip() + '\n'
+
+
+def _bundle_stamps() -> Tuple[Tuple[str, int, int], ...]:
+    """Path, mtime and size of every bundled file, so edits are picked up by long-running processes"""
+    stamps = []
+    for path, _ in BUNDLE_FILES:
+        stat = path.stat()
+        stamps.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
+@lru_cache(maxsize=4)
+def _build_bundle(stamps: Tuple[Tuple[str, int, int], ...]) -> Tuple[str, str]:
+    """Bundle source and its content hash for one state of the bundled files"""
+    parts = []
+    for path, needs_minifying in BUNDLE_FILES:
+        source = path.read_text(encoding='utf-8')
+        parts.append(minify_js(source) if needs_minifying else source.strip() + '\n')
+    # Separate the files so a missing trailing semicolon cannot join two statements
+    bundle = ';\n'.join(parts)
+    return bundle, hashlib.sha256(bundle.encode('utf-8')).hexdigest()[:16]
+
+
+def bundle_source() -> Tuple[str, str]:
+    """The shared script bundle and its content hash"""
+    return _build_bundle(_bundle_stamps())
+
+
+def write_hashed_bundle(output_dir: Path) -> Path:
+    """
+    Write the bundle to output_dir/assets under its content-hashed name, once
+
+    An existing file with that name already holds exactly this bundle. The file
+    is written under a temporary name and renamed, so concurrent writers never
+    leave a partial bundle behind.
+    """
+    bundle, digest = bundle_source()
+    asset_path = Path(output_dir) / ASSETS_DIRNAME / f"cqss-bundle.{digest}.min.js"
+    if asset_path.exists():
+        return asset_path
+    # Created with the same permissions as the pages that load it
+    with AtomicFile(asset_path) as f:
+        f.write(bundle.encode('utf-8'))
+    return asset_path
+
+
+def render_shared_assets(mode: str, output_path: Path) -> str:
+    """
+    The script element substituted for {{ shared_assets }} in a page written to output_path
+
+    'inline' embeds the bundle; 'hashed' writes it next to the page (see
+    write_hashed_bundle()) and references it by relative URL.
+    """
+    if mode not in BUNDLE_MODES:
+        raise ValueError(f"Unknown bundle mode '{mode}'. Must be one of {BUNDLE_MODES}")
+    if mode == 'hashed':
+        asset_path = write_hashed_bundle(Path(output_path).parent)
+        return f'<script src="{ASSETS_DIRNAME}/{asset_path.name}"></script>'
+    bundle, _ = bundle_source()
+    # The bundle sits inside a <script> element
+    bundle = _SCRIPT_END.sub(r'<\\/\1', bundle)
+    return f"<script>\n{bundle}</script>"
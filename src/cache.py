@@ -0,0 +1,278 @@
+"""
+On-disk caches shared by the chart generator
+
+ProcessedDataCache stores processed projects keyed by the SHA-256 of the CSV
+content plus the processor version, so unchanged inputs skip parsing and
+processing. AtomicFile streams output into a temporary file next to the
+target and renames it into place, so readers never see a partially written
+file; it can also leave a file with identical content untouched, which avoids
+needless downstream file syncs.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import secrets
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+# Bytes read at a time while hashing input files
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Default upper bound for the processed-data cache before old entries are evicted
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Permissions of new output files before the umask applies, as for open()
+DEFAULT_FILE_MODE = 0o666
+
+# Cache entries are unpickled when read, so nobody else may read or plant them
+CACHE_FILE_MODE = 0o600
+
+logger = logging.getLogger(__name__)
+
+
+def _owned_by_current_user(stat: os.stat_result) -> bool:
+    """Whether a file or directory belongs to the current user (always true where there are no uids)"""
+    return not hasattr(os, 'getuid') or stat.st_uid == os.getuid()
+
+
+def private_dir(path: Path) -> Path:
+    """
+    Create a directory owner-only (mode 0700) unless it exists, and check its owner
+
+    Raises PermissionError when the directory belongs to another user; group and
+    other permissions are removed from one the current user owns.
+    """
+    path = Path(path)
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    stat = path.stat()
+    if not _owned_by_current_user(stat):
+        raise PermissionError(f"Cache directory {path} is owned by another user")
+    if hasattr(os, 'getuid') and stat.st_mode & 0o077:
+        os.chmod(path, 0o700)
+    return path
+
+
+def cache_root() -> Path:
+    """
+    Root directory for on-disk caches, without creating it
+
+    Uses the CQSS_CACHE_DIR environment variable when set, otherwise a cqss
+    directory in the user's cache directory: $XDG_CACHE_HOME or ~/.cache, and
+    %LOCALAPPDATA% on Windows.
+    """
+    configured = os.environ.get('CQSS_CACHE_DIR')
+    if configured:
+        return Path(configured)
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'cqss'
+
+
+def default_cache_dir() -> Path:
+    """Root directory for on-disk caches (see cache_root()), created owner-only (see private_dir())"""
+    return private_dir(cache_root())
+
+
+def default_cache_max_bytes() -> int:
+    """Cache size limit; CQSS_CACHE_MAX_MB overrides the default"""
+    configured = os.environ.get('CQSS_CACHE_MAX_MB')
+    if configured:
+        return int(float(configured) * 1024 * 1024)
+    return DEFAULT_CACHE_MAX_BYTES
+
+
+def file_digest(file_path: str) -> str:
+    """SHA-256 hex digest of a file's content"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _same_content(first: str, second: Path) -> bool:
+    """Whether two files hold the same bytes; False if either is missing"""
+    try:
+        if os.path.getsize(first) != os.path.getsize(second):
+            return False
+        with open(first, 'rb') as a, open(second, 'rb') as b:
+            while True:
+                block = a.read(HASH_BLOCK_SIZE)
+                if block != b.read(HASH_BLOCK_SIZE):
+                    return False
+                if not block:
+                    return True
+    except OSError:
+        return False
+
+
+class AtomicFile:
+    """
+    Binary file written under a temporary name and renamed over output_path on success
+
+    Use as a context manager; the temporary file sits in the target directory so
+    the rename is atomic. If the block raises, the target is left untouched. With
+    skip_unchanged, an existing file with exactly the same content is kept as is
+    and the temporary file discarded; replaced records which happened. By default
+    a replaced file keeps its permissions and a new one gets 0666 less the umask,
+    as with open(); an explicit mode is applied exactly.
+    """
+
+    def __init__(self, output_path: Path, skip_unchanged: bool = False, mode: Optional[int] = None):
+        self.output_path = Path(output_path)
+        self.skip_unchanged = skip_unchanged
+        self.mode = mode
+        self.replaced = False
+        self._tmp_name: Optional[str] = None
+        self._file: Optional[BinaryIO] = None
+
+    def __enter__(self) -> BinaryIO:
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unlike mkstemp(), which always uses 0600, open() applies the umask to the mode
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+        while True:
+            self._tmp_name = str(self.output_path.parent / f'.{self.output_path.name}.{secrets.token_hex(4)}.tmp')
+            try:
+                fd = os.open(self._tmp_name, flags, DEFAULT_FILE_MODE if self.mode is None else self.mode)
+                break
+            except FileExistsError:
+                continue
+        self._file = os.fdopen(fd, 'wb')
+        return self._file
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        try:
+            self._file.close()
+            if exc_type is None:
+                if self.skip_unchanged and _same_content(self._tmp_name, self.output_path):
+                    return False
+                if self.mode is not None:
+                    os.chmod(self._tmp_name, self.mode)
+                else:
+                    try:
+                        os.chmod(self._tmp_name, os.stat(self.output_path).st_mode & 0o7777)
+                    except FileNotFoundError:
+                        pass
+                os.replace(self._tmp_name, self.output_path)
+                self.replaced = True
+        finally:
+            if not self.replaced:
+                try:
+                    os.unlink(self._tmp_name)
+                except OSError:
+                    pass
+        return False
+
+
+def _atomic_write_bytes(path: Path, data: bytes, mode: Optional[int] = None) -> None:
+    """Write to a temporary file in the same directory, then rename over the target"""
+    with AtomicFile(path, mode=mode) as f:
+        f.write(data)
+
+
+class ProcessedDataCache:
+    """
+    Content-addressed cache of processed project data
+
+    Entries are pickled (dataset, date_range) pairs named by cache key. Reading
+    an entry refreshes its mtime, and the least recently used entries are
+    evicted once the directory grows past max_bytes. The directory is private
+    to the user, and entries owned by anyone else are never unpickled. It is
+    created by the first put(); if that fails, e.g. in a read-only home
+    directory, the cache logs a warning and disables itself.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self._default_dir = cache_dir is None
+        self.cache_dir = cache_root() / 'processed' if self._default_dir else Path(cache_dir)
+        self.max_bytes = max_bytes if max_bytes is not None else default_cache_max_bytes()
+        self.disabled = False
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, csv_file_path: str, version: str) -> str:
+        """Cache key for a CSV file: content hash combined with the processor version"""
+        return hashlib.sha256(f"{version}:{file_digest(csv_file_path)}".encode('ascii')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pickle"
+
+    def get(self, key: str) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """Return the cached (dataset, date_range) for a key, or None on a miss"""
+        if self.disabled:
+            self.misses += 1
+            return None
+        entry_path = self._entry_path(key)
+        try:
+            f = open(entry_path, 'rb')
+        except OSError:
+            # Not cached yet, or the cache directory is missing or unreadable
+            self.misses += 1
+            return None
+        try:
+            with f:
+                if not _owned_by_current_user(os.fstat(f.fileno())):
+                    # Possibly planted by another user: loading it could run arbitrary code
+                    self.misses += 1
+                    return None
+                entry = pickle.load(f)
+        except Exception:
+            # Truncated or incompatible entry; drop it and treat as a miss
+            entry_path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, dataset: Any, date_range: Dict[str, str]) -> None:
+        """Store processed data under a key, then evict old entries if over the size limit"""
+        if self.disabled:
+            return
+        data = pickle.dumps((dataset, date_range), protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        try:
+            if self._default_dir:
+                # Also makes the shared cache root owner-only
+                default_cache_dir()
+            private_dir(self.cache_dir)
+            _atomic_write_bytes(self._entry_path(key), data, CACHE_FILE_MODE)
+        except OSError as e:
+            logger.warning(f"Processed data cache disabled: {e}")
+            self.disabled = True
+            return
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits in max_bytes; returns entries removed"""
+        entries = []
+        for entry_path in self.cache_dir.glob('*.pickle'):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        for entry_path in self.cache_dir.glob('*.pickle'):
+            entry_path.unlink(missing_ok=True)
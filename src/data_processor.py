@@ -6,10 +6,16 @@ Kept for backward compatibility during migration.
 """
 
 import pandas as pd
+import numpy as np
 import json
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 import warnings
+from collections.abc import Hashable
+
+from .input_formats import read_table
+from .metrics import PipelineMetrics
+from .models import CategoricalColumn, GanttDataset
 
 warnings.warn(
     "data_processor.py is deprecated. Use 'from src.data_processor_v2 import load_projects' instead.",
@@ -17,12 +23,71 @@ warnings.warn(
     stacklevel=2
 )
 
+def _wall_clock(value: Any) -> pd.Timestamp:
+    """A date as a naive Timestamp holding its local date and time (any UTC offset is dropped)"""
+    value = pd.Timestamp(value)
+    return value.tz_localize(None) if value.tz is not None else value
+
+
+def _epoch_seconds(values: pd.Series) -> np.ndarray:
+    """Convert a datetime column to int64 epoch seconds of its wall-clock times"""
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.dt.tz_localize(None)
+    elif not (isinstance(values.dtype, np.dtype) and values.dtype.kind == 'M'):
+        # Mixed offsets, or aware and naive dates together: convert each distinct value once
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        values = pd.Series(pd.DatetimeIndex([_wall_clock(value) for value in uniques]).take(codes))
+    if values.isna().any():
+        raise ValueError("Dates must not be empty")
+    return values.to_numpy().astype('datetime64[s]').astype(np.int64)
+
+
+def _categorical(values: pd.Series) -> CategoricalColumn:
+    """Dictionary-encode a low-cardinality column"""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return CategoricalColumn(codes, list(uniques))
+
+
+# Rows per chunk when streaming large CSV files
+DEFAULT_CHUNK_SIZE = 50000
+
+
+def _column_or_default(df: pd.DataFrame, column: str, default: Any) -> List[Any]:
+    """Return a column as a list, or a constant list when the column is absent"""
+    if column in df.columns:
+        return df[column].tolist()
+    return [default] * len(df)
+
+
+# Read as strings even when every value looks like a number: a chunk or the few
+# rows watch mode reprocesses must read them exactly as the whole file does
+TEXT_COLUMNS = ['project_name', 'category', 'priority', 'description', 'team_lead', 'name']
+# Parsed by the processor rather than the reader, so every CSV reader keeps wall-clock times
+DATE_COLUMNS = ['preparing_start', 'preparing_end', 'execution_end', 'start', 'end']
+
+
+# Normalized multi-stage input: a projects table plus a stages table with one row
+# per stage, joined on project_id (status is optional). A long-format table holds
+# both column sets in one file, one row per stage with the project columns repeated.
+NORMALIZED_PROJECT_COLUMNS = ['project_id', 'project_name', 'category', 'priority', 'description', 'team_lead']
+STAGE_TABLE_COLUMNS = ['project_id', 'name', 'start', 'end', 'progress']
+
+
+def is_long_format(columns: Iterable[str]) -> bool:
+    """Whether a table with these columns is a long-format stage table rather than one row per project"""
+    columns = set(columns)
+    return 'stages' not in columns and set(STAGE_TABLE_COLUMNS) <= columns
+
+
 class ProjectDataProcessor:
     """
     Processes CSV project data and converts it to format suitable for D3.js Gantt chart
     """
     
-    def __init__(self):
+    def __init__(self, metrics: Optional[PipelineMetrics] = None):
+        # Per-phase timings and row/stage counts (see src/metrics.py)
+        self.metrics = metrics if metrics is not None else PipelineMetrics()
+        
         # Legacy format columns
         self.legacy_required_columns = [
             'project_name', 'category', 'priority', 'preparing_start', 
@@ -35,17 +100,109 @@ class ProjectDataProcessor:
             'project_name', 'category', 'priority', 'description', 
             'team_lead', 'stages'
         ]
+        
+        # Parsed stage dates shared by every multi-stage file this processor loads
+        self._date_cache: Dict[Any, Any] = {}
+        self.date_cache_limit = 100000
+        
+        # Stage table built during validation, reused by process_to_gantt_data
+        self._stage_table = None
+        self._stage_table_source = None
+        
+        # Projects and joined stage table of the last normalized input, reused the same way
+        self._normalized = None
+        self._normalized_sources = None
     
-    def load_csv(self, file_path: str) -> pd.DataFrame:
-        """Load and validate CSV file"""
+    def load_csv(self, file_path: str, input_format: str = 'auto') -> pd.DataFrame:
+        """
+        Load and validate a CSV, Parquet or Feather file
+        
+        The format follows the file extension unless input_format names one of
+        src.input_formats.INPUT_FORMATS. Only the columns of the detected legacy,
+        multi-stage or long-format schema are read.
+        """
         try:
-            df = pd.read_csv(file_path)
-            self._validate_columns(df)
-            self._validate_data_types(df)
+            with self.metrics.phase('load'):
+                df = read_table(file_path, input_format, self._select_columns, TEXT_COLUMNS, DATE_COLUMNS)
+            with self.metrics.phase('validate'):
+                self._validate_columns(df)
+                self._validate_data_types(df)
             return df
         except Exception as e:
             raise ValueError(f"Error loading CSV file: {str(e)}")
     
+    def load_normalized(self, projects_path: str, stages_path: str,
+                        input_format: str = 'auto') -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Load and validate a projects table and the stages table that belongs to it
+        
+        The projects table has the multi-stage project columns plus project_id; the
+        stages table has one row per stage with project_id, name, start, end,
+        progress and optionally status. Each file's format follows its extension
+        unless input_format is given. Process the pair with process_normalized_to_dataset().
+        """
+        try:
+            with self.metrics.phase('load'):
+                projects = read_table(projects_path, input_format, self._select_project_columns, TEXT_COLUMNS)
+                stages = read_table(stages_path, input_format, self._select_stage_columns, TEXT_COLUMNS, DATE_COLUMNS)
+            with self.metrics.phase('validate'):
+                self._validate_normalized_columns(projects, stages)
+                self._normalized = (projects, self._join_stage_table(projects, stages))
+                self._normalized_sources = (projects, stages)
+            return projects, stages
+        except Exception as e:
+            raise ValueError(f"Error loading project data: {str(e)}")
+    
+    def iter_csv_chunks(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """
+        Load and validate a CSV file in chunks of chunk_size rows
+        
+        Only one chunk is held in memory at a time. Row labels keep counting across
+        chunks, so project ids match those produced by load_csv.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be a positive number of rows, got {chunk_size}")
+        try:
+            with pd.read_csv(file_path, chunksize=chunk_size,
+                             dtype={column: str for column in TEXT_COLUMNS}) as reader:
+                while True:
+                    with self.metrics.phase('load'):
+                        df = next(reader, None)
+                    if df is None:
+                        break
+                    if is_long_format(df.columns):
+                        # A project's stages could straddle two chunks
+                        raise ValueError("Chunked streaming does not support long-format stage tables")
+                    with self.metrics.phase('validate'):
+                        self._validate_columns(df)
+                        self._validate_data_types(df)
+                    yield df
+        except Exception as e:
+            raise ValueError(f"Error loading CSV file: {str(e)}")
+    
+    def iter_datasets(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[GanttDataset]:
+        """Stream a CSV file as a sequence of processed GanttDataset chunks"""
+        for df in self.iter_csv_chunks(file_path, chunk_size):
+            yield self.process_to_dataset(df)
+    
+    def _select_columns(self, columns: List[str]) -> List[str]:
+        """Columns processing uses, in file order: the detected schema's required columns plus optional ones"""
+        if 'stages' in columns:
+            needed = set(self.multistage_required_columns)
+        elif is_long_format(columns):
+            needed = set(NORMALIZED_PROJECT_COLUMNS) | set(STAGE_TABLE_COLUMNS) | {'status'}
+        else:
+            needed = set(self.legacy_required_columns) | {'preparing_status', 'execution_status'}
+        return [column for column in columns if column in needed]
+    
+    def _select_project_columns(self, columns: List[str]) -> List[str]:
+        """Columns of a normalized projects table that processing uses"""
+        return [column for column in columns if column in NORMALIZED_PROJECT_COLUMNS]
+    
+    def _select_stage_columns(self, columns: List[str]) -> List[str]:
+        """Columns of a stages table that processing uses"""
+        return [column for column in columns if column in STAGE_TABLE_COLUMNS or column == 'status']
+    
     def _validate_columns(self, df: pd.DataFrame) -> None:
         """Validate that all required columns are present"""
         # Check if it's legacy format or multi-stage format
@@ -54,6 +211,11 @@ class ProjectDataProcessor:
             missing_columns = set(self.multistage_required_columns) - set(df.columns)
             if missing_columns:
                 raise ValueError(f"Missing required columns for multi-stage format: {missing_columns}")
+        elif is_long_format(df.columns):
+            # Long-format stage table
+            missing_columns = set(NORMALIZED_PROJECT_COLUMNS) - set(df.columns)
+            if missing_columns:
+                raise ValueError(f"Missing required columns for long-format stage table: {missing_columns}")
         else:
             # Legacy format
             missing_columns = set(self.legacy_required_columns) - set(df.columns)
@@ -65,6 +227,9 @@ class ProjectDataProcessor:
         if 'stages' in df.columns:
             # Multi-stage format validation
             self._validate_multistage_data(df)
+        elif is_long_format(df.columns):
+            # Long-format stage table validation
+            self._validate_long_format_data(df)
         else:
             # Legacy format validation
             self._validate_legacy_data(df)
@@ -74,6 +239,9 @@ class ProjectDataProcessor:
         # Convert date columns
         date_columns = ['preparing_start', 'preparing_end', 'execution_end']
         for col in date_columns:
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                # Typed input (Parquet, Feather) needs no conversion
+                continue
             try:
                 df[col] = pd.to_datetime(df[col])
             except Exception as e:
@@ -91,166 +259,375 @@ class ProjectDataProcessor:
                 if len(invalid_statuses) > 0:
                     raise ValueError(f"Invalid status values in column '{status_col}': {invalid_statuses}. Must be one of {valid_statuses}")
         
-        # Validate date logic
-        for idx, row in df.iterrows():
-            if row['preparing_start'] >= row['preparing_end']:
+        # Validate date logic (whole-column comparisons, report the first offending row)
+        bad_start = (df['preparing_start'] >= df['preparing_end']).to_numpy()
+        bad_end = (df['preparing_end'] >= df['execution_end']).to_numpy()
+        invalid = np.flatnonzero(bad_start | bad_end)
+        if len(invalid) > 0:
+            pos = invalid[0]
+            idx = df.index[pos]
+            if bad_start[pos]:
                 raise ValueError(f"Row {idx}: Preparing start date must be before end date")
-            if row['preparing_end'] >= row['execution_end']:
-                raise ValueError(f"Row {idx}: Preparing end date must be before execution end date")
+            raise ValueError(f"Row {idx}: Preparing end date must be before execution end date")
     
     def _validate_multistage_data(self, df: pd.DataFrame) -> None:
         """Validate multi-stage format data"""
-        for idx, row in df.iterrows():
+        self._stage_table = self._parse_stage_table(df)
+        self._stage_table_source = df
+    
+    def _get_stage_table(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return the validated stage table for df, reusing the one built during load_csv"""
+        if self._stage_table_source is not df:
+            self._validate_multistage_data(df)
+        return self._stage_table
+    
+    def _parse_stage_table(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Decode every stages cell once and flatten all stages into one long table
+        
+        The table has one row per stage with the columns row (position of the
+        project in df), name, start, end, progress and status. Structural problems
+        (bad JSON, missing fields) are found while flattening; dates, ordering,
+        progress and status are then checked column-wise. Errors are reported for
+        the first offending row/stage, exactly as a row-by-row scan would.
+        """
+        index = df.index
+        required_fields = {'name', 'start', 'end', 'progress'}
+        
+        rows, stage_numbers, flat_stages = [], [], []
+        structural_error = None
+        
+        for pos, cell in enumerate(df['stages'].tolist()):
+            idx = index[pos]
+            stages = None
             try:
-                stages = json.loads(row['stages'])
+                stages = json.loads(cell)
                 if not isinstance(stages, list) or len(stages) < 1:
                     raise ValueError(f"Row {idx}: Stages must be a non-empty list")
                 
-                prev_end = None
                 for stage_idx, stage in enumerate(stages):
-                    # Validate required stage fields
-                    required_fields = ['name', 'start', 'end', 'progress']
-                    for field in required_fields:
+                    if isinstance(stage, dict) and required_fields <= stage.keys():
+                        continue
+                    for field in ['name', 'start', 'end', 'progress']:
                         if field not in stage:
                             raise ValueError(f"Row {idx}, Stage {stage_idx}: Missing required field '{field}'")
-                    
-                    # Validate dates
-                    try:
-                        start_date = pd.to_datetime(stage['start'])
-                        end_date = pd.to_datetime(stage['end'])
-                    except Exception as e:
-                        raise ValueError(f"Row {idx}, Stage {stage_idx}: Invalid date format - {str(e)}")
-                    
-                    # Validate date logic
-                    if start_date >= end_date:
-                        raise ValueError(f"Row {idx}, Stage {stage_idx}: Start date must be before end date")
-                    
-                    # Validate sequential stages (optional - stages can overlap)
-                    if prev_end and start_date < prev_end:
-                        # Warning: stages overlap, but allow it
-                        pass
-                    
-                    # Validate progress
-                    progress = stage['progress']
-                    if not isinstance(progress, (int, float)) or not 0 <= progress <= 100:
-                        raise ValueError(f"Row {idx}, Stage {stage_idx}: Progress must be between 0 and 100")
-                    
-                    # Validate status field if present
-                    if 'status' in stage:
-                        valid_statuses = ['normal', 'critical', 'warning', 'completed', 'delayed']
-                        if stage['status'] not in valid_statuses:
-                            raise ValueError(f"Row {idx}, Stage {stage_idx}: Status must be one of {valid_statuses}")
-                    
-                    prev_end = end_date
-                    
+                
+                rows.extend([pos] * len(stages))
+                stage_numbers.extend(range(len(stages)))
+                flat_stages.extend(stages)
             except json.JSONDecodeError as e:
-                raise ValueError(f"Row {idx}: Invalid JSON format in stages column - {str(e)}")
+                structural_error = f"Row {idx}: Invalid JSON format in stages column - {str(e)}"
+                break
             except Exception as e:
-                if "Row" not in str(e):
-                    raise ValueError(f"Row {idx}: {str(e)}")
-                else:
-                    raise
+                structural_error = str(e) if "Row" in str(e) else f"Row {idx}: {str(e)}"
+                # Stages before the broken one still take part in the value checks below
+                passed = 0
+                if isinstance(stages, list):
+                    while passed < len(stages) and isinstance(stages[passed], dict) \
+                            and required_fields <= stages[passed].keys():
+                        passed += 1
+                    rows.extend([pos] * passed)
+                    stage_numbers.extend(range(passed))
+                    flat_stages.extend(stages[:passed])
+                break
+        
+        names = [stage['name'] for stage in flat_stages]
+        starts = [stage['start'] for stage in flat_stages]
+        ends = [stage['end'] for stage in flat_stages]
+        statuses = [stage.get('status', 'normal') for stage in flat_stages]
+        progress_values = [
+            progress if isinstance(progress, (int, float)) else np.nan
+            for progress in (stage['progress'] for stage in flat_stages)
+        ]
+        
+        start_dates, start_errors = self._convert_stage_dates(starts)
+        end_dates, end_errors = self._convert_stage_dates(ends)
+        table = pd.DataFrame({
+            'row': np.asarray(rows, dtype=np.int64),
+            'name': names,
+            'start': start_dates,
+            'end': end_dates,
+            'progress': np.asarray(progress_values, dtype=np.float64),
+            'status': statuses
+        })
+        
+        date_error = pd.Series(start_errors).fillna(pd.Series(end_errors))
+        self._check_stage_values(table, date_error,
+                                 lambda pos: f"Row {index[rows[pos]]}, Stage {stage_numbers[pos]}")
+        
+        if structural_error is not None:
+            raise ValueError(structural_error)
+        
+        return table
+    
+    def _check_stage_values(self, table: pd.DataFrame, date_error: pd.Series, location: Callable[[int], str]) -> None:
+        """
+        Check a flattened stage table column-wise, in the order a single stage is validated
+        
+        date_error holds the parse error (or NaN) of each stage's dates; location
+        names a table position in error messages. The first offending stage is reported.
+        """
+        valid_statuses = ['normal', 'critical', 'warning', 'completed', 'delayed']
+        bad_date = date_error.notna().to_numpy()
+        bad_order = ~bad_date & (table['start'] >= table['end']).to_numpy()
+        bad_progress = ~table['progress'].between(0, 100).to_numpy()
+        bad_status = ~table['status'].isin(valid_statuses).to_numpy()
+        
+        invalid = np.flatnonzero(bad_date | bad_order | bad_progress | bad_status)
+        if len(invalid) > 0:
+            pos = invalid[0]
+            if bad_date[pos]:
+                raise ValueError(f"{location(pos)}: Invalid date format - {date_error.iloc[pos]}")
+            if bad_order[pos]:
+                raise ValueError(f"{location(pos)}: Start date must be before end date")
+            if bad_progress[pos]:
+                raise ValueError(f"{location(pos)}: Progress must be between 0 and 100")
+            raise ValueError(f"{location(pos)}: Status must be one of {valid_statuses}")
+    
+    def _validate_normalized_columns(self, projects: pd.DataFrame, stages: pd.DataFrame) -> None:
+        """Validate that a projects table and a stages table have their required columns"""
+        missing_columns = set(NORMALIZED_PROJECT_COLUMNS) - set(projects.columns)
+        if missing_columns:
+            raise ValueError(f"Missing required columns for projects table: {missing_columns}")
+        missing_columns = set(STAGE_TABLE_COLUMNS) - set(stages.columns)
+        if missing_columns:
+            raise ValueError(f"Missing required columns for stages table: {missing_columns}")
+    
+    def _validate_long_format_data(self, df: pd.DataFrame) -> None:
+        """Validate long-format data: split it into projects and stages and join them"""
+        projects, stages = self._split_long_format(df)
+        self._normalized = (projects, self._join_stage_table(projects, stages))
+        self._normalized_sources = (df,)
+    
+    def _get_normalized(self, *sources: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Projects and joined stage table for a long-format df or a (projects, stages) pair, reusing the validated ones"""
+        cached = self._normalized_sources
+        if cached is None or len(cached) != len(sources) or any(a is not b for a, b in zip(cached, sources)):
+            if len(sources) == 1:
+                self._validate_long_format_data(sources[0])
+            else:
+                self._validate_normalized_columns(*sources)
+                self._normalized = (sources[0], self._join_stage_table(*sources))
+                self._normalized_sources = sources
+        return self._normalized
+    
+    def _split_long_format(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Projects table and stages table of a long-format table
+        
+        Each project's columns come from its first row; projects keep the order in
+        which they first appear, and their position is their row label.
+        """
+        first_rows = ~df['project_id'].duplicated().to_numpy()
+        projects = df.loc[first_rows, NORMALIZED_PROJECT_COLUMNS].reset_index(drop=True)
+        stage_columns = STAGE_TABLE_COLUMNS + (['status'] if 'status' in df.columns else [])
+        return projects, df[stage_columns]
+    
+    def _join_stage_table(self, projects: pd.DataFrame, stages: pd.DataFrame) -> pd.DataFrame:
+        """
+        Validate a stages table against its projects and group it by project
+        
+        Returns the table _parse_stage_table() builds from JSON cells: one row per
+        stage with the columns row (position of the project in projects), name,
+        start, end, progress and status, each project's stages in file order. The
+        join, the grouping (a stable sort on the project position) and every check
+        are whole-column operations; errors name the first offending row.
+        """
+        project_ids = projects['project_id']
+        missing_ids = project_ids.isna().to_numpy()
+        if missing_ids.any():
+            raise ValueError(f"Project row {projects.index[missing_ids.argmax()]}: Missing project_id")
+        duplicated = project_ids.duplicated().to_numpy()
+        if duplicated.any():
+            pos = duplicated.argmax()
+            raise ValueError(f"Project row {projects.index[pos]}: Duplicate project_id '{project_ids.iloc[pos]}'")
+        
+        # Position of each stage's project in the projects table, -1 for unknown ids
+        rows = pd.Index(project_ids).get_indexer(stages['project_id'])
+        unknown = rows < 0
+        if unknown.any():
+            pos = unknown.argmax()
+            raise ValueError(f"Stage row {stages.index[pos]}: Unknown project_id '{stages['project_id'].iloc[pos]}'")
+        without_stages = np.bincount(rows, minlength=len(projects)) == 0
+        if without_stages.any():
+            raise ValueError(f"Project row {projects.index[without_stages.argmax()]}: Stages must be a non-empty list")
+        
+        for field in ['name', 'start', 'end', 'progress']:
+            missing = stages[field].isna().to_numpy()
+            if missing.any():
+                raise ValueError(f"Stage row {stages.index[missing.argmax()]}: Missing required field '{field}'")
+        
+        start_dates, start_errors = self._stage_column_dates(stages['start'])
+        end_dates, end_errors = self._stage_column_dates(stages['end'])
+        statuses = stages['status'].fillna('normal') if 'status' in stages.columns else 'normal'
+        table = pd.DataFrame({
+            'row': rows.astype(np.int64),
+            'name': stages['name'].reset_index(drop=True),
+            'start': start_dates,
+            'end': end_dates,
+            'progress': pd.to_numeric(stages['progress'], errors='coerce').to_numpy(dtype=np.float64),
+            'status': statuses.reset_index(drop=True) if isinstance(statuses, pd.Series) else statuses
+        })
+        
+        date_error = pd.Series(start_errors).fillna(pd.Series(end_errors))
+        self._check_stage_values(table, date_error, lambda pos: f"Stage row {stages.index[pos]}")
+        
+        # Group the stages by project, keeping their order within each project
+        order = np.argsort(rows, kind='stable')
+        return table.take(order).reset_index(drop=True)
+    
+    def _stage_column_dates(self, values: pd.Series) -> tuple:
+        """Dates of a stages table column and the parse error (or None) of each, as _convert_stage_dates()"""
+        if pd.api.types.is_datetime64_any_dtype(values):
+            # Typed input (Parquet, Feather) needs no conversion
+            return values.reset_index(drop=True), [None] * len(values)
+        return self._convert_stage_dates(values.to_numpy(dtype=object))
+    
+    def _convert_stage_dates(self, values: List[Any]) -> tuple:
+        """
+        Convert stage date strings with one vectorized call over the unseen unique values
+        
+        Returns the converted dates as a Series aligned with values, plus a list holding
+        the parse error message (or None) for each value. Results are memoized per
+        processor because most stages share a small set of dates.
+        """
+        try:
+            codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+        except TypeError:
+            # Lists and dicts from the stages JSON cannot be dates; key them by their text
+            values = [value if isinstance(value, Hashable) else str(value) for value in values]
+            codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+        
+        if len(self._date_cache) > self.date_cache_limit:
+            self._date_cache.clear()
+        
+        unseen = [value for value in uniques if value not in self._date_cache]
+        if unseen:
+            try:
+                converted = list(pd.to_datetime(pd.Series(unseen, dtype=object), format='mixed', errors='coerce'))
+            except Exception:
+                # Mixed time zones and similar cases: fall back to scalar conversion
+                converted = [pd.NaT] * len(unseen)
+            for value, date in zip(unseen, converted):
+                if pd.isna(date):
+                    # Either a genuine NaT or a parse failure; the scalar call tells them apart
+                    try:
+                        date = pd.to_datetime(value)
+                    except Exception as e:
+                        date = str(e)
+                    if not isinstance(date, str) and pd.isna(date):
+                        date = f"Empty date {value!r}"
+                self._date_cache[value] = date
+        
+        resolved = [self._date_cache[value] for value in uniques]
+        parsed = [None if isinstance(date, str) else date for date in resolved]
+        errors = [date if isinstance(date, str) else None for date in resolved]
+        
+        dates = pd.Series(parsed).take(codes).reset_index(drop=True)
+        return dates, [errors[code] for code in codes]
     
     def process_to_gantt_data(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """Convert DataFrame to format suitable for D3.js Gantt chart"""
-        gantt_data = []
-        
-        for idx, row in df.iterrows():
+        dataset = self.process_to_dataset(df)
+        with self.metrics.phase('records'):
+            return dataset.to_records()
+    
+    def process_to_dataset(self, df: pd.DataFrame) -> GanttDataset:
+        """Convert DataFrame to the compact columnar GanttDataset model"""
+        with self.metrics.phase('process'):
             if 'stages' in df.columns:
                 # Multi-stage format
-                project_data = self._process_multistage_project(idx, row)
+                dataset = self._multistage_dataset(df)
+            elif is_long_format(df.columns):
+                # Long-format stage table
+                dataset = self._dataset_from_stage_table(*self._get_normalized(df))
             else:
                 # Legacy format
-                project_data = self._process_legacy_project(idx, row)
-            
-            gantt_data.append(project_data)
-        
-        return gantt_data
-    
-    def _process_legacy_project(self, idx: int, row: pd.Series) -> Dict[str, Any]:
-        """Process legacy format project data"""
-        # Convert legacy format to new multi-stage structure
-        stages = [
-            {
-                'name': 'Preparing',
-                'start': row['preparing_start'].isoformat(),
-                'end': row['preparing_end'].isoformat(),
-                'duration_days': (row['preparing_end'] - row['preparing_start']).days,
-                'progress_percent': 100,  # Preparing stage is always complete if execution has started
-                'status': row.get('preparing_status', 'normal')  # Add status support
-            },
-            {
-                'name': 'Execution',
-                'start': row['preparing_end'].isoformat(),
-                'end': row['execution_end'].isoformat(),
-                'duration_days': (row['execution_end'] - row['preparing_end']).days,
-                'progress_percent': int(row['progress_percent']),
-                'status': row.get('execution_status', 'normal')  # Add status support
-            }
-        ]
-        
-        project_data = {
-            'id': f"project_{idx}",
-            'name': row['project_name'],
-            'category': row['category'],
-            'priority': row['priority'],
-            'description': row['description'],
-            'team_lead': row['team_lead'],
-            'stages': stages,
-            'total_duration_days': (row['execution_end'] - row['preparing_start']).days
-        }
-        
-        return project_data
+                dataset = self._legacy_dataset(df)
+        self.metrics.count('rows', len(dataset))
+        self.metrics.count('stages', dataset.stage_count)
+        return dataset
     
-    def _process_multistage_project(self, idx: int, row: pd.Series) -> Dict[str, Any]:
-        """Process multi-stage format project data"""
-        stages_json = json.loads(row['stages'])
+    def process_normalized_to_dataset(self, projects: pd.DataFrame, stages: pd.DataFrame) -> GanttDataset:
+        """Convert a projects table and its stages table (see load_normalized()) to a GanttDataset"""
+        with self.metrics.phase('process'):
+            dataset = self._dataset_from_stage_table(*self._get_normalized(projects, stages))
+        self.metrics.count('rows', len(dataset))
+        self.metrics.count('stages', dataset.stage_count)
+        return dataset
+    
+    def _legacy_dataset(self, df: pd.DataFrame) -> GanttDataset:
+        """Build the dataset for legacy rows: a Preparing and an Execution stage per project"""
+        preparing_start = _epoch_seconds(df['preparing_start'])
+        preparing_end = _epoch_seconds(df['preparing_end'])
+        execution_end = _epoch_seconds(df['execution_end'])
+        progress = df['progress_percent'].astype('int64').to_numpy()
         
-        # Process each stage
-        stages = []
-        all_start_dates = []
-        all_end_dates = []
+        # Interleave the two stages of every project: [prep_0, exec_0, prep_1, exec_1, ...]
+        project_count = len(df)
+        statuses = np.column_stack([
+            _column_or_default(df, 'preparing_status', 'normal'),
+            _column_or_default(df, 'execution_status', 'normal')
+        ]).ravel() if project_count else []
         
-        for stage_data in stages_json:
-            start_date = pd.to_datetime(stage_data['start'])
-            end_date = pd.to_datetime(stage_data['end'])
-            
-            stage = {
-                'name': stage_data['name'],
-                'start': start_date.isoformat(),
-                'end': end_date.isoformat(),
-                'duration_days': (end_date - start_date).days,
-                'progress_percent': int(stage_data['progress']),
-                'status': stage_data.get('status', 'normal')  # Add status support with default
-            }
-            stages.append(stage)
-            all_start_dates.append(start_date)
-            all_end_dates.append(end_date)
-        
-        # Calculate total duration
-        total_start = min(all_start_dates)
-        total_end = max(all_end_dates)
-        
-        project_data = {
-            'id': f"project_{idx}",
-            'name': row['project_name'],
-            'category': row['category'],
-            'priority': row['priority'],
-            'description': row['description'],
-            'team_lead': row['team_lead'],
-            'stages': stages,
-            'total_duration_days': (total_end - total_start).days
-        }
+        return GanttDataset(
+            project_labels=df.index.tolist(),
+            names=df['project_name'].tolist(),
+            descriptions=df['description'].tolist(),
+            categories=_categorical(df['category']),
+            priorities=_categorical(df['priority']),
+            team_leads=_categorical(df['team_lead']),
+            stage_bounds=np.arange(0, 2 * project_count + 1, 2),
+            stage_names=CategoricalColumn(np.tile([0, 1], project_count), ['Preparing', 'Execution']),
+            stage_starts=np.column_stack([preparing_start, preparing_end]).ravel(),
+            stage_ends=np.column_stack([preparing_end, execution_end]).ravel(),
+            # Preparing stage is always complete if execution has started
+            stage_progress=np.column_stack([np.full(project_count, 100), progress]).ravel(),
+            stage_statuses=_categorical(pd.Series(statuses, dtype=object))
+        )
+    
+    def _multistage_dataset(self, df: pd.DataFrame) -> GanttDataset:
+        """Build the dataset for multi-stage rows from the flattened stage table"""
+        return self._dataset_from_stage_table(df, self._get_stage_table(df))
+    
+    def _dataset_from_stage_table(self, projects: pd.DataFrame, table: pd.DataFrame) -> GanttDataset:
+        """Build the dataset for a projects table and its flattened stage table (grouped by project)"""
+        # Stages of one project are contiguous in the table
+        bounds = np.searchsorted(table['row'].to_numpy(), np.arange(len(projects) + 1))
         
-        return project_data
+        return GanttDataset(
+            project_labels=projects.index.tolist(),
+            names=projects['project_name'].tolist(),
+            descriptions=projects['description'].tolist(),
+            categories=_categorical(projects['category']),
+            priorities=_categorical(projects['priority']),
+            team_leads=_categorical(projects['team_lead']),
+            stage_bounds=bounds,
+            stage_names=_categorical(table['name']),
+            stage_starts=_epoch_seconds(table['start']),
+            stage_ends=_epoch_seconds(table['end']),
+            stage_progress=table['progress'].astype('int64').to_numpy(),
+            stage_statuses=_categorical(table['status'])
+        )
     
-    def export_to_json(self, data: List[Dict[str, Any]], output_path: str) -> None:
+    def export_to_json(self, data: Union[GanttDataset, List[Dict[str, Any]]], output_path: str) -> None:
         """Export processed data to JSON file"""
+        if isinstance(data, GanttDataset):
+            data = data.to_records()
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
     
-    def get_date_range(self, data: List[Dict[str, Any]]) -> Dict[str, str]:
+    def get_date_range(self, data: Union[GanttDataset, List[Dict[str, Any]]]) -> Dict[str, str]:
         """Get overall date range for the chart"""
+        with self.metrics.phase('date_range'):
+            return self._date_range(data)
+    
+    def _date_range(self, data: Union[GanttDataset, List[Dict[str, Any]]]) -> Dict[str, str]:
+        """Earliest stage start and latest stage end as ISO strings"""
+        if isinstance(data, GanttDataset):
+            # Tracked while the dataset was built
+            return data.date_range()
+        
         all_start_dates = []
         all_end_dates = []
         
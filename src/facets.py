@@ -0,0 +1,137 @@
+"""
+Facet index embedded next to the project data
+
+For each filterable field (category, priority, team lead and status) the index
+lists the distinct values, how many projects have each one, and which projects
+they are. Dense sets are stored as base64 bitsets (little-endian 32-bit words,
+bit i = project i) and sparse ones as sorted lists of project positions,
+whichever is smaller. templates/shared/d3-common.js (CQSS_FacetIndex) answers
+filter combinations by intersecting these sets instead of rescanning projects.
+"""
+
+import base64
+import json
+from typing import Any, Dict, Iterable, List, Sequence, Union
+
+import numpy as np
+
+from .models import CategoricalColumn, GanttDataset
+from .payload import _json_safe
+
+# Facets in the order the filter bar shows them; a project's status is the status of its last stage
+FACETS = ['category', 'priority', 'team_lead', 'status']
+
+# Bits per word of the encoded bitsets (the browser reads them as a Uint32Array)
+WORD_BITS = 32
+
+
+def _first_seen(codes: np.ndarray, values: List[Any]) -> CategoricalColumn:
+    """Encode a subset of another column's codes with only its own values, in first-seen order"""
+    uniques, first_positions = np.unique(codes, return_index=True)
+    order = uniques[np.argsort(first_positions)]
+    remap = np.zeros(len(values), dtype=np.int32)
+    remap[order] = np.arange(len(order), dtype=np.int32)
+    return CategoricalColumn(remap[codes], [values[code] for code in order.tolist()])
+
+
+def project_facets(project_data: Union[GanttDataset, list]) -> Dict[str, CategoricalColumn]:
+    """One dictionary-encoded column per facet, with an entry per project in first-seen value order"""
+    if isinstance(project_data, GanttDataset):
+        last_stages = project_data.stage_bounds[1:] - 1
+        return {
+            'category': project_data.categories,
+            'priority': project_data.priorities,
+            'team_lead': project_data.team_leads,
+            'status': _first_seen(project_data.stage_statuses.codes[last_stages], project_data.stage_statuses.values)
+        }
+    return {
+        'category': CategoricalColumn.from_values(project['category'] for project in project_data),
+        'priority': CategoricalColumn.from_values(project['priority'] for project in project_data),
+        'team_lead': CategoricalColumn.from_values(project['team_lead'] for project in project_data),
+        'status': CategoricalColumn.from_values(project['stages'][-1].get('status', 'normal')
+                                                for project in project_data)
+    }
+
+
+def _encode_set(positions: np.ndarray, size: int) -> Union[str, List[int]]:
+    """A set of project positions as a base64 bitset or a sorted list, whichever is smaller"""
+    words = -(-size // WORD_BITS)
+    # In JSON a list costs up to one digit per decimal place (plus a comma) per id,
+    # and a bitset 16/3 base64 characters per word
+    if len(positions) * (len(str(size)) + 1) < words * 16 // 3:
+        return positions.tolist()
+    mask = np.zeros(words * WORD_BITS, dtype=bool)
+    mask[positions] = True
+    return base64.b64encode(np.packbits(mask, bitorder='little').tobytes()).decode('ascii')
+
+
+def encode_facet(column: CategoricalColumn) -> Dict[str, Any]:
+    """Values present in a column, their project counts and project sets"""
+    size = len(column)
+    counts = np.bincount(column.codes, minlength=len(column.values))
+    present = np.flatnonzero(counts)
+    # A stable sort keeps the positions of each value ascending
+    positions = np.split(np.argsort(column.codes, kind='stable'), np.cumsum(counts)[:-1])
+    return {
+        'values': _json_safe([column.values[code] for code in present.tolist()]),
+        'counts': counts[present].tolist(),
+        'sets': [_encode_set(positions[code], size) for code in present.tolist()]
+    }
+
+
+def build_facet_index(project_data: Union[GanttDataset, list]) -> Dict[str, Any]:
+    """Facet index for a dataset or list of project records, in first-seen value order"""
+    return encode_facet_index(project_facets(project_data))
+
+
+def render_facet_index(facet_index: Dict[str, Any]) -> str:
+    """Serialize a facet index as the JavaScript expression substituted for {{ facet_index }}"""
+    # The index sits inside a <script> element
+    return json.dumps(facet_index, separators=(',', ':'), allow_nan=False).replace('</', '<\\/')
+
+
+def encode_facet_index(columns: Dict[str, CategoricalColumn]) -> Dict[str, Any]:
+    """Facet index from per-project facet columns (see project_facets())"""
+    size = len(columns[FACETS[0]])
+    return {
+        'size': size,
+        'facets': {facet: encode_facet(columns[facet]) for facet in FACETS}
+    }
+
+
+class FacetIndexBuilder:
+    """
+    Accumulates facet columns across a stream of GanttDataset chunks
+
+    Only one int32 code per project and facet is kept, so memory stays small
+    while streamed chunks are serialized and discarded.
+    """
+
+    def __init__(self):
+        self._lookups: Dict[str, Dict[Any, int]] = {facet: {} for facet in FACETS}
+        self._codes: Dict[str, List[np.ndarray]] = {facet: [] for facet in FACETS}
+
+    def update(self, dataset: GanttDataset) -> None:
+        """Add the projects of a chunk, remapping its codes onto the values seen so far"""
+        for facet, column in project_facets(dataset).items():
+            lookup = self._lookups[facet]
+            remap = np.asarray([lookup.setdefault(value, len(lookup)) for value in column.values], dtype=np.int32)
+            self._codes[facet].append(remap[column.codes])
+
+    def extend(self, facet_values: Iterable[Sequence[Any]]) -> None:
+        """Add projects given as tuples of their facet values, in FACETS order"""
+        facet_values = list(facet_values)
+        for position, facet in enumerate(FACETS):
+            lookup = self._lookups[facet]
+            codes = [lookup.setdefault(values[position], len(lookup)) for values in facet_values]
+            self._codes[facet].append(np.asarray(codes, dtype=np.int32))
+
+    def build(self) -> Dict[str, Any]:
+        """Facet index of every project added so far"""
+        return encode_facet_index({
+            facet: CategoricalColumn(
+                np.concatenate(self._codes[facet]) if self._codes[facet] else np.zeros(0, dtype=np.int32),
+                list(self._lookups[facet])
+            )
+            for facet in FACETS
+        })
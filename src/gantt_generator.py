@@ -1,106 +1,558 @@
+import io
+import itertools
 import json
+import logging
+import tempfile
+import threading
+import uuid
 from pathlib import Path
-from jinja2 import Template
-from .data_processor import ProjectDataProcessor
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple, Union
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from .bundler import BUNDLE_MODES, render_shared_assets
+from .cache import AtomicFile, ProcessedDataCache, file_digest
+from .facets import FacetIndexBuilder, build_facet_index, render_facet_index
+from .input_formats import INPUT_FORMATS, resolve_input_format
+from .lightweight_processor import LightweightProcessor, UnsupportedInput, prefers_lightweight
+from .metrics import PipelineMetrics
+from .models import PROCESSOR_VERSION, DateRangeTracker, GanttDataset
+from .payload import PAYLOAD_FORMATS, iter_json_array, iter_project_data, render_project_data
+from .rollups import RollupBuilder, build_rollups, render_rollups
+
+logger = logging.getLogger(__name__)
+
+# Serialized project data above this size is spooled to disk while streaming
+SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+# Bytes copied at a time from the spool into the output file
+STREAM_CHUNK_BYTES = 1024 * 1024
+
+# Charts with at least this many projects or stages are drawn on a canvas
+# instead of one DOM/SVG element per stage (see CQSS_CanvasRenderer)
+CANVAS_MIN_PROJECTS = 10000
+CANVAS_MIN_STAGES = 50000
+
+RENDERERS = ['auto', 'svg', 'canvas']
+
+# CSV ingestion: 'auto' reads small files without pandas (see src/lightweight_processor.py)
+ENGINES = ['auto', 'stdlib', 'pandas']
+
+TEMPLATES_DIR = Path(__file__).parent.parent / 'templates'
+
+# Style registry: template file, default output name and gallery entry for each chart style
+STYLES = {
+    'default': {
+        'template': 'gantt_template.html',
+        'output': 'gantt_chart.html',
+        'gallery_output': '1_default_design.html',
+        'title': 'Default Design'
+    },
+    'minimal': {
+        'template': 'modern_minimal_template.html',
+        'output': 'gantt_chart_minimal.html',
+        'gallery_output': '2_minimal_design.html',
+        'title': 'Minimal Design'
+    },
+    'dark': {
+        'template': 'dark_professional_template.html',
+        'output': 'gantt_chart_dark.html',
+        'gallery_output': '3_dark_design.html',
+        'title': 'Dark Design'
+    },
+    'colorful': {
+        'template': 'colorful_friendly_template.html',
+        'output': 'gantt_chart_colorful.html',
+        'gallery_output': '4_colorful_design.html',
+        'title': 'Colorful Design'
+    },
+    'interactive': {
+        'template': 'interactive_modern_template.html',
+        'output': 'gantt_chart_interactive.html',
+        'gallery_output': '5_interactive_design.html',
+        'title': 'Interactive Design'
+    },
+    'frappe': {
+        'template': 'frappe_gantt_template.html',
+        'output': 'gantt_chart_frappe.html',
+        'gallery_output': '6_frappe_design.html',
+        'title': 'Frappe Design'
+    },
+    'standalone': {
+        'template': 'standalone_gantt_template.html',
+        'output': 'gantt_chart_standalone.html',
+        'gallery_output': None,
+        'title': 'Standalone Design'
+    }
+}
+
+# Styles rendered by generate_all_styles.py, in gallery order
+GALLERY_STYLES = [name for name, spec in STYLES.items() if spec['gallery_output']]
+
+
+def resolve_style(style: str = "default", standalone: bool = False) -> str:
+    """Return the registry key for a style; an explicit style takes precedence over standalone"""
+    if style == "default" and standalone:
+        return 'standalone'
+    if style not in STYLES:
+        raise ValueError(f"Unknown style '{style}'. Must be one of {list(STYLES)}")
+    return style
+
+
+def select_renderer(project_count: int, stage_count: int, renderer: str = 'auto',
+                    min_projects: int = CANVAS_MIN_PROJECTS, min_stages: int = CANVAS_MIN_STAGES) -> str:
+    """Resolve 'auto' to 'canvas' for charts at or above either threshold, otherwise 'svg'"""
+    if renderer not in RENDERERS:
+        raise ValueError(f"Unknown renderer '{renderer}'. Must be one of {RENDERERS}")
+    if renderer != 'auto':
+        return renderer
+    return 'canvas' if project_count >= min_projects or stage_count >= min_stages else 'svg'
+
+
+def dataset_size(project_data: Union[GanttDataset, list]) -> Tuple[int, int]:
+    """Number of projects and stages in a dataset or list of project records"""
+    if isinstance(project_data, GanttDataset):
+        return len(project_data), project_data.stage_count
+    return len(project_data), sum(len(project['stages']) for project in project_data)
+
+
+_environments: Dict[Path, Environment] = {}
+_environments_lock = threading.Lock()
+
+
+def get_template_environment(template_dir: Path) -> Environment:
+    """
+    Return the process-wide Jinja environment for a template directory
+    
+    Compiled templates are kept in memory and shared by every generator instance;
+    auto_reload recompiles a template when its mtime changes. Bytecode is also
+    cached on disk so new processes skip compilation.
+    """
+    template_dir = Path(template_dir).resolve()
+    with _environments_lock:
+        environment = _environments.get(template_dir)
+        if environment is None:
+            # Jinja's default directory is per user, owner-only and checked on use
+            environment = Environment(
+                loader=FileSystemLoader(str(template_dir)),
+                bytecode_cache=FileSystemBytecodeCache(),
+                auto_reload=True
+            )
+            _environments[template_dir] = environment
+        return environment
+
+
+def load_project_data(csv_file_path: str,
+                      cache: Optional[ProcessedDataCache] = None,
+                      metrics: Optional[PipelineMetrics] = None,
+                      engine: str = 'auto', input_format: str = 'auto',
+                      stages_file: Optional[str] = None) -> Tuple[GanttDataset, Dict[str, str]]:
+    """
+    Load, validate and process a CSV file; returns the dataset and its date range
+    
+    Args:
+        csv_file_path: Path to CSV file containing project data
+        cache: Processed-data cache; when the CSV content is unchanged the cached
+            result is returned without parsing the file (see cache.hits/misses)
+        metrics: Receives the lookup as a 'cache' phase and the processing phases
+        engine: 'auto' reads files up to LIGHTWEIGHT_MAX_BYTES with the stdlib csv
+            module, 'stdlib' does so for any size and 'pandas' never does. Input the
+            stdlib reader cannot reproduce exactly is always handed to pandas, and
+            pandas is only imported when it is used.
+        input_format: File format, one of INPUT_FORMATS; 'auto' goes by the file
+            extension (see src/input_formats.py). The engine only applies to CSV.
+        stages_file: Stages table for csv_file_path as a normalized projects table
+            (see ProjectDataProcessor.load_normalized()); always read with pandas
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Must be one of {ENGINES}")
+    file_format = resolve_input_format(csv_file_path, input_format)
+    metrics = metrics if metrics is not None else PipelineMetrics()
+    if cache is not None:
+        with metrics.phase('cache'):
+            # Other readers may infer types differently, so their results are kept apart
+            version = PROCESSOR_VERSION if file_format == 'csv' else f"{PROCESSOR_VERSION}/{file_format}"
+            if stages_file is not None:
+                # The entry depends on both files
+                version = f"{version}/normalized:{file_digest(stages_file)}"
+            key = cache.key_for(csv_file_path, version)
+            entry = cache.get(key)
+        if entry is not None:
+            return entry
+    
+    dataset = None
+    if stages_file is not None:
+        from .data_processor import ProjectDataProcessor
+        processor = ProjectDataProcessor(metrics)
+        dataset = processor.process_normalized_to_dataset(
+            *processor.load_normalized(csv_file_path, stages_file, input_format))
+    elif file_format == 'csv' and (engine == 'stdlib' or (engine == 'auto' and prefers_lightweight(csv_file_path))):
+        try:
+            dataset = LightweightProcessor(metrics).load_dataset(csv_file_path)
+        except UnsupportedInput as e:
+            logger.debug(f"Reading {csv_file_path} with pandas: {e}")
+    if dataset is None:
+        from .data_processor import ProjectDataProcessor
+        processor = ProjectDataProcessor(metrics)
+        dataset = processor.process_to_dataset(processor.load_csv(csv_file_path, input_format))
+    
+    with metrics.phase('date_range'):
+        date_range = dataset.date_range()
+    
+    if cache is not None:
+        cache.put(key, dataset, date_range)
+    return dataset, date_range
+
+
+def build_page_context(project_data: Union[GanttDataset, list], date_range: dict,
+                       renderer: str = 'svg', rollups: bool = False) -> Dict[str, str]:
+    """Template context of build_template_context() without the project data payload"""
+    return {
+        'date_range': json.dumps(date_range, indent=2),
+        'renderer': json.dumps(renderer),
+        'facet_index': render_facet_index(build_facet_index(project_data)),
+        'rollups': render_rollups(build_rollups(project_data) if rollups else None)
+    }
+
+
+def build_template_context(project_data: Union[GanttDataset, list], date_range: dict,
+                           payload_format: str = 'json', renderer: str = 'svg',
+                           rollups: bool = False) -> Dict[str, str]:
+    """
+    Serialize processed data into the strings embedded by every template
+    
+    The result is independent of the style, so one context can be rendered
+    with any number of templates. See src/payload.py for the payload formats
+    and src/facets.py for the filter index; renderer is 'svg' or 'canvas'
+    (see select_renderer()). With rollups, per-category and per-team summary
+    bars are included for the grouped view (see src/rollups.py).
+    """
+    return {
+        'project_data': render_project_data(project_data, payload_format),
+        **build_page_context(project_data, date_range, renderer, rollups)
+    }
+
 
 class GanttChartGenerator:
     """
     Generates static HTML Gantt chart from processed project data
     """
     
-    def __init__(self, template_path: str = None, standalone: bool = False, style: str = "default"):
+    def __init__(self, template_path: str = None, standalone: bool = False, style: str = "default",
+                 payload_format: str = "json", use_cache: bool = True, renderer: str = "auto",
+                 canvas_min_projects: int = CANVAS_MIN_PROJECTS, canvas_min_stages: int = CANVAS_MIN_STAGES,
+                 rollups: bool = False, bundle: str = "inline", metrics: Optional[PipelineMetrics] = None,
+                 engine: str = "auto", input_format: str = "auto"):
+        if payload_format not in PAYLOAD_FORMATS:
+            raise ValueError(f"Unknown payload format '{payload_format}'. Must be one of {PAYLOAD_FORMATS}")
+        self.payload_format = payload_format
+        
+        # 'auto' switches to the canvas renderer at either size threshold
+        if renderer not in RENDERERS:
+            raise ValueError(f"Unknown renderer '{renderer}'. Must be one of {RENDERERS}")
+        self.renderer = renderer
+        self.canvas_min_projects = canvas_min_projects
+        self.canvas_min_stages = canvas_min_stages
+        
+        # Embed per-category and per-team summary bars for the grouped view
+        self.rollups = rollups
+        
+        # Shared scripts: inlined into each page, or one content-hashed file per output directory
+        if bundle not in BUNDLE_MODES:
+            raise ValueError(f"Unknown bundle mode '{bundle}'. Must be one of {BUNDLE_MODES}")
+        self.bundle = bundle
+        
+        # CSV ingestion engine (see load_project_data())
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Must be one of {ENGINES}")
+        self.engine = engine
+        
+        # Input file format; 'auto' goes by the extension (see src/input_formats.py)
+        if input_format not in INPUT_FORMATS:
+            raise ValueError(f"Unknown input format '{input_format}'. Must be one of {INPUT_FORMATS}")
+        self.input_format = input_format
+        
+        # Cache processed data by CSV content and leave identical outputs untouched
+        self.use_cache = use_cache
+        self.cache = ProcessedDataCache() if use_cache else None
+        self.last_write_skipped = False
+        
+        # Per-phase timings, counts and bytes of every chart this generator produces (see src/metrics.py)
+        self.metrics = metrics if metrics is not None else PipelineMetrics()
+        
         if template_path is None:
-            if style == "frappe":
-                template_name = 'frappe_gantt_template.html'
-            elif style == "minimal":
-                template_name = 'modern_minimal_template.html'
-            elif style == "dark":
-                template_name = 'dark_professional_template.html'
-            elif style == "colorful":
-                template_name = 'colorful_friendly_template.html'
-            elif style == "interactive":
-                template_name = 'interactive_modern_template.html'
-            elif standalone:
-                template_name = 'standalone_gantt_template.html'
-            else:
-                template_name = 'gantt_template.html'
-            template_path = Path(__file__).parent.parent / 'templates' / template_name
+            template_path = TEMPLATES_DIR / STYLES[resolve_style(style, standalone)]['template']
         
         self.template_path = Path(template_path)
         if not self.template_path.exists():
             raise FileNotFoundError(f"Template file not found: {self.template_path}")
     
-    def generate_chart(self, csv_file_path: str, output_path: str) -> None:
+    def generate_chart(self, csv_file_path: str, output_path: str, chunk_size: Optional[int] = None,
+                       stages_file: Optional[str] = None) -> None:
         """
         Generate complete Gantt chart HTML file from CSV data
         
         Args:
             csv_file_path: Path to CSV file containing project data
             output_path: Path where the HTML file will be saved
+            chunk_size: Stream the CSV in chunks of this many rows to keep memory
+                bounded for very large files (default: load the whole file)
+            stages_file: Stages table that makes csv_file_path a normalized
+                projects table (see ProjectDataProcessor.load_normalized())
         """
-        # Process the data
-        processor = ProjectDataProcessor()
-        df = processor.load_csv(csv_file_path)
-        project_data = processor.process_to_gantt_data(df)
-        date_range = processor.get_date_range(project_data)
-        
-        # Load template
-        with open(self.template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-        
-        # Create Jinja2 template
-        template = Template(template_content)
-        
-        # Render template with data
-        html_content = template.render(
-            project_data=json.dumps(project_data, indent=2),
-            date_range=json.dumps(date_range, indent=2)
-        )
-        
-        # Write output file
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        if chunk_size is not None:
+            if stages_file is not None:
+                raise ValueError("Chunked streaming does not support a separate stages table")
+            if resolve_input_format(csv_file_path, self.input_format) != 'csv':
+                raise ValueError("Chunked streaming only supports CSV input")
+            from .data_processor import ProjectDataProcessor
+            processor = ProjectDataProcessor(self.metrics)
+            self.generate_from_dataset_stream(processor.iter_datasets(csv_file_path, chunk_size), output_path)
+            return
+        
+        # Process the data (or reuse the cached result for an unchanged CSV)
+        hits_before = self.cache.hits if self.cache else 0
+        dataset, date_range = load_project_data(csv_file_path, self.cache, self.metrics, self.engine,
+                                                self.input_format, stages_file)
+        if self.cache:
+            cache_status = "hit" if self.cache.hits > hits_before else "miss"
+            logger.info(f"Processed data cache {cache_status}: {csv_file_path}")
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        output_file = self.write_file(dataset, date_range, output_path)
         
-        print(f"Gantt chart generated successfully: {output_file}")
-        print(f"Processed {len(project_data)} projects")
-        print(f"Date range: {date_range['min_date']} to {date_range['max_date']}")
+        self._report_output(output_file)
+        logger.info(f"Processed {len(dataset)} projects")
+        logger.info(f"Date range: {date_range['min_date']} to {date_range['max_date']}")
+        renderer = self.choose_renderer(len(dataset), dataset.stage_count)
+        self._report_renderer(renderer, len(dataset), dataset.stage_count)
     
-    def generate_from_processed_data(self, project_data: list, date_range: dict, output_path: str) -> None:
+    def generate_from_processed_data(self, project_data: Union[GanttDataset, list], date_range: dict, output_path: str) -> None:
         """
         Generate Gantt chart from already processed data
         
         Args:
-            project_data: List of processed project dictionaries
+            project_data: GanttDataset or list of processed project dictionaries
             date_range: Dictionary with min_date and max_date
             output_path: Path where the HTML file will be saved
         """
-        # Load template
-        with open(self.template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
+        output_file = self.write_file(project_data, date_range, output_path)
+        
+        self._report_output(output_file)
+    
+    def generate_from_dataset_stream(self, datasets: Iterable[GanttDataset], output_path: str) -> None:
+        """
+        Generate Gantt chart from a stream of processed dataset chunks
+        
+        Each chunk is serialized as soon as it arrives and spooled to a temporary
+        file while the date range is tracked incrementally, so memory stays bounded
+        by the chunk size. The output is identical to generate_chart() without chunks.
+        Streaming bypasses the processed-data cache, which would hold the whole dataset.
+        
+        Args:
+            datasets: Iterable of GanttDataset chunks, e.g. ProjectDataProcessor.iter_datasets()
+            output_path: Path where the HTML file will be saved
+        """
+        if self.payload_format != 'json':
+            raise ValueError("Streaming generation only supports the 'json' payload format")
+        
+        date_tracker = DateRangeTracker()
+        facet_builder = FacetIndexBuilder()
+        rollup_builder = RollupBuilder() if self.rollups else None
+        project_count = 0
+        stage_count = 0
+        
+        def record_batches() -> Iterator[list]:
+            nonlocal project_count, stage_count
+            for dataset in datasets:
+                if len(dataset) == 0:
+                    continue
+                # Yielding inside the phase also times serializing and spooling the batch
+                with self.metrics.phase('serialize'):
+                    date_tracker.update(dataset)
+                    facet_builder.update(dataset)
+                    if rollup_builder:
+                        rollup_builder.update(dataset)
+                    yield dataset.to_records()
+                project_count += len(dataset)
+                stage_count += dataset.stage_count
         
-        # Create Jinja2 template
-        template = Template(template_content)
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode='w+b') as spool:
+            for piece in iter_json_array(record_batches()):
+                spool.write(piece.encode('utf-8'))
+            date_range = date_tracker.date_range()
+            renderer = self.choose_renderer(project_count, stage_count)
+            
+            output_file = Path(output_path)
+            context = {
+                'date_range': json.dumps(date_range, indent=2),
+                'renderer': json.dumps(renderer),
+                'facet_index': render_facet_index(facet_builder.build()),
+                'rollups': render_rollups(rollup_builder.build() if rollup_builder else None)
+            }
+            head, tail = self._render_page(context, output_file)
+            
+            spool.seek(0)
+            chunks = itertools.chain([head], iter(lambda: spool.read(STREAM_CHUNK_BYTES), b''), [tail])
+            output_bytes = self._write_to_file(chunks, output_file, skip_unchanged=False)
+        self.metrics.count('bytes_rendered', output_bytes)
         
-        # Render template with data
-        html_content = template.render(
-            project_data=json.dumps(project_data, indent=2),
-            date_range=json.dumps(date_range, indent=2)
-        )
+        logger.info(f"Gantt chart generated successfully: {output_file}")
+        logger.info(f"Processed {project_count} projects")
+        logger.info(f"Date range: {date_range['min_date']} to {date_range['max_date']}")
+        self._report_renderer(renderer, project_count, stage_count)
+    
+    def iter_html(self, project_data: Union[GanttDataset, list], date_range: dict,
+                  output_path: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Render the chart page as a sequence of UTF-8 encoded chunks
+        
+        The page is rendered around the project data, which is serialized a batch
+        of projects at a time for the 'json' payload (see iter_project_data()), so
+        the whole page never has to be held in memory. Nothing is printed or logged.
+        
+        Args:
+            project_data: GanttDataset or list of processed project dictionaries
+            date_range: Dictionary with min_date and max_date
+            output_path: Where the page will be saved; required for the 'hashed'
+                bundle, whose script file is written next to it
+        """
+        renderer = self.choose_renderer(*dataset_size(project_data))
+        with self.metrics.phase('serialize'):
+            context = build_page_context(project_data, date_range, renderer, self.rollups)
+        head, tail = self._render_page(context, self._bundle_target(output_path))
+        rendered = len(head) + len(tail)
+        yield head
+        
+        payload = iter_project_data(project_data, self.payload_format)
+        while True:
+            with self.metrics.phase('serialize'):
+                chunk = next(payload, None)
+                if chunk is not None:
+                    chunk = chunk.encode('utf-8')
+            if chunk is None:
+                break
+            rendered += len(chunk)
+            yield chunk
+        
+        yield tail
+        self.metrics.count('bytes_rendered', rendered)
+    
+    def write_html(self, project_data: Union[GanttDataset, list], date_range: dict, stream: BinaryIO,
+                   output_path: Optional[str] = None) -> int:
+        """
+        Stream the chart page to a writable binary stream, e.g. a socket file or io.BytesIO
         
-        # Write output file
+        Returns:
+            Number of bytes written
+        """
+        written = self._write_chunks(self.iter_html(project_data, date_range, output_path), stream)
+        self.metrics.count('bytes_written', written)
+        return written
+    
+    def render_bytes(self, project_data: Union[GanttDataset, list], date_range: dict,
+                     output_path: Optional[str] = None) -> bytes:
+        """Render the chart page into memory and return its UTF-8 bytes"""
+        buffer = io.BytesIO()
+        self.write_html(project_data, date_range, buffer, output_path)
+        return buffer.getvalue()
+    
+    def write_file(self, project_data: Union[GanttDataset, list], date_range: dict, output_path: str) -> Path:
+        """
+        Stream the chart page into a file, atomically replacing any previous version
+        
+        The page is written to a temporary file in the output directory and renamed
+        over output_path, so readers see either the old or the new chart. With
+        caching enabled an identical existing file is kept; last_write_skipped
+        records whether that happened.
+        
+        Returns:
+            Path of the written file
+        """
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        self._write_to_file(self.iter_html(project_data, date_range, output_file), output_file, self.use_cache)
+        return output_file
+    
+    def render_to_file(self, context: Dict[str, str], output_path: str) -> Path:
+        """
+        Render the template with an already serialized context and write the HTML file
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        The shared scripts are bundled for the output location (see src/bundler.py).
+        The file is replaced atomically as in write_file(), and with caching enabled
+        an identical existing file is left untouched.
+        
+        Args:
+            context: Template context from build_template_context()
+            output_path: Path where the HTML file will be saved
         
-        print(f"Gantt chart generated successfully: {output_file}")
+        Returns:
+            Path of the written file
+        """
+        output_file = Path(output_path)
+        page_context = dict(context)
+        project_data = page_context.pop('project_data').encode('utf-8')
+        head, tail = self._render_page(page_context, output_file)
+        self.metrics.count('bytes_rendered', len(head) + len(project_data) + len(tail))
+        self._write_to_file([head, project_data, tail], output_file, self.use_cache)
+        return output_file
+    
+    def choose_renderer(self, project_count: int, stage_count: int) -> str:
+        """Renderer for a chart of this size: 'svg' or 'canvas'"""
+        return select_renderer(project_count, stage_count, self.renderer,
+                               self.canvas_min_projects, self.canvas_min_stages)
+    
+    def _report_renderer(self, renderer: str, project_count: int, stage_count: int) -> None:
+        """Note when a chart is drawn on a canvas rather than as individual elements"""
+        if renderer == 'canvas':
+            logger.info(f"Using canvas renderer ({project_count} projects, {stage_count} stages)")
+    
+    def _report_output(self, output_file: Path) -> None:
+        """Print where the chart went, noting when an identical file was left untouched"""
+        if self.last_write_skipped:
+            logger.info(f"Gantt chart unchanged, skipped rewriting: {output_file}")
+        else:
+            logger.info(f"Gantt chart generated successfully: {output_file}")
+    
+    def _bundle_target(self, output_path: Optional[str]) -> Path:
+        """Page location the shared scripts are bundled for"""
+        if output_path is not None:
+            return Path(output_path)
+        if self.bundle == 'hashed':
+            raise ValueError("The 'hashed' bundle needs the output path to write its script file next to")
+        return Path('.')
+    
+    def _render_page(self, context: Dict[str, str], output_file: Path) -> Tuple[bytes, bytes]:
+        """Render the template around a placeholder for the project data; returns the encoded parts before and after it"""
+        placeholder = f"__CQSS_PROJECT_DATA_{uuid.uuid4().hex}__"
+        with self.metrics.phase('render'):
+            html_content = self._load_template().render(
+                **context, project_data=placeholder, shared_assets=render_shared_assets(self.bundle, output_file))
+            head, tail = html_content.split(placeholder, 1)
+            return head.encode('utf-8'), tail.encode('utf-8')
+    
+    def _write_chunks(self, chunks: Iterable[bytes], stream: BinaryIO) -> int:
+        """Write chunks to a stream, timing each write; returns the bytes written"""
+        written = 0
+        for chunk in chunks:
+            with self.metrics.phase('write'):
+                stream.write(chunk)
+            written += len(chunk)
+        return written
+    
+    def _write_to_file(self, chunks: Iterable[bytes], output_file: Path, skip_unchanged: bool) -> int:
+        """Write chunks to output_file through an AtomicFile; returns the page size in bytes"""
+        atomic_file = AtomicFile(output_file, skip_unchanged)
+        with atomic_file as f:
+            size = self._write_chunks(chunks, f)
+        self.last_write_skipped = not atomic_file.replaced
+        self.metrics.count('bytes_written', size if atomic_file.replaced else 0)
+        return size
+    
+    def _load_template(self) -> Template:
+        """Get the compiled chart template from the shared environment"""
+        environment = get_template_environment(self.template_path.parent)
+        return environment.get_template(self.template_path.name)
 
 # Example usage and main function
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     generator = GanttChartGenerator()
     
     # Generate chart from sample data
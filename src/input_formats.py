@@ -0,0 +1,116 @@
+"""
+Input file formats for project data
+
+Besides CSV read by pandas, project tables can come as Parquet or Feather
+(Arrow IPC) files, or as CSV parsed by pyarrow. Parquet and Feather keep
+column types: timestamp and date columns arrive as datetime64, so no string
+to date conversion is needed. Every reader reads only the columns the
+processor asks for. pyarrow is optional and imported only when one of those formats
+is used; pandas likewise is imported on first read.
+"""
+
+from pathlib import Path
+from typing import Callable, Iterable, List
+
+INPUT_FORMATS = ['auto', 'csv', 'arrow-csv', 'parquet', 'feather']
+
+# Format chosen by 'auto' for each file extension; anything else is read as CSV
+EXTENSION_FORMATS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+    '.ipc': 'feather'
+}
+
+# Picks the columns to read from the file's column names
+ColumnSelector = Callable[[List[str]], List[str]]
+
+
+def resolve_input_format(file_path: str, input_format: str = 'auto') -> str:
+    """The concrete format of a file: input_format itself, or the one its extension implies"""
+    if input_format not in INPUT_FORMATS:
+        raise ValueError(f"Unknown input format '{input_format}'. Must be one of {INPUT_FORMATS}")
+    if input_format != 'auto':
+        return input_format
+    if hasattr(file_path, 'read'):
+        # File objects, e.g. the in-memory CSV of changed rows in watch mode
+        return 'csv'
+    return EXTENSION_FORMATS.get(Path(file_path).suffix.lower(), 'csv')
+
+
+def _import_pyarrow(input_format: str):
+    try:
+        import pyarrow
+    except ImportError:
+        raise ValueError(f"Reading {input_format} input requires pyarrow (pip install pyarrow)")
+    return pyarrow
+
+
+def _column_names(file_path: str, input_format: str) -> List[str]:
+    """Column names of a file, read from its header or schema only"""
+    if input_format == 'csv':
+        import pandas as pd
+        if hasattr(file_path, 'seek'):
+            # Rewind a file object so the full read starts at the header again
+            position = file_path.tell()
+            columns = pd.read_csv(file_path, nrows=0).columns.tolist()
+            file_path.seek(position)
+            return columns
+        return pd.read_csv(file_path, nrows=0).columns.tolist()
+    _import_pyarrow(input_format)
+    if input_format == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.read_schema(file_path).names
+    if input_format == 'feather':
+        import pyarrow.ipc as ipc
+        with ipc.open_file(file_path) as reader:
+            return reader.schema.names
+    import pyarrow.csv as pa_csv
+    with pa_csv.open_csv(file_path) as reader:
+        return reader.schema.names
+
+
+def read_table(file_path: str, input_format: str = 'auto', select_columns: ColumnSelector = None,
+               text_columns: Iterable[str] = (), date_columns: Iterable[str] = ()):
+    """
+    Read a project table into a pandas DataFrame
+
+    Args:
+        file_path: Path to the input file
+        input_format: One of INPUT_FORMATS; 'auto' goes by the file extension
+        select_columns: Called with the file's column names, returns the ones to
+            read (in file order); by default every column is read
+        text_columns: Columns of a CSV file read as strings even when every value
+            looks like a number; typed formats keep their stored types
+        date_columns: Columns of an Arrow CSV file read as strings and left to the
+            processor's date parsing, like the pandas CSV reader does; pyarrow would
+            convert dates with a UTC offset to UTC instead of keeping their wall-clock time
+    """
+    input_format = resolve_input_format(file_path, input_format)
+    columns = None
+    if select_columns is not None:
+        columns = select_columns(_column_names(file_path, input_format))
+
+    if input_format == 'csv':
+        import pandas as pd
+        return pd.read_csv(file_path, usecols=columns, dtype={column: str for column in text_columns})
+
+    _import_pyarrow(input_format)
+    if input_format == 'parquet':
+        import pyarrow.parquet as pq
+        table = pq.read_table(file_path, columns=columns)
+    elif input_format == 'feather':
+        import pyarrow.feather as feather
+        table = feather.read_table(file_path, columns=columns)
+    else:
+        import pyarrow
+        import pyarrow.csv as pa_csv
+        string_columns = {column: pyarrow.string() for column in [*text_columns, *date_columns]}
+        # Empty cells are missing values, as they are for pandas
+        convert_options = pa_csv.ConvertOptions(include_columns=columns, column_types=string_columns,
+                                                strings_can_be_null=True)
+        table = pa_csv.read_csv(file_path, convert_options=convert_options)
+    # Date columns become datetime64 rather than objects holding datetime.date
+    return table.to_pandas(date_as_object=False)
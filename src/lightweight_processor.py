@@ -0,0 +1,233 @@
+"""
+Pandas-free ingestion for small CSV files
+
+Importing pandas takes several hundred milliseconds, far longer than
+processing a few thousand rows. LightweightProcessor reads the file with the
+csv module and parses dates with datetime.fromisoformat, and builds exactly the
+GanttDataset ProjectDataProcessor would. It only accepts input it can
+reproduce exactly: cells pandas would read differently (empty text, non-ISO
+dates, fractional progress, ...) and invalid files raise UnsupportedInput, and
+the caller falls back to ProjectDataProcessor, which also reports the errors.
+"""
+
+import csv
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .metrics import PipelineMetrics
+from .models import CategoricalColumn, GanttDataset
+
+# Files up to this size are read without pandas by default; beyond roughly twice
+# this, the vectorized pandas path wins even counting its import (see
+# benchmarks/bench_cold_start.py)
+LIGHTWEIGHT_MAX_BYTES = 2 * 1024 * 1024
+
+LEGACY_COLUMNS = [
+    'project_name', 'category', 'priority', 'preparing_start',
+    'preparing_end', 'execution_end', 'progress_percent',
+    'description', 'team_lead'
+]
+MULTISTAGE_COLUMNS = ['project_name', 'category', 'priority', 'description', 'team_lead', 'stages']
+TEXT_COLUMNS = ['project_name', 'category', 'priority', 'description', 'team_lead']
+VALID_STATUSES = ['normal', 'critical', 'warning', 'completed', 'delayed']
+
+# Cells pandas.read_csv reads as missing values by default
+_NA_VALUES = {
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+}
+_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_DATETIME = re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}')
+_INTEGER = re.compile(r'[+-]?\d+')
+
+
+class UnsupportedInput(Exception):
+    """The file needs the pandas processor, either to read it faithfully or to report its errors"""
+
+
+class LightweightProcessor:
+    """
+    Loads small CSV files into a GanttDataset using only the standard library and numpy
+    """
+
+    def __init__(self, metrics: Optional[PipelineMetrics] = None):
+        self.metrics = metrics if metrics is not None else PipelineMetrics()
+        # Epoch seconds of every date string seen; portfolios reuse few distinct dates
+        self._epochs: Dict[str, int] = {}
+
+    def load_dataset(self, file_path: str) -> GanttDataset:
+        """Load, validate and process a CSV file, or raise UnsupportedInput"""
+        with self.metrics.phase('load'):
+            columns = self._read_columns(file_path)
+        with self.metrics.phase('validate'):
+            for column in TEXT_COLUMNS:
+                self._check_text(columns, column)
+            if 'stages' in columns:
+                stages = self._parse_stages(columns['stages'])
+            else:
+                stages = self._legacy_stages(columns)
+        with self.metrics.phase('process'):
+            dataset = self._build_dataset(columns, stages)
+        self.metrics.count('rows', len(dataset))
+        self.metrics.count('stages', dataset.stage_count)
+        return dataset
+
+    def _read_columns(self, file_path: str) -> Dict[str, List[str]]:
+        """Read the file into a list of raw cells per column"""
+        try:
+            with open(file_path, newline='', encoding='utf-8-sig') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                # Blank lines are skipped, as pandas does
+                rows = [row for row in reader if row]
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise UnsupportedInput(str(e))
+
+        if not header or not rows:
+            raise UnsupportedInput("No rows")
+        if len(set(header)) != len(header) or '' in header:
+            raise UnsupportedInput("Blank or duplicate column names")
+        required = MULTISTAGE_COLUMNS if 'stages' in header else LEGACY_COLUMNS
+        if not set(required) <= set(header):
+            raise UnsupportedInput("Missing required columns")
+        if any(len(row) != len(header) for row in rows):
+            raise UnsupportedInput("Ragged rows")
+
+        return {name: [row[position] for row in rows] for position, name in enumerate(header)}
+
+    def _check_text(self, columns: Dict[str, List[str]], column: str) -> None:
+        """Text columns must read as plain strings: no missing cells (pandas reads them as strings too)"""
+        values = columns[column]
+        if any(value in _NA_VALUES or '\r' in value for value in values):
+            raise UnsupportedInput(f"Missing values in column '{column}'")
+
+    def _epoch_seconds(self, value: Any) -> int:
+        """Epoch seconds of a naive ISO date or date-time string"""
+        if not isinstance(value, str):
+            # JSON stages may hold any value here, including unhashable lists and dicts
+            raise UnsupportedInput(f"Unsupported date {value!r}")
+        epoch = self._epochs.get(value)
+        if epoch is None:
+            if not (_DATE.fullmatch(value) or _DATETIME.fullmatch(value)):
+                raise UnsupportedInput(f"Unsupported date '{value}'")
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError as e:
+                raise UnsupportedInput(str(e))
+            epoch = int(parsed.replace(tzinfo=timezone.utc).timestamp())
+            self._epochs[value] = epoch
+        return epoch
+
+    def _legacy_column_epochs(self, values: List[str]) -> List[int]:
+        """Epoch seconds of a legacy date column, which pandas parses with one format inferred from its first cell"""
+        shape = (len(values[0]), values[0][10:11])
+        if any((len(value), value[10:11]) != shape for value in values):
+            raise UnsupportedInput("Mixed date formats")
+        return [self._epoch_seconds(value) for value in values]
+
+    def _legacy_stages(self, columns: Dict[str, List[str]]) -> Dict[str, List[Any]]:
+        """Preparing and Execution stage columns of legacy rows, interleaved per project"""
+        preparing_start = self._legacy_column_epochs(columns['preparing_start'])
+        preparing_end = self._legacy_column_epochs(columns['preparing_end'])
+        execution_end = self._legacy_column_epochs(columns['execution_end'])
+
+        progress_cells = columns['progress_percent']
+        if not all(_INTEGER.fullmatch(value) for value in progress_cells):
+            raise UnsupportedInput("Progress is not an integer column")
+        progress = [int(value) for value in progress_cells]
+        if not all(0 <= value <= 100 for value in progress):
+            raise UnsupportedInput("Progress out of range")
+
+        row_count = len(progress)
+        statuses = {}
+        for status_column in ['preparing_status', 'execution_status']:
+            values = columns.get(status_column, ['normal'] * row_count)
+            if not all(value in VALID_STATUSES for value in values):
+                raise UnsupportedInput(f"Invalid values in column '{status_column}'")
+            statuses[status_column] = values
+
+        if not all(start < middle < end for start, middle, end in zip(preparing_start, preparing_end, execution_end)):
+            raise UnsupportedInput("Stage dates out of order")
+
+        def interleave(first: List[Any], second: List[Any]) -> List[Any]:
+            return [value for pair in zip(first, second) for value in pair]
+
+        return {
+            'bounds': list(range(0, 2 * row_count + 1, 2)),
+            'names': CategoricalColumn(np.tile([0, 1], row_count), ['Preparing', 'Execution']),
+            'starts': interleave(preparing_start, preparing_end),
+            'ends': interleave(preparing_end, execution_end),
+            # Preparing stage is always complete if execution has started
+            'progress': interleave([100] * row_count, progress),
+            'statuses': interleave(statuses['preparing_status'], statuses['execution_status'])
+        }
+
+    def _parse_stages(self, cells: List[str]) -> Dict[str, List[Any]]:
+        """Decode and check every stages cell, flattening the stages into columns"""
+        bounds = [0]
+        names, starts, ends, progress, statuses = [], [], [], [], []
+        for cell in cells:
+            try:
+                stages = json.loads(cell)
+            except ValueError as e:
+                raise UnsupportedInput(str(e))
+            if not isinstance(stages, list) or not stages:
+                raise UnsupportedInput("Stages must be a non-empty list")
+            for stage in stages:
+                if not isinstance(stage, dict) or not isinstance(stage.get('name'), str):
+                    raise UnsupportedInput("Malformed stage")
+                value = stage.get('progress')
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 <= value <= 100:
+                    raise UnsupportedInput("Progress out of range")
+                status = stage.get('status', 'normal')
+                if status not in VALID_STATUSES:
+                    raise UnsupportedInput("Invalid status")
+                start = self._epoch_seconds(stage.get('start'))
+                end = self._epoch_seconds(stage.get('end'))
+                if start >= end:
+                    raise UnsupportedInput("Stage dates out of order")
+                names.append(stage['name'])
+                starts.append(start)
+                ends.append(end)
+                progress.append(int(value))
+                statuses.append(status)
+            bounds.append(len(starts))
+
+        return {
+            'bounds': bounds,
+            'names': CategoricalColumn.from_values(names),
+            'starts': starts,
+            'ends': ends,
+            'progress': progress,
+            'statuses': statuses
+        }
+
+    def _build_dataset(self, columns: Dict[str, List[str]], stages: Dict[str, List[Any]]) -> GanttDataset:
+        """Assemble the dataset from the checked project and stage columns"""
+        return GanttDataset(
+            project_labels=list(range(len(columns['project_name']))),
+            names=columns['project_name'],
+            descriptions=columns['description'],
+            categories=CategoricalColumn.from_values(columns['category']),
+            priorities=CategoricalColumn.from_values(columns['priority']),
+            team_leads=CategoricalColumn.from_values(columns['team_lead']),
+            stage_bounds=np.asarray(stages['bounds'], dtype=np.int64),
+            stage_names=stages['names'],
+            stage_starts=np.asarray(stages['starts'], dtype=np.int64),
+            stage_ends=np.asarray(stages['ends'], dtype=np.int64),
+            stage_progress=np.asarray(stages['progress'], dtype=np.int64),
+            stage_statuses=CategoricalColumn.from_values(stages['statuses'])
+        )
+
+
+def prefers_lightweight(file_path: str, max_bytes: int = LIGHTWEIGHT_MAX_BYTES) -> bool:
+    """Whether a file is small enough that skipping the pandas import pays off"""
+    try:
+        return Path(file_path).stat().st_size <= max_bytes
+    except OSError:
+        return False
@@ -0,0 +1,130 @@
+"""
+Pipeline metrics for chart generation
+
+ProjectDataProcessor and GanttChartGenerator accept a PipelineMetrics object
+and report every phase they run to it: wall time, optionally the tracemalloc
+peak, plus counters for rows and stages processed and bytes rendered and
+written. A callback sees each phase as it finishes; to_dict() and write_json()
+give the totals for tooling. profiled() wraps any block in cProfile.
+"""
+
+import cProfile
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Signature of the per-phase callback: phase name and that run's measurements
+PhaseCallback = Callable[[str, Dict[str, Any]], None]
+
+
+class PipelineMetrics:
+    """
+    Per-phase timings and counters for one or more generation runs
+
+    A phase that runs more than once, e.g. per chunk while streaming, accumulates
+    its time and keeps the highest memory peak. With trace_memory, tracemalloc is
+    started on first use; its peak is process-wide, so phases running concurrently
+    on other threads count towards each other's peaks.
+    """
+
+    def __init__(self, callback: Optional[PhaseCallback] = None, trace_memory: bool = False):
+        self.callback = callback
+        self.trace_memory = trace_memory
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self.counters: Dict[str, int] = {}
+        self.children: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one run of the named phase"""
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            run = {'seconds': time.perf_counter() - start}
+            if self.trace_memory:
+                run['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            self._record(name, run)
+
+    def _record(self, name: str, run: Dict[str, Any]) -> None:
+        with self._lock:
+            totals = self.phases.setdefault(name, {'seconds': 0.0, 'calls': 0})
+            totals['seconds'] += run['seconds']
+            totals['calls'] += 1
+            if 'peak_bytes' in run:
+                totals['peak_bytes'] = max(totals.get('peak_bytes', 0), run['peak_bytes'])
+        if self.callback:
+            self.callback(name, run)
+
+    def count(self, name: str, value: int) -> None:
+        """Add value to the named counter, e.g. 'rows', 'stages' or 'bytes_written'"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + int(value)
+
+    def add_child(self, name: str, metrics: Dict[str, Any]) -> None:
+        """Attach the to_dict() of a run measured elsewhere, e.g. one style rendered in a worker"""
+        with self._lock:
+            self.children[name] = metrics
+
+    @property
+    def total_seconds(self) -> float:
+        """Time spent in all recorded phases"""
+        return sum(totals['seconds'] for totals in self.phases.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain, JSON-serializable view of everything recorded"""
+        with self._lock:
+            result = {
+                'phases': {name: dict(totals) for name, totals in self.phases.items()},
+                'counters': dict(self.counters),
+                'total_seconds': sum(totals['seconds'] for totals in self.phases.values())
+            }
+            if self.children:
+                result['children'] = dict(self.children)
+        return result
+
+    def write_json(self, path: str) -> None:
+        """Write to_dict() to a JSON file"""
+        output_path = Path(path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(self.to_dict(), indent=2) + '\n', encoding='utf-8')
+
+    def summary(self) -> str:
+        """One line per phase with its time and share of the total, for printing"""
+        total = self.total_seconds or 1.0
+        lines = []
+        for name, totals in self.phases.items():
+            line = f"{name:<14} {totals['seconds']:>8.3f}s {totals['seconds'] / total:>6.1%}"
+            if totals['calls'] > 1:
+                line += f"  x{totals['calls']}"
+            if 'peak_bytes' in totals:
+                line += f"  peak {totals['peak_bytes'] / (1024 * 1024):.1f}MB"
+            lines.append(line)
+        lines.append(f"{'total':<14} {self.total_seconds:>8.3f}s")
+        lines.extend(f"{name:<14} {value:>9,}" for name, value in self.counters.items())
+        return '\n'.join(lines)
+
+
+@contextmanager
+def profiled(output_path: Optional[str]) -> Iterator[None]:
+    """Run the enclosed block under cProfile and dump the stats to output_path (no-op when None)"""
+    if output_path is None:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(output_path)
@@ -0,0 +1,289 @@
+"""
+Compact columnar model for processed Gantt chart data
+
+Projects and stages are stored as parallel arrays instead of nested dicts of
+ISO strings. Low-cardinality strings are dictionary-encoded, dates are integer
+epoch seconds, and the overall date range is known as soon as the dataset is
+built. The template's JSON shape is only produced at the edge, via
+GanttDataset.to_records().
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+import numpy as np
+
+SECONDS_PER_DAY = 86400
+
+# Part of the processed-data cache key; bump whenever processing output changes
+PROCESSOR_VERSION = "1"
+
+# Projects turned into template records at a time by GanttDataset.iter_record_batches()
+RECORD_BATCH_SIZE = 5000
+
+
+def format_epoch_seconds(seconds: np.ndarray) -> List[str]:
+    """Format epoch seconds as naive ISO strings ('YYYY-MM-DDTHH:MM:SS')"""
+    if len(seconds) == 0:
+        return []
+    # Portfolios reuse a few hundred distinct dates, so format each one once
+    uniques, inverse = np.unique(seconds, return_inverse=True)
+    formatted = np.datetime_as_string(uniques.astype('datetime64[s]'), unit='s')
+    return formatted[inverse.ravel()].tolist()
+
+
+def isoformat_epoch_seconds(seconds: int) -> str:
+    """Format a single epoch second value as a naive ISO string"""
+    return datetime.fromtimestamp(int(seconds), tz=timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def parse_epoch_seconds(value: str) -> int:
+    """Parse an ISO date string as naive epoch seconds of its wall-clock time"""
+    return int(datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp())
+
+
+class CategoricalColumn:
+    """
+    Dictionary-encoded column: each distinct value is stored once and rows refer to it by code
+    """
+    __slots__ = ('codes', 'values')
+
+    def __init__(self, codes: np.ndarray, values: Sequence[Any]):
+        self.codes = np.asarray(codes, dtype=np.int32)
+        self.values = list(values)
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]) -> 'CategoricalColumn':
+        """Dictionary-encode plain values, keeping first-seen order"""
+        lookup: Dict[Any, int] = {}
+        codes = [lookup.setdefault(value, len(lookup)) for value in values]
+        return cls(np.asarray(codes, dtype=np.int32), list(lookup))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def decode(self) -> List[Any]:
+        """Return the column as a plain list of values"""
+        values = self.values
+        return [values[code] for code in self.codes.tolist()]
+
+
+class DateRangeTracker:
+    """
+    Running min/max of stage dates across a stream of GanttDataset chunks
+    """
+    __slots__ = ('min_start', 'max_end')
+
+    def __init__(self):
+        self.min_start = None
+        self.max_end = None
+
+    def update(self, dataset: 'GanttDataset') -> None:
+        """Widen the range to cover dataset"""
+        if dataset.min_start is None:
+            return
+        if self.min_start is None or dataset.min_start < self.min_start:
+            self.min_start = dataset.min_start
+        if self.max_end is None or dataset.max_end > self.max_end:
+            self.max_end = dataset.max_end
+
+    def date_range(self) -> Dict[str, str]:
+        """Overall date range seen so far, in the same shape as get_date_range()"""
+        if self.min_start is None:
+            raise ValueError("Cannot compute the date range of an empty dataset")
+        return {
+            'min_date': isoformat_epoch_seconds(self.min_start),
+            'max_date': isoformat_epoch_seconds(self.max_end)
+        }
+
+
+def _record_label(project_id: str) -> Any:
+    """Recover the row label from a 'project_<label>' id"""
+    label = project_id[len('project_'):] if project_id.startswith('project_') else project_id
+    return int(label) if label.lstrip('-').isdigit() else label
+
+
+class GanttDataset:
+    """
+    Processed projects and their stages held as parallel arrays
+
+    Project columns have one entry per project; stage columns have one entry per
+    stage, with the stages of project i at positions stage_bounds[i]:stage_bounds[i + 1].
+    Stage dates are epoch seconds (naive, sub-second precision dropped).
+    """
+    __slots__ = (
+        'project_labels', 'names', 'descriptions', 'categories', 'priorities',
+        'team_leads', 'total_duration_days', 'stage_bounds', 'stage_names',
+        'stage_starts', 'stage_ends', 'stage_duration_days', 'stage_progress',
+        'stage_statuses', 'min_start', 'max_end'
+    )
+
+    def __init__(self, project_labels: List[Any], names: List[Any], descriptions: List[Any],
+                 categories: CategoricalColumn, priorities: CategoricalColumn,
+                 team_leads: CategoricalColumn, stage_bounds: np.ndarray,
+                 stage_names: CategoricalColumn, stage_starts: np.ndarray,
+                 stage_ends: np.ndarray, stage_progress: np.ndarray,
+                 stage_statuses: CategoricalColumn):
+        self.project_labels = project_labels
+        self.names = names
+        self.descriptions = descriptions
+        self.categories = categories
+        self.priorities = priorities
+        self.team_leads = team_leads
+        self.stage_bounds = np.asarray(stage_bounds, dtype=np.int64)
+        self.stage_names = stage_names
+        self.stage_starts = np.asarray(stage_starts, dtype=np.int64)
+        self.stage_ends = np.asarray(stage_ends, dtype=np.int64)
+        self.stage_progress = np.asarray(stage_progress, dtype=np.int32)
+        self.stage_statuses = stage_statuses
+
+        # Derived columns and the overall date range, computed once while building
+        self.stage_duration_days = (self.stage_ends - self.stage_starts) // SECONDS_PER_DAY
+        if len(self.stage_starts) > 0:
+            first_stages = self.stage_bounds[:-1]
+            project_starts = np.minimum.reduceat(self.stage_starts, first_stages)
+            project_ends = np.maximum.reduceat(self.stage_ends, first_stages)
+            self.total_duration_days = (project_ends - project_starts) // SECONDS_PER_DAY
+            self.min_start = int(self.stage_starts.min())
+            self.max_end = int(self.stage_ends.max())
+        else:
+            self.total_duration_days = np.zeros(0, dtype=np.int64)
+            self.min_start = None
+            self.max_end = None
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> 'GanttDataset':
+        """Build a dataset from project dicts in the template's JSON shape"""
+        stages = [stage for record in records for stage in record['stages']]
+        return cls(
+            project_labels=[_record_label(record['id']) for record in records],
+            names=[record['name'] for record in records],
+            descriptions=[record['description'] for record in records],
+            categories=CategoricalColumn.from_values(record['category'] for record in records),
+            priorities=CategoricalColumn.from_values(record['priority'] for record in records),
+            team_leads=CategoricalColumn.from_values(record['team_lead'] for record in records),
+            stage_bounds=np.cumsum([0] + [len(record['stages']) for record in records]),
+            stage_names=CategoricalColumn.from_values(stage['name'] for stage in stages),
+            stage_starts=np.asarray([parse_epoch_seconds(stage['start']) for stage in stages], dtype=np.int64),
+            stage_ends=np.asarray([parse_epoch_seconds(stage['end']) for stage in stages], dtype=np.int64),
+            stage_progress=np.asarray([stage['progress_percent'] for stage in stages], dtype=np.int32),
+            stage_statuses=CategoricalColumn.from_values(stage['status'] for stage in stages)
+        )
+
+    def __len__(self) -> int:
+        return len(self.project_labels)
+
+    @property
+    def stage_count(self) -> int:
+        """Total number of stages across all projects"""
+        return len(self.stage_starts)
+
+    def date_range(self) -> Dict[str, str]:
+        """Overall date range for the chart, in the same shape as get_date_range()"""
+        if self.min_start is None:
+            raise ValueError("Cannot compute the date range of an empty dataset")
+        return {
+            'min_date': isoformat_epoch_seconds(self.min_start),
+            'max_date': isoformat_epoch_seconds(self.max_end)
+        }
+
+    def select(self, positions: Sequence[int]) -> 'GanttDataset':
+        """Dataset holding only the projects at the given positions, in that order, with all their stages"""
+        positions = np.asarray(positions, dtype=np.int64)
+        first_stages = self.stage_bounds[positions]
+        counts = self.stage_bounds[positions + 1] - first_stages
+        bounds = np.concatenate([[0], np.cumsum(counts)])
+        # Stage positions of every selected project, project by project
+        stage_positions = np.arange(bounds[-1]) + np.repeat(first_stages - bounds[:-1], counts)
+
+        def pick(values: List[Any]) -> List[Any]:
+            return [values[position] for position in positions.tolist()]
+
+        def pick_codes(column: CategoricalColumn, rows: np.ndarray) -> CategoricalColumn:
+            return CategoricalColumn(column.codes[rows], column.values)
+
+        return GanttDataset(
+            project_labels=pick(self.project_labels),
+            names=pick(self.names),
+            descriptions=pick(self.descriptions),
+            categories=pick_codes(self.categories, positions),
+            priorities=pick_codes(self.priorities, positions),
+            team_leads=pick_codes(self.team_leads, positions),
+            stage_bounds=bounds,
+            stage_names=pick_codes(self.stage_names, stage_positions),
+            stage_starts=self.stage_starts[stage_positions],
+            stage_ends=self.stage_ends[stage_positions],
+            stage_progress=self.stage_progress[stage_positions],
+            stage_statuses=pick_codes(self.stage_statuses, stage_positions)
+        )
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield each project in the template's JSON shape"""
+        for batch in self.iter_record_batches():
+            yield from batch
+
+    def iter_record_batches(self, batch_size: int = RECORD_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the projects in the template's JSON shape, batch_size projects at a time
+
+        Stage strings are only formatted for the batch being built, so memory is
+        bounded by the batch rather than the whole dataset.
+        """
+        bounds = self.stage_bounds.tolist()
+        for first_project in range(0, len(self), batch_size):
+            last_project = min(first_project + batch_size, len(self))
+            yield self._records(first_project, last_project, bounds)
+
+    def _records(self, first_project: int, last_project: int, bounds: List[int]) -> List[Dict[str, Any]]:
+        """Project records for positions first_project:last_project"""
+        offset = bounds[first_project]
+        stage_slice = slice(offset, bounds[last_project])
+        stage_names = self.stage_names.values
+        stage_statuses = self.stage_statuses.values
+        stages = [
+            {
+                'name': stage_names[name],
+                'start': start,
+                'end': end,
+                'duration_days': duration,
+                'progress_percent': progress,
+                'status': stage_statuses[status]
+            }
+            for name, start, end, duration, progress, status in zip(
+                self.stage_names.codes[stage_slice].tolist(),
+                format_epoch_seconds(self.stage_starts[stage_slice]),
+                format_epoch_seconds(self.stage_ends[stage_slice]),
+                self.stage_duration_days[stage_slice].tolist(),
+                self.stage_progress[stage_slice].tolist(),
+                self.stage_statuses.codes[stage_slice].tolist()
+            )
+        ]
+
+        categories = self.categories.values
+        priorities = self.priorities.values
+        team_leads = self.team_leads.values
+        project_slice = slice(first_project, last_project)
+        columns = zip(
+            self.project_labels[project_slice], self.names[project_slice],
+            self.categories.codes[project_slice].tolist(), self.priorities.codes[project_slice].tolist(),
+            self.descriptions[project_slice], self.team_leads.codes[project_slice].tolist(),
+            bounds[first_project:last_project], bounds[first_project + 1:last_project + 1],
+            self.total_duration_days[project_slice].tolist()
+        )
+        return [
+            {
+                'id': f"project_{label}",
+                'name': name,
+                'category': categories[category],
+                'priority': priorities[priority],
+                'description': description,
+                'team_lead': team_leads[team_lead],
+                'stages': stages[first - offset:last - offset],
+                'total_duration_days': total
+            }
+            for label, name, category, priority, description, team_lead, first, last, total in columns
+        ]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Return all projects in the template's JSON shape"""
+        return list(self.iter_records())
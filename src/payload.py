@@ -0,0 +1,162 @@
+"""
+Serialization of processed project data into the payload embedded in chart pages
+
+The 'json' format is the original pretty-printed list of project dicts. The
+'compact' format is a columnar payload: low-cardinality strings are dictionary-
+encoded, dates are offsets from the range start, and derived fields (stage
+durations, project totals) are recomputed in the browser. 'compact-gzip'
+additionally gzips and base64-encodes the compact payload. Both compact formats
+are decoded by templates/shared/payload-decoder.js, which is inlined into the
+page so templates still receive the same projectData array.
+
+iter_project_data() yields the same text in pieces; for 'json' the records are
+serialized a batch at a time, so the full payload string never has to exist.
+"""
+
+import base64
+import gzip
+import json
+import math
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+import numpy as np
+
+from .models import RECORD_BATCH_SIZE, SECONDS_PER_DAY, GanttDataset
+
+PAYLOAD_FORMATS = ['json', 'compact', 'compact-gzip']
+
+DECODER_PATH = Path(__file__).parent.parent / 'templates' / 'shared' / 'payload-decoder.js'
+
+# Bump when the compact layout changes; the decoder rejects unknown versions
+COMPACT_PAYLOAD_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def _decoder_source() -> str:
+    """Source of the shared payload decoder, read once per process"""
+    return DECODER_PATH.read_text(encoding='utf-8')
+
+
+def _json_safe(values: List[Any]) -> List[Any]:
+    """Replace float NaN (missing CSV cells) with None so the payload is strict JSON"""
+    return [None if isinstance(value, float) and math.isnan(value) else value for value in values]
+
+
+def encode_compact_payload(dataset: GanttDataset) -> Dict[str, Any]:
+    """Build the columnar, dictionary-encoded payload for a dataset"""
+    if dataset.min_start is not None:
+        base = dataset.min_start
+        starts = dataset.stage_starts - base
+        ends = dataset.stage_ends - base
+        # Dates are normally whole days; fall back to seconds when a time of day is present
+        unit = SECONDS_PER_DAY if not (starts % SECONDS_PER_DAY).any() and not (ends % SECONDS_PER_DAY).any() else 1
+        starts //= unit
+        ends //= unit
+    else:
+        base, unit = 0, SECONDS_PER_DAY
+        starts = ends = dataset.stage_starts
+
+    # Row labels are usually a contiguous range (project_0, project_1, ...)
+    labels = dataset.project_labels
+    first_label = labels[0] if labels else 0
+    if isinstance(first_label, int) and labels == list(range(first_label, first_label + len(labels))):
+        ids: Any = {'range_start': first_label}
+    else:
+        ids = _json_safe(labels)
+
+    return {
+        'version': COMPACT_PAYLOAD_VERSION,
+        'base': base,
+        'unit': unit,
+        'dicts': {
+            'category': _json_safe(dataset.categories.values),
+            'priority': _json_safe(dataset.priorities.values),
+            'team_lead': _json_safe(dataset.team_leads.values),
+            'stage_name': _json_safe(dataset.stage_names.values),
+            'status': _json_safe(dataset.stage_statuses.values)
+        },
+        'projects': {
+            'id': ids,
+            'name': _json_safe(dataset.names),
+            'description': _json_safe(dataset.descriptions),
+            'category': dataset.categories.codes.tolist(),
+            'priority': dataset.priorities.codes.tolist(),
+            'team_lead': dataset.team_leads.codes.tolist(),
+            'stage_count': np.diff(dataset.stage_bounds).tolist()
+        },
+        'stages': {
+            'name': dataset.stage_names.codes.tolist(),
+            'start': starts.tolist(),
+            'end': ends.tolist(),
+            'progress': dataset.stage_progress.tolist(),
+            'status': dataset.stage_statuses.codes.tolist()
+        }
+    }
+
+
+def render_project_data(project_data: Union[GanttDataset, list], payload_format: str = 'json') -> str:
+    """
+    Serialize project data as the JavaScript expression substituted for {{ project_data }}
+
+    Every format evaluates to the same array of project objects in the browser.
+    """
+    if payload_format not in PAYLOAD_FORMATS:
+        raise ValueError(f"Unknown payload format '{payload_format}'. Must be one of {PAYLOAD_FORMATS}")
+
+    if payload_format == 'json':
+        if isinstance(project_data, GanttDataset):
+            project_data = project_data.to_records()
+        return json.dumps(project_data, indent=2)
+
+    if not isinstance(project_data, GanttDataset):
+        project_data = GanttDataset.from_records(project_data)
+    compact_json = json.dumps(encode_compact_payload(project_data), separators=(',', ':'), allow_nan=False)
+
+    if payload_format == 'compact-gzip':
+        compressed = gzip.compress(compact_json.encode('utf-8'), compresslevel=6, mtime=0)
+        payload_literal = json.dumps(base64.b64encode(compressed).decode('ascii'))
+    else:
+        # The payload sits inside a <script> element
+        payload_literal = compact_json.replace('</', '<\\/')
+
+    return f"(function() {{\n{_decoder_source()}\nreturn window.CQSS_PayloadDecoder.decode({payload_literal});\n}})()"
+
+
+def iter_json_array(batches: Iterable[List[Any]]) -> Iterator[str]:
+    """
+    Serialize batches of items as one JSON array, piece by piece
+
+    The joined pieces equal json.dumps(all_items, indent=2).
+    """
+    empty = True
+    for batch in batches:
+        if not batch:
+            continue
+        # json.dumps(list, indent=2) of a batch is "[\n<items>\n]"; keep only the items
+        yield ("[\n" if empty else ",\n") + json.dumps(batch, indent=2)[2:-2]
+        empty = False
+    yield "[]" if empty else "\n]"
+
+
+def iter_project_data(project_data: Union[GanttDataset, list], payload_format: str = 'json',
+                      batch_size: int = RECORD_BATCH_SIZE) -> Iterator[str]:
+    """
+    Yield render_project_data() in pieces
+
+    The 'json' format is serialized batch_size projects at a time. The compact
+    formats are columnar and encoded as a whole, so they come as a single piece.
+    """
+    if payload_format not in PAYLOAD_FORMATS:
+        raise ValueError(f"Unknown payload format '{payload_format}'. Must be one of {PAYLOAD_FORMATS}")
+
+    if payload_format != 'json':
+        yield render_project_data(project_data, payload_format)
+        return
+
+    if isinstance(project_data, GanttDataset):
+        batches = project_data.iter_record_batches(batch_size)
+    else:
+        batches = (project_data[start:start + batch_size] for start in range(0, len(project_data), batch_size))
+    yield from iter_json_array(batches)
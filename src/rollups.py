@@ -0,0 +1,117 @@
+"""
+Summary bars for the zoomed-out (grouped) chart view
+
+A rollup is one bar per category or team lead spanning the earliest start to
+the latest end of its projects, with their duration-weighted progress. The
+browser shows the rollups as collapsed rows and expands a group into its
+projects on demand (the group's members come from the facet index).
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from .facets import project_facets
+from .models import GanttDataset, isoformat_epoch_seconds
+from .payload import _json_safe
+
+# Facets projects can be grouped by
+ROLLUP_FACETS = ['category', 'team_lead']
+
+
+def project_progress_weights(dataset: GanttDataset):
+    """
+    Per-project start, end, progress weight and weighted progress
+
+    Each stage weighs its length in days (at least one), so a project's
+    progress is its stages' progress averaged by duration.
+    """
+    first_stages = dataset.stage_bounds[:-1]
+    weights = np.maximum(dataset.stage_duration_days, 1)
+    return (
+        np.minimum.reduceat(dataset.stage_starts, first_stages),
+        np.maximum.reduceat(dataset.stage_ends, first_stages),
+        np.add.reduceat(weights, first_stages),
+        np.add.reduceat(weights * dataset.stage_progress, first_stages)
+    )
+
+
+class RollupBuilder:
+    """
+    Accumulates per-group totals across a stream of GanttDataset chunks
+
+    Groups are kept in first-seen order, matching the facet index.
+    """
+
+    def __init__(self):
+        # value -> [projects, start, end, weight, weighted progress]
+        self._groups: Dict[str, Dict[Any, List[int]]] = {facet: {} for facet in ROLLUP_FACETS}
+
+    def update(self, dataset: GanttDataset) -> None:
+        """Add the projects of a chunk"""
+        if len(dataset) == 0:
+            return
+        starts, ends, weights, weighted = project_progress_weights(dataset)
+        columns = project_facets(dataset)
+        for facet in ROLLUP_FACETS:
+            column = columns[facet]
+            size = len(column.values)
+            counts = np.bincount(column.codes, minlength=size)
+            group_starts = np.full(size, np.iinfo(np.int64).max, dtype=np.int64)
+            group_ends = np.full(size, np.iinfo(np.int64).min, dtype=np.int64)
+            np.minimum.at(group_starts, column.codes, starts)
+            np.maximum.at(group_ends, column.codes, ends)
+            group_weights = np.bincount(column.codes, weights=weights, minlength=size)
+            group_weighted = np.bincount(column.codes, weights=weighted, minlength=size)
+            for code in np.flatnonzero(counts).tolist():
+                self._merge(facet, column.values[code], int(counts[code]), int(group_starts[code]),
+                            int(group_ends[code]), int(group_weights[code]), int(group_weighted[code]))
+
+    def add(self, facet_values: Dict[str, Any], start: int, end: int, weight: int, weighted: int) -> None:
+        """Add one project given its facet values and totals (see project_progress_weights())"""
+        for facet in ROLLUP_FACETS:
+            self._merge(facet, facet_values[facet], 1, start, end, weight, weighted)
+
+    def _merge(self, facet: str, value: Any, projects: int, start: int, end: int, weight: int, weighted: int) -> None:
+        group = self._groups[facet].get(value)
+        if group is None:
+            self._groups[facet][value] = [projects, start, end, weight, weighted]
+            return
+        group[0] += projects
+        group[1] = min(group[1], start)
+        group[2] = max(group[2], end)
+        group[3] += weight
+        group[4] += weighted
+
+    def build(self) -> Dict[str, List[Dict[str, Any]]]:
+        """One summary per group and facet, in the shape embedded as {{ rollups }}"""
+        rollups = {}
+        for facet, groups in self._groups.items():
+            values = _json_safe(list(groups))
+            rollups[facet] = [
+                {
+                    'value': value,
+                    'projects': projects,
+                    'start': isoformat_epoch_seconds(start),
+                    'end': isoformat_epoch_seconds(end),
+                    'progress': round(weighted / weight) if weight else 0
+                }
+                for value, (projects, start, end, weight, weighted) in zip(values, groups.values())
+            ]
+        return rollups
+
+
+def build_rollups(project_data: Union[GanttDataset, list]) -> Dict[str, List[Dict[str, Any]]]:
+    """Rollups of a dataset or list of project records"""
+    if not isinstance(project_data, GanttDataset):
+        project_data = GanttDataset.from_records(project_data)
+    builder = RollupBuilder()
+    builder.update(project_data)
+    return builder.build()
+
+
+def render_rollups(rollups: Optional[Dict[str, List[Dict[str, Any]]]]) -> str:
+    """Serialize rollups (or None when disabled) as the JavaScript expression substituted for {{ rollups }}"""
+    # The rollups sit inside a <script> element
+    return json.dumps(rollups, separators=(',', ':'), allow_nan=False).replace('</', '<\\/')
@@ -0,0 +1,532 @@
+"""
+Serve mode: a local HTTP server that renders charts on request
+
+Instead of publishing static files on a schedule, the server renders every
+input file under a root directory on demand. Processed project data and
+rendered pages are kept in in-memory LRU caches: data keyed by input path and
+content hash, pages additionally by style, render options and filters. A
+request for a cached page costs a stat of the input file; concurrent requests
+for the same missing entry wait for one load or render instead of each
+running the whole pipeline. Compiled templates are shared process-wide (see
+get_template_environment()).
+
+Pages carry a content ETag and are revalidated (If-None-Match -> 304), gzipped
+for clients that accept it, and reference the shared scripts as one
+content-hashed bundle served with a long-lived immutable Cache-Control.
+Requests are handled on a bounded thread pool.
+"""
+
+import gzip
+import hashlib
+import html
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlsplit
+
+import numpy as np
+
+from .bundler import ASSETS_DIRNAME, STATIC_DIR, bundle_source
+from .cache import ProcessedDataCache, default_cache_dir, file_digest
+from .facets import FACETS, project_facets
+from .gantt_generator import ENGINES, RENDERERS, STYLES, GanttChartGenerator, load_project_data
+from .input_formats import EXTENSION_FORMATS, INPUT_FORMATS
+from .models import GanttDataset
+from .payload import PAYLOAD_FORMATS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+DEFAULT_WORKERS = 8
+
+# Entries kept by the processed-data and rendered-page caches
+DEFAULT_DATA_ENTRIES = 8
+DEFAULT_PAGE_ENTRIES = 64
+
+# Responses smaller than this are not worth compressing
+GZIP_MIN_BYTES = 1024
+
+# Pages are revalidated on every view; the hashed bundle never changes under its name
+PAGE_CACHE_CONTROL = 'no-cache'
+BUNDLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+STATIC_CACHE_CONTROL = 'public, max-age=86400'
+
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8'
+}
+
+
+class RequestError(Exception):
+    """A request that cannot be answered with a page; status is the HTTP status to reply with"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class LRUCache:
+    """
+    Thread-safe mapping that evicts the least recently used entry beyond max_entries
+
+    get_or_create() computes a missing entry once: callers asking for a key that
+    is being computed wait for that result instead of computing it again.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Any, Any]' = OrderedDict()
+        self._pending: Dict[Any, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_create(self, key: Any, create: Callable[[], Any]) -> Any:
+        """Return the entry for key, calling create() to build it on a miss"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            pending = self._pending.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._pending[key] = Future()
+        if not owner:
+            return pending.result()
+
+        try:
+            value = create()
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(e)
+            raise
+        with self._lock:
+            del self._pending[key]
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        pending.set_result(value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+
+class CachedResponse:
+    """
+    A response body with its ETags; the gzipped body is compressed on first use and kept
+
+    The gzipped body is another representation, so it has its own strong ETag.
+    """
+    __slots__ = ('body', 'etag', 'gzip_etag', 'content_type', '_gzipped')
+
+    def __init__(self, body: bytes, content_type: str):
+        self.body = body
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gz"'
+        self.content_type = content_type
+        self._gzipped: Optional[bytes] = None
+
+    def gzipped(self) -> bytes:
+        """The body compressed with gzip"""
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzipped
+
+
+class ChartOptions(NamedTuple):
+    """Render options and filters of one chart request"""
+    style: str = 'default'
+    payload_format: str = 'json'
+    renderer: str = 'auto'
+    rollups: bool = False
+    # (facet, values) pairs; a project matches when it has one of the values of every facet
+    filters: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+
+    @classmethod
+    def from_query(cls, query: Dict[str, List[str]]) -> 'ChartOptions':
+        """Parse the query parameters of a /chart request; raises RequestError on invalid values"""
+        def single(name: str, default: str, choices: List[str]) -> str:
+            value = query.get(name, [default])[-1]
+            if value not in choices:
+                raise RequestError(HTTPStatus.BAD_REQUEST, f"Unknown {name} '{value}'. Must be one of {choices}")
+            return value
+
+        filters = tuple(
+            (facet, tuple(sorted(set(query[facet]))))
+            for facet in FACETS if query.get(facet)
+        )
+        return cls(
+            style=single('style', 'default', list(STYLES)),
+            payload_format=single('payload', 'json', PAYLOAD_FORMATS),
+            renderer=single('renderer', 'auto', RENDERERS),
+            rollups=query.get('rollups', ['0'])[-1].lower() in ('1', 'true', 'yes'),
+            filters=filters
+        )
+
+
+def filter_dataset(dataset: GanttDataset, filters: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> GanttDataset:
+    """Projects matching every facet filter (see ChartOptions.filters)"""
+    if not filters:
+        return dataset
+    columns = project_facets(dataset)
+    mask = np.ones(len(dataset), dtype=bool)
+    for facet, values in filters:
+        column = columns[facet]
+        wanted = [code for code, value in enumerate(column.values) if str(value) in values]
+        mask &= np.isin(column.codes, wanted)
+    return dataset.select(np.flatnonzero(mask))
+
+
+class ChartService:
+    """
+    Loads, caches and renders the charts of every input file under a root directory
+
+    Independent of HTTP, so it can also be used from other servers.
+    """
+
+    def __init__(self, root: str, data_entries: int = DEFAULT_DATA_ENTRIES,
+                 page_entries: int = DEFAULT_PAGE_ENTRIES, engine: str = 'auto',
+                 input_format: str = 'auto', use_cache: bool = True):
+        root_path = Path(root).resolve()
+        if not root_path.exists():
+            raise FileNotFoundError(f"Input not found: {root}")
+        # A single file is served on its own from its directory
+        self.root_dir = root_path if root_path.is_dir() else root_path.parent
+        self.only_file = None if root_path.is_dir() else root_path
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Must be one of {ENGINES}")
+        self.engine = engine
+        if input_format not in INPUT_FORMATS:
+            raise ValueError(f"Unknown input format '{input_format}'. Must be one of {INPUT_FORMATS}")
+        self.input_format = input_format
+
+        self.data_cache = LRUCache(data_entries)
+        self.page_cache = LRUCache(page_entries)
+        # The on-disk cache lets a restarted server skip reprocessing unchanged inputs
+        self.disk_cache = ProcessedDataCache() if use_cache else None
+        self._digests: Dict[Path, Tuple[int, int, str]] = {}
+        self._digests_lock = threading.Lock()
+        self._generators: Dict[Tuple[str, str, str, bool], GanttChartGenerator] = {}
+        self._generators_lock = threading.Lock()
+        # Pages reference the hashed bundle relative to this location, i.e. as /assets/<name>
+        self._page_anchor = default_cache_dir() / 'serve' / 'chart.html'
+
+    def list_inputs(self) -> List[str]:
+        """Paths of the servable input files, relative to the root directory"""
+        if self.only_file is not None:
+            return [self.only_file.name]
+        return sorted(
+            path.relative_to(self.root_dir).as_posix()
+            for path in self.root_dir.rglob('*')
+            if path.suffix.lower() in EXTENSION_FORMATS and path.is_file()
+        )
+
+    def resolve_input(self, relative_path: str) -> Path:
+        """Absolute path of a servable input file; raises FileNotFoundError for anything else"""
+        path = (self.root_dir / relative_path).resolve()
+        if self.only_file is not None:
+            servable = path == self.only_file
+        else:
+            servable = (_is_within(path, self.root_dir) and path.suffix.lower() in EXTENSION_FORMATS)
+        if not servable or not path.is_file():
+            raise FileNotFoundError(f"No such input: {relative_path}")
+        return path
+
+    def input_digest(self, path: Path) -> str:
+        """Content hash of an input file, recomputed only when its mtime or size changes"""
+        stat = path.stat()
+        with self._digests_lock:
+            known = self._digests.get(path)
+        if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return known[2]
+        digest = file_digest(str(path))
+        with self._digests_lock:
+            self._digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def load(self, path: Path, digest: str) -> Tuple[GanttDataset, Dict[str, str]]:
+        """Processed dataset and date range of an input file in the given state"""
+        return self.data_cache.get_or_create(
+            (str(path), digest),
+            lambda: load_project_data(str(path), self.disk_cache, engine=self.engine, input_format=self.input_format)
+        )
+
+    def render_chart(self, relative_path: str, options: ChartOptions) -> CachedResponse:
+        """Rendered chart page for an input file; raises FileNotFoundError or RequestError"""
+        path = self.resolve_input(relative_path)
+        digest = self.input_digest(path)
+        generator = self._generator(options)
+        template = generator.template_path.stat()
+        # Edited templates and shared scripts must not be answered from the cache
+        key = (str(path), digest, options, template.st_mtime_ns, template.st_size, bundle_source()[1])
+
+        def render() -> CachedResponse:
+            dataset, date_range = self.load(path, digest)
+            if options.filters:
+                dataset = filter_dataset(dataset, options.filters)
+                if len(dataset) == 0:
+                    raise RequestError(HTTPStatus.NOT_FOUND, "No projects match the filters")
+                date_range = dataset.date_range()
+            body = generator.render_bytes(dataset, date_range, str(self._page_anchor))
+            return CachedResponse(body, CONTENT_TYPES['.html'])
+
+        return self.page_cache.get_or_create(key, render)
+
+    def bundle(self) -> Tuple[str, CachedResponse]:
+        """File name of the current shared script bundle and its response"""
+        source, digest = bundle_source()
+        name = f"cqss-bundle.{digest}.min.js"
+        response = self.page_cache.get_or_create(('bundle', digest),
+                                                 lambda: CachedResponse(source.encode('utf-8'), CONTENT_TYPES['.js']))
+        return name, response
+
+    def static_file(self, name: str) -> CachedResponse:
+        """A file of static/js; raises FileNotFoundError for anything else"""
+        path = (STATIC_DIR / name).resolve()
+        if path.parent != STATIC_DIR.resolve() or path.suffix not in CONTENT_TYPES or not path.is_file():
+            raise FileNotFoundError(f"No such file: {name}")
+        stat = path.stat()
+        return self.page_cache.get_or_create(
+            ('static', str(path), stat.st_mtime_ns, stat.st_size),
+            lambda: CachedResponse(path.read_bytes(), CONTENT_TYPES[path.suffix])
+        )
+
+    def index_page(self) -> bytes:
+        """HTML list of the servable inputs with a link per style"""
+        items = []
+        for relative_path in self.list_inputs():
+            links = ' '.join(
+                f'<a href="/chart?input={quote(relative_path)}&amp;style={style}">{html.escape(spec["title"])}</a>'
+                for style, spec in STYLES.items()
+            )
+            items.append(f"<li><strong>{html.escape(relative_path)}</strong><br>{links}</li>")
+        return (
+            "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>CQSS Gantt Charts</title></head>\n"
+            f"<body><h1>CQSS Gantt Charts</h1>\n<ul>\n{chr(10).join(items)}\n</ul></body></html>\n"
+        ).encode('utf-8')
+
+    def _generator(self, options: ChartOptions) -> GanttChartGenerator:
+        """One generator per style and render options; they hold no per-request state"""
+        key = (options.style, options.payload_format, options.renderer, options.rollups)
+        with self._generators_lock:
+            generator = self._generators.get(key)
+            if generator is None:
+                generator = GanttChartGenerator(
+                    style=options.style, payload_format=options.payload_format, use_cache=False,
+                    renderer=options.renderer, rollups=options.rollups, bundle='hashed',
+                    engine=self.engine, input_format=self.input_format
+                )
+                self._generators[key] = generator
+        return generator
+
+
+def _is_within(path: Path, directory: Path) -> bool:
+    """Whether path is directory or inside it (both resolved)"""
+    try:
+        path.relative_to(directory)
+    except ValueError:
+        return False
+    return True
+
+
+def _etag_matches(header: Optional[str], *etags: str) -> bool:
+    """Whether an If-None-Match header names one of the given ETags (weak comparison)"""
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    for candidate in header.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate in etags:
+            return True
+    return False
+
+
+def _accepts_gzip(header: Optional[str]) -> bool:
+    """Whether an Accept-Encoding header allows gzip, by name or through '*', with a nonzero q-value"""
+    qualities = {}
+    for item in (header or '').split(','):
+        coding, *params = [part.strip() for part in item.split(';')]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+    for coding in ('gzip', 'x-gzip', '*'):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+class ChartRequestHandler(BaseHTTPRequestHandler):
+    """
+    Routes:
+        /                   index of the servable inputs
+        /chart?input=PATH   chart page; optional style, payload, renderer, rollups
+                            and facet filters (category, priority, team_lead, status)
+        /assets/NAME        content-hashed shared script bundle
+        /static/js/NAME     files of static/js
+    """
+    server_version = 'CQSS'
+    service: ChartService = None
+
+    def do_GET(self) -> None:
+        self._respond(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._respond(send_body=False)
+
+    def _respond(self, send_body: bool) -> None:
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        try:
+            if url.path == '/':
+                self._send(HTTPStatus.OK, self.service.index_page(), CONTENT_TYPES['.html'], send_body=send_body,
+                           cache_control=PAGE_CACHE_CONTROL)
+            elif url.path == '/chart':
+                if 'input' not in query:
+                    raise RequestError(HTTPStatus.BAD_REQUEST, "Missing 'input' parameter")
+                response = self.service.render_chart(query['input'][-1], ChartOptions.from_query(query))
+                self._send_cached(response, PAGE_CACHE_CONTROL, send_body)
+            elif url.path.startswith(f'/{ASSETS_DIRNAME}/'):
+                name, response = self.service.bundle()
+                if url.path != f'/{ASSETS_DIRNAME}/{name}':
+                    raise FileNotFoundError(f"No such asset: {url.path}")
+                self._send_cached(response, BUNDLE_CACHE_CONTROL, send_body)
+            elif url.path.startswith('/static/js/'):
+                response = self.service.static_file(url.path[len('/static/js/'):])
+                self._send_cached(response, STATIC_CACHE_CONTROL, send_body)
+            else:
+                raise FileNotFoundError(f"No such page: {url.path}")
+        except RequestError as e:
+            self._send_error(e.status, str(e), send_body)
+        except FileNotFoundError as e:
+            self._send_error(HTTPStatus.NOT_FOUND, str(e), send_body)
+        except Exception as e:
+            logger.exception(f"Error serving {self.path}")
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e), send_body)
+
+    def _send_cached(self, response: CachedResponse, cache_control: str, send_body: bool) -> None:
+        """Send a cached response, or 304 when the client already holds it in either coding"""
+        if _etag_matches(self.headers.get('If-None-Match'), response.etag, response.gzip_etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', response.gzip_etag if self._use_gzip(response) else response.etag)
+            self.send_header('Cache-Control', cache_control)
+            self.end_headers()
+            return
+        self._send(HTTPStatus.OK, response, response.content_type, send_body=send_body,
+                   cache_control=cache_control)
+
+    def _send(self, status: HTTPStatus, body, content_type: str, send_body: bool,
+              cache_control: Optional[str] = None) -> None:
+        """Send a body (bytes or a CachedResponse), gzipped when the client accepts it"""
+        headers = {'Content-Type': content_type}
+        if isinstance(body, CachedResponse):
+            if self._use_gzip(body):
+                headers['ETag'] = body.gzip_etag
+                headers['Content-Encoding'] = 'gzip'
+                body = body.gzipped()
+            else:
+                headers['ETag'] = body.etag
+                body = body.body
+            headers['Vary'] = 'Accept-Encoding'
+        if cache_control:
+            headers['Cache-Control'] = cache_control
+        headers['Content-Length'] = str(len(body))
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _use_gzip(self, response: CachedResponse) -> bool:
+        """Whether to send the gzipped body: the client accepts it and the body is worth compressing"""
+        return len(response.body) >= GZIP_MIN_BYTES and _accepts_gzip(self.headers.get('Accept-Encoding'))
+
+    def _send_error(self, status: HTTPStatus, message: str, send_body: bool) -> None:
+        self._send(status, f"{status.value} {status.phrase}: {message}\n".encode('utf-8'),
+                   'text/plain; charset=utf-8', send_body=send_body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.info(f"{self.address_string()} {format % args}")
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTP server handling each connection on a fixed-size thread pool"""
+    # Connections waiting to be accepted; the default of 5 drops bursts of concurrent viewers
+    request_queue_size = 128
+
+    def __init__(self, server_address: Tuple[str, int], handler_class, workers: int = DEFAULT_WORKERS):
+        super().__init__(server_address, handler_class)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='cqss-serve')
+
+    def process_request(self, request, client_address) -> None:
+        self.executor.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+def create_server(service: ChartService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                  workers: int = DEFAULT_WORKERS) -> PooledHTTPServer:
+    """Bind a server for the service; call serve_forever() on the result"""
+    handler_class = type('BoundChartRequestHandler', (ChartRequestHandler,), {'service': service})
+    return PooledHTTPServer((host, port), handler_class, workers)
+
+
+def serve(root: str, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = DEFAULT_WORKERS,
+          **service_options: Any) -> None:
+    """
+    Serve the charts of every input file under root until interrupted
+
+    Args:
+        root: Directory of input files, or a single input file
+        host: Interface to listen on
+        port: Port to listen on; 0 picks a free one
+        workers: Threads handling requests
+        service_options: Passed on to ChartService (cache sizes, engine, input_format, use_cache)
+    """
+    service = ChartService(root, **service_options)
+    server = create_server(service, host, port, workers)
+    bound_host, bound_port = server.server_address[:2]
+    logger.info(f"Serving {len(service.list_inputs())} input(s) from {service.root_dir} "
+                f"on http://{bound_host}:{bound_port}/ with {workers} worker(s) (press Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("\nStopped serving")
+    finally:
+        server.server_close()
@@ -0,0 +1,278 @@
+"""
+Watch mode: regenerate a chart every time its CSV file is saved
+
+The processed state of the previous cycle is kept in memory. A change is
+detected cheaply from the file's mtime and size and confirmed with a content
+hash; only rows whose content hash was not seen before are then reprocessed.
+Each row's serialized JSON and date bounds are cached, so a cycle after a
+small edit costs one CSV split plus the handful of changed rows.
+"""
+
+import codecs
+import hashlib
+import io
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .data_processor import ProjectDataProcessor, is_long_format
+from .facets import FACETS, FacetIndexBuilder, project_facets, render_facet_index
+from .gantt_generator import GanttChartGenerator
+from .rollups import RollupBuilder, project_progress_weights, render_rollups
+from .models import isoformat_epoch_seconds
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks of the watched file
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+
+class _RowState:
+    """Cached output for one distinct row: its JSON (minus the id line), date bounds, stage count, facet values and progress weights"""
+    __slots__ = ('fragment', 'min_start', 'max_end', 'stages', 'facets', 'weight', 'weighted_progress')
+
+    def __init__(self, fragment: str, min_start: int, max_end: int, stages: int, facets: tuple,
+                 weight: int, weighted_progress: int):
+        self.fragment = fragment
+        self.min_start = min_start
+        self.max_end = max_end
+        self.stages = stages
+        self.facets = facets
+        self.weight = weight
+        self.weighted_progress = weighted_progress
+
+
+def _split_rows(content: bytes) -> List[bytes]:
+    """
+    Split raw CSV content into logical rows without parsing fields
+
+    Lines are joined while a quoted field is still open (odd number of quotes),
+    so quoted newlines stay inside their row. Line endings are normalized and
+    blank lines dropped, as pandas does, so row positions match the DataFrame index.
+    """
+    rows = []
+    pending = None
+    for line in content.split(b'\n'):
+        if pending is not None:
+            pending.append(line)
+            if line.count(b'"') & 1:
+                line = b'\n'.join(pending)
+                pending = None
+            else:
+                continue
+        elif line.count(b'"') & 1:
+            pending = [line]
+            continue
+        if line.endswith(b'\r'):
+            line = line[:-1]
+        if line:
+            rows.append(line)
+    if pending is not None:
+        rows.append(b'\n'.join(pending))
+    return rows
+
+
+def _row_hash(row: bytes) -> bytes:
+    return hashlib.blake2b(row, digest_size=16).digest()
+
+
+def _record_fragments(records: List[dict]) -> List[str]:
+    """
+    Each record as it appears inside json.dumps(records, indent=2), without its id line
+
+    The id depends on the row position, so it is prepended when the payload is
+    assembled; a row that only moved keeps its cached fragment. The records are
+    serialized in one call and split apart, which is much faster than one call
+    per record; JSON strings never contain a literal newline, so the item
+    separator cannot occur inside a value.
+    """
+    if not records:
+        return []
+    items = json.dumps(records, indent=2)[len('[\n  {\n    "id": '):-len('\n]')].split(',\n  {\n    "id": ')
+    return [item[item.index(',\n') + 2:] for item in items]
+
+
+class IncrementalChartBuilder:
+    """
+    Rebuilds a chart from a CSV file, reprocessing only rows that changed
+
+    The rendered output is identical to GanttChartGenerator.generate_chart()
+    with the 'json' payload format.
+    """
+
+    def __init__(self, csv_file_path: str, output_path: str, generator: GanttChartGenerator):
+        if generator.payload_format != 'json':
+            raise ValueError("Watch mode only supports the 'json' payload format")
+        self.csv_path = Path(csv_file_path)
+        self.output_path = Path(output_path)
+        self.generator = generator
+        self.processor = ProjectDataProcessor()
+
+        self._stat_key = None
+        self._digest = None
+        self._cache_key: Optional[Tuple[bytes, bytes]] = None
+        self._rows: Dict[bytes, _RowState] = {}
+
+    def poll(self) -> Optional[Dict[str, float]]:
+        """
+        Rebuild the chart if the CSV file changed since the last call
+
+        Returns:
+            Timings and row counts of the rebuild, or None if nothing changed
+        """
+        stat = os.stat(self.csv_path)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if stat_key == self._stat_key:
+            return None
+
+        start = time.perf_counter()
+        content = self.csv_path.read_bytes()
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        self._stat_key = stat_key
+        if digest == self._digest:
+            # Touched but not modified
+            return None
+        # Remember the digest even if the rebuild fails, so a broken file is reported once
+        self._digest = digest
+        return self.rebuild(content, start)
+
+    def rebuild(self, content: bytes, start: Optional[float] = None) -> Dict[str, float]:
+        """Reprocess the changed rows of content and re-render the chart"""
+        start = time.perf_counter() if start is None else start
+        timings = {}
+
+        # Split rows and find the ones not seen before
+        if content.startswith(codecs.BOM_UTF8):
+            content = content[len(codecs.BOM_UTF8):]
+        rows = _split_rows(content)
+        if not rows:
+            raise ValueError("Error loading CSV file: No columns to parse from file")
+        header, rows = rows[0], rows[1:]
+        # pandas infers the format of a date column from its first value, so rows
+        # processed under another header or first row may not parse the same way
+        cache_key = (header, rows[0] if rows else b'')
+        known_rows = self._rows if cache_key == self._cache_key else {}
+        hashes = [_row_hash(row) for row in rows]
+
+        new_rows = {}
+        for row_hash, row in zip(hashes, rows):
+            if row_hash not in known_rows and row_hash not in new_rows:
+                new_rows[row_hash] = row
+        timings['diff'] = time.perf_counter() - start
+
+        # Process only the new rows, validating them exactly like a full load
+        step = time.perf_counter()
+        processed = self._process_rows(header, rows[0], new_rows) if new_rows else {}
+        timings['process'] = time.perf_counter() - step
+
+        # Assemble the payload and date range from the per-row cache
+        step = time.perf_counter()
+        row_states = [known_rows.get(row_hash) or processed[row_hash] for row_hash in hashes]
+        if not row_states:
+            raise ValueError("Error loading CSV file: CSV file contains no projects")
+        project_data = ",\n".join(
+            f'  {{\n    "id": "project_{position}",\n{state.fragment}'
+            for position, state in enumerate(row_states)
+        )
+        date_range = {
+            'min_date': isoformat_epoch_seconds(min(state.min_start for state in row_states)),
+            'max_date': isoformat_epoch_seconds(max(state.max_end for state in row_states))
+        }
+        renderer = self.generator.choose_renderer(len(row_states), sum(state.stages for state in row_states))
+        facet_builder = FacetIndexBuilder()
+        facet_builder.extend(state.facets for state in row_states)
+        rollup_builder = RollupBuilder() if self.generator.rollups else None
+        if rollup_builder:
+            for state in row_states:
+                rollup_builder.add(dict(zip(FACETS, state.facets)), state.min_start, state.max_end,
+                                   state.weight, state.weighted_progress)
+        context = {
+            'project_data': f"[\n{project_data}\n]",
+            'date_range': json.dumps(date_range, indent=2),
+            'renderer': json.dumps(renderer),
+            'facet_index': render_facet_index(facet_builder.build()),
+            'rollups': render_rollups(rollup_builder.build() if rollup_builder else None)
+        }
+        self.generator.render_to_file(context, str(self.output_path))
+        timings['render'] = time.perf_counter() - step
+
+        # Commit the new state only once the whole cycle succeeded
+        self._cache_key = cache_key
+        self._rows = {row_hash: state for row_hash, state in zip(hashes, row_states)}
+
+        timings['total'] = time.perf_counter() - start
+        timings['rows'] = len(rows)
+        timings['changed_rows'] = len(new_rows)
+        return timings
+
+    def _process_rows(self, header: bytes, first_row: bytes, rows: Dict[bytes, bytes]) -> Dict[bytes, _RowState]:
+        """
+        Run the regular load and processing pipeline on a subset of rows
+
+        The file's first row leads the subset, so date formats are inferred from the
+        same values as in a full load; its state is returned along with the others.
+        """
+        rows = {_row_hash(first_row): first_row, **rows}
+        buffer = io.BytesIO(b'\n'.join([header, *rows.values()]))
+
+        try:
+            df = self.processor.load_csv(buffer)
+        except ValueError:
+            # Row numbers in the message refer to the subset; report the error for the whole file
+            self.processor.load_csv(str(self.csv_path))
+            raise
+        if is_long_format(df.columns):
+            # Each row is one stage, so rows cannot be reprocessed on their own
+            raise ValueError("Watch mode needs one row per project; long-format stage tables are not supported")
+        dataset = self.processor.process_to_dataset(df)
+
+        min_starts, max_ends, weights, weighted = (column.tolist() for column in project_progress_weights(dataset))
+        stage_counts = np.diff(dataset.stage_bounds).tolist()
+        facet_columns = project_facets(dataset)
+        facets = zip(*(facet_columns[facet].decode() for facet in FACETS))
+        return {
+            row_hash: _RowState(fragment, min_start, max_end, stages, row_facets, weight, weighted_progress)
+            for row_hash, fragment, min_start, max_end, stages, row_facets, weight, weighted_progress in zip(
+                rows, _record_fragments(dataset.to_records()), min_starts, max_ends, stage_counts, facets,
+                weights, weighted)
+        }
+
+
+def watch_chart(csv_file_path: str, output_path: str, generator: GanttChartGenerator,
+                interval: float = DEFAULT_POLL_INTERVAL) -> None:
+    """
+    Regenerate output_path whenever csv_file_path changes, until interrupted
+
+    Args:
+        csv_file_path: Path to CSV file containing project data
+        output_path: Path where the HTML file will be saved
+        generator: Generator whose template is rendered on every cycle
+        interval: Seconds between checks of the CSV file
+    """
+    builder = IncrementalChartBuilder(csv_file_path, output_path, generator)
+    logger.info(f"Watching {csv_file_path} for changes (press Ctrl+C to stop)...")
+
+    try:
+        while True:
+            try:
+                timings = builder.poll()
+            except (ValueError, OSError) as e:
+                logger.error(f"[{datetime.now():%H:%M:%S}] Error: {str(e)}")
+            else:
+                if timings:
+                    logger.info(
+                        f"[{datetime.now():%H:%M:%S}] Rebuilt {output_path}: "
+                        f"{timings['changed_rows']} of {timings['rows']} rows reprocessed | "
+                        f"diff {timings['diff'] * 1000:.1f}ms, process {timings['process'] * 1000:.1f}ms, "
+                        f"render {timings['render'] * 1000:.1f}ms, total {timings['total'] * 1000:.1f}ms"
+                    )
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        logger.info("\nStopped watching")
@@ -14,6 +14,8 @@
      */
     window.CQSS_FilterManager = {
         currentFilters: {},
+        searchIndex: null,
+        SEARCH_DEBOUNCE_MS: 150,
         
         /**
          * Initialize filter functionality
@@ -45,10 +47,10 @@
                 teamFilter.addEventListener('change', () => this.applyFilters());
             }
             
-            // Search filter
+            // Search filter (debounced while typing)
             const searchFilter = document.getElementById('searchFilter');
             if (searchFilter) {
-                searchFilter.addEventListener('input', () => this.applyFilters());
+                searchFilter.addEventListener('input', CQSS_ChartUtils.debounce(() => this.applyFilters(), this.SEARCH_DEBOUNCE_MS));
             }
             
             // Clear filters button
@@ -109,11 +111,18 @@
                 category: document.getElementById('categoryFilter')?.value || '',
                 priority: document.getElementById('priorityFilter')?.value || '',
                 team: document.getElementById('teamFilter')?.value || '',
-                search: document.getElementById('searchFilter')?.value.toLowerCase() || ''
+                search: CQSS_SearchIndex.normalize(document.getElementById('searchFilter')?.value)
             };
             
+            // The search index is built once per data set
+            if (!this.searchIndex || this.searchIndex.data !== window.allProjectData) {
+                this.searchIndex = CQSS_SearchIndex.build(window.allProjectData);
+                this.searchIndex.data = window.allProjectData;
+            }
+            const searchMatches = this.currentFilters.search ? this.searchIndex.match(this.currentFilters.search) : null;
+            
             // Filter the data
-            window.filteredProjectData = window.allProjectData.filter(project => {
+            window.filteredProjectData = window.allProjectData.filter((project, index) => {
                 // Category filter
                 if (this.currentFilters.category && project.category !== this.currentFilters.category) {
                     return false;
@@ -130,11 +139,8 @@
                 }
                 
                 // Search filter
-                if (this.currentFilters.search) {
-                    const searchableText = `${project.project_name} ${project.description}`.toLowerCase();
-                    if (!searchableText.includes(this.currentFilters.search)) {
-                        return false;
-                    }
+                if (searchMatches && !searchMatches[index]) {
+                    return false;
                 }
                 
                 return true;
@@ -373,6 +379,1531 @@
             if (loading) {
                 loading.remove();
             }
+        },
+        
+        /**
+         * Delay calls to fn until wait ms have passed without another call
+         */
+        debounce: function(fn, wait) {
+            let timer = null;
+            return function(...args) {
+                clearTimeout(timer);
+                timer = setTimeout(() => fn.apply(this, args), wait);
+            };
+        }
+    };
+    
+    /**
+     * Project Search Index
+     *
+     * Normalizes the searchable text of every project once at load, so a query
+     * is a substring scan over prepared strings. A query that extends the
+     * previous one (typing further) only rechecks the previous matches.
+     */
+    window.CQSS_SearchIndex = {
+        // Fields searched by default
+        DEFAULT_FIELDS: ['name', 'description', 'category', 'team_lead'],
+        
+        /**
+         * Lowercase, strip accents and collapse whitespace
+         */
+        normalize: function(text) {
+            return String(text === undefined || text === null ? '' : text)
+                .normalize('NFD')
+                .replace(/[\u0300-\u036f]/g, '')
+                .toLowerCase()
+                .replace(/\s+/g, ' ')
+                .trim();
+        },
+        
+        /**
+         * Build an index over items; match(query) returns one flag per item
+         */
+        build: function(items, fields) {
+            const normalize = this.normalize;
+            fields = fields || this.DEFAULT_FIELDS;
+            const texts = items.map(item => normalize(fields.map(field => item[field]).join(' ')));
+            let lastQuery = null;
+            let lastMatches = null;
+            
+            return {
+                size: texts.length,
+                
+                match: function(query) {
+                    query = normalize(query);
+                    if (query === lastQuery) return lastMatches;
+                    
+                    // Every whitespace-separated term must occur
+                    const terms = query ? query.split(' ') : [];
+                    const narrowing = lastQuery !== null && query.startsWith(lastQuery);
+                    const matches = new Uint8Array(texts.length);
+                    for (let i = 0; i < texts.length; i++) {
+                        if (narrowing && !lastMatches[i]) continue;
+                        const text = texts[i];
+                        matches[i] = terms.every(term => text.includes(term)) ? 1 : 0;
+                    }
+                    
+                    lastQuery = query;
+                    lastMatches = matches;
+                    return matches;
+                }
+            };
+        }
+    };
+    
+    /**
+     * Facet Index
+     *
+     * Answers category/priority/team lead/status filters by intersecting
+     * per-value bitsets (one bit per project) instead of rescanning projects.
+     * The index is normally precomputed by the generator (src/facets.py):
+     * dense sets arrive as base64 little-endian 32-bit words, sparse ones as
+     * sorted project positions, and either is turned into a bitset on first use.
+     */
+    window.CQSS_FacetIndex = {
+        FACETS: ['category', 'priority', 'team_lead', 'status'],
+        
+        /**
+         * Use an embedded index, or build one from the projects when there is none
+         */
+        load: function(data, projects) {
+            return data ? this.decode(data) : this.build(projects);
+        },
+        
+        /**
+         * Build the index in the browser (same shape as src/facets.py)
+         */
+        build: function(projects) {
+            const facets = {};
+            this.FACETS.forEach(facet => {
+                const lookup = new Map();
+                const entry = { values: [], counts: [], sets: [] };
+                projects.forEach((project, index) => {
+                    const value = facet === 'status'
+                        ? (project.stages[project.stages.length - 1].status || 'normal')
+                        : project[facet];
+                    let code = lookup.get(value);
+                    if (code === undefined) {
+                        code = entry.values.length;
+                        lookup.set(value, code);
+                        entry.values.push(value);
+                        entry.counts.push(0);
+                        entry.sets.push([]);
+                    }
+                    entry.counts[code]++;
+                    entry.sets[code].push(index);
+                });
+                facets[facet] = entry;
+            });
+            return this.decode({ size: projects.length, facets: facets });
+        },
+        
+        /**
+         * Wrap an index ({size, facets: {name: {values, counts, sets}}}) with bitset queries
+         */
+        decode: function(data) {
+            const size = data.size;
+            const words = Math.ceil(size / 32);
+            const facets = {};
+            
+            Object.keys(data.facets).forEach(name => {
+                const facet = data.facets[name];
+                const bitsets = new Array(facet.values.length).fill(null);
+                facets[name] = {
+                    values: facet.values,
+                    counts: facet.counts,
+                    lookup: new Map(facet.values.map((value, code) => [value, code])),
+                    // Lists stay lists: counting against them is cheaper than against a bitset
+                    list: code => Array.isArray(facet.sets[code]) ? facet.sets[code] : null,
+                    bits: code => {
+                        if (!bitsets[code]) {
+                            bitsets[code] = decodeSet(facet.sets[code]);
+                        }
+                        return bitsets[code];
+                    }
+                };
+            });
+            
+            function decodeSet(set) {
+                const bits = new Uint32Array(words);
+                if (typeof set === 'string') {
+                    const raw = atob(set);
+                    const bytes = new Uint8Array(bits.buffer);
+                    const length = Math.min(raw.length, bytes.length);
+                    for (let i = 0; i < length; i++) bytes[i] = raw.charCodeAt(i);
+                } else {
+                    for (let i = 0; i < set.length; i++) bits[set[i] >>> 5] |= 1 << (set[i] & 31);
+                }
+                return bits;
+            }
+            
+            function popcount(word) {
+                word -= (word >>> 1) & 0x55555555;
+                word = (word & 0x33333333) + ((word >>> 2) & 0x33333333);
+                return (((word + (word >>> 4)) & 0x0F0F0F0F) * 0x01010101) >>> 24;
+            }
+            
+            // Every project, with the bits past the end cleared
+            function allBits() {
+                const bits = new Uint32Array(words).fill(0xFFFFFFFF);
+                if (size % 32) bits[words - 1] = (1 << (size % 32)) - 1;
+                return bits;
+            }
+            
+            const index = {
+                size: size,
+                facets: facets,
+                
+                /**
+                 * Bitset of the projects whose flag is set (e.g. search matches)
+                 */
+                fromFlags: function(flags) {
+                    const bits = new Uint32Array(words);
+                    for (let i = 0; i < size; i++) {
+                        if (flags[i]) bits[i >>> 5] |= 1 << (i & 31);
+                    }
+                    return bits;
+                },
+                
+                /**
+                 * Projects matching every selection ({facet: value}) and the optional mask
+                 */
+                select: function(selections, mask, exceptFacet) {
+                    const result = mask ? Uint32Array.from(mask) : allBits();
+                    Object.keys(selections).forEach(name => {
+                        if (name === exceptFacet) return;
+                        const facet = facets[name];
+                        const code = facet.lookup.get(selections[name]);
+                        if (code === undefined) {
+                            result.fill(0);
+                            return;
+                        }
+                        const bits = facet.bits(code);
+                        for (let w = 0; w < words; w++) result[w] &= bits[w];
+                    });
+                    return result;
+                },
+                
+                /**
+                 * Number of projects in a bitset
+                 */
+                count: function(bits) {
+                    let total = 0;
+                    for (let w = 0; w < words; w++) {
+                        if (bits[w]) total += popcount(bits[w]);
+                    }
+                    return total;
+                },
+                
+                /**
+                 * Live per-value counts of a facet: projects matching every other selection and the mask
+                 */
+                valueCounts: function(name, selections, mask) {
+                    const facet = facets[name];
+                    const base = this.select(selections, mask, name);
+                    return facet.values.map((value, code) => {
+                        const list = facet.list(code);
+                        let total = 0;
+                        if (list) {
+                            for (let i = 0; i < list.length; i++) {
+                                if (base[list[i] >>> 5] & (1 << (list[i] & 31))) total++;
+                            }
+                            return total;
+                        }
+                        const bits = facet.bits(code);
+                        for (let w = 0; w < words; w++) {
+                            const word = base[w] & bits[w];
+                            if (word) total += popcount(word);
+                        }
+                        return total;
+                    });
+                },
+                
+                /**
+                 * Ascending project positions of a bitset
+                 */
+                indices: function(bits) {
+                    const result = [];
+                    for (let w = 0; w < words; w++) {
+                        let word = bits[w];
+                        while (word) {
+                            const lowest = word & -word;
+                            result.push(w * 32 + 31 - Math.clz32(lowest));
+                            word ^= lowest;
+                        }
+                    }
+                    return result;
+                }
+            };
+            return index;
+        },
+        
+        /**
+         * Add an option per facet value to a select (values already listed are kept)
+         */
+        fillSelect: function(select, facet, options = {}) {
+            const existing = new Set(Array.from(select.options).map(option => option.value));
+            const values = options.sort ? [...facet.values].sort() : facet.values;
+            values.forEach(value => {
+                if (existing.has(String(value))) return;
+                const option = document.createElement('option');
+                option.value = value;
+                option.textContent = options.label ? options.label(value) : value;
+                select.appendChild(option);
+            });
+        },
+        
+        /**
+         * Show live counts next to a select's options and disable values with no matches
+         */
+        showCounts: function(select, facet, counts) {
+            Array.from(select.options).forEach(option => {
+                if (!option.value) return;
+                if (option.dataset.label === undefined) {
+                    option.dataset.label = option.textContent;
+                }
+                const code = facet.lookup.get(option.value);
+                const count = code === undefined ? 0 : counts[code];
+                option.textContent = `${option.dataset.label} (${count})`;
+                option.disabled = count === 0 && !option.selected;
+            });
+        }
+    };
+    
+    /**
+     * Data Worker
+     *
+     * Moves the per-project data work off the main thread: parsing every
+     * stage date, laying out bar geometry, building the search index,
+     * decoding the facet index and evaluating filters. The worker is created
+     * from an inline Blob, so file:// pages need no extra file, and runs the
+     * search and facet index code of this library. Results are typed arrays
+     * transferred back without copying; the main thread only draws. Where
+     * workers are unavailable the same code runs on the main thread.
+     */
+    window.CQSS_DataWorker = {
+        /**
+         * Start a worker for the projects
+         *
+         * Options:
+         *   facetIndex - index embedded by the generator (see CQSS_FacetIndex); built in the worker if null
+         *   fields     - searched fields (default: CQSS_SearchIndex.DEFAULT_FIELDS)
+         *
+         * Returns a client with:
+         *   ready                - promise resolved once the worker holds the data
+         *   filter(query)        - promise of {indices, counts, mask} for a query
+         *                          {selections: {facet: value}, search, progress: 'min-max'}:
+         *                          ascending project positions (Uint32Array), live per-value
+         *                          counts of every facet (see valueCounts) and the search and
+         *                          progress bitset (null without either). Resolves to null when
+         *                          a newer filter was requested in the meantime.
+         *   layout(scale)        - promise of per-stage {x, width} (Float64Arrays) for a linear
+         *                          time scale {domain: [start, end] in ms, width, minWidth}
+         *   stageOffset(project) - position of a project's first stage in the per-stage arrays
+         *   terminate()
+         */
+        start: function(projects, options) {
+            options = options || {};
+            const fields = options.fields || CQSS_SearchIndex.DEFAULT_FIELDS;
+            
+            // One flat pass over the projects; strings and typed arrays are cheap to hand over
+            const stageBounds = new Uint32Array(projects.length + 1);
+            const lastProgress = new Uint8Array(projects.length);
+            const texts = new Array(projects.length);
+            const dates = [];
+            const offsets = new WeakMap();
+            projects.forEach((project, index) => {
+                offsets.set(project, stageBounds[index]);
+                project.stages.forEach(stage => dates.push(stage.start, stage.end));
+                stageBounds[index + 1] = stageBounds[index] + project.stages.length;
+                lastProgress[index] = project.stages[project.stages.length - 1].progress_percent;
+                texts[index] = fields.map(field => project[field]).join(' ');
+            });
+            const data = {
+                stageBounds: stageBounds,
+                lastProgress: lastProgress,
+                texts: texts,
+                dates: dates,
+                facetIndex: options.facetIndex || null,
+                // Facet values per project, only needed when there is no embedded index
+                facetRecords: options.facetIndex ? null : projects.map(project => ({
+                    category: project.category,
+                    priority: project.priority,
+                    team_lead: project.team_lead,
+                    stages: [{ status: project.stages[project.stages.length - 1].status }]
+                }))
+            };
+            
+            const pending = new Map(); // request id -> {message, transfer, resolve, reject}
+            let nextId = 0;
+            let latestFilter = 0;
+            let answered = false;
+            let port = this.createWorker(handleMessage, fallBack);
+            
+            function handleMessage(message) {
+                answered = true;
+                const request = pending.get(message.id);
+                if (!request) return;
+                pending.delete(message.id);
+                if (message.error) {
+                    request.reject(new Error(message.error));
+                } else {
+                    request.resolve(message.result);
+                }
+            }
+            
+            // A worker that fails before answering (e.g. blocked by a content security policy) is replaced by the in-page one
+            function fallBack(error) {
+                if (answered || port.local) {
+                    console.error('CQSS data worker failed:', error);
+                    return;
+                }
+                console.warn('CQSS data worker unavailable, processing data on the main thread');
+                port.terminate();
+                port = CQSS_DataWorker.createLocal(handleMessage);
+                pending.forEach(request => port.postMessage(request.message));
+            }
+            
+            function request(type, payload, transfer) {
+                const id = ++nextId;
+                const message = { id: id, type: type, data: payload };
+                return new Promise((resolve, reject) => {
+                    pending.set(id, { message: message, resolve: resolve, reject: reject });
+                    port.postMessage(message, transfer || []);
+                });
+            }
+            
+            // Typed arrays are copied into the message, not transferred, so a fallback can resend it
+            const ready = request('load', data);
+            
+            return {
+                ready: ready,
+                
+                filter: function(query) {
+                    const id = nextId + 1;
+                    latestFilter = id;
+                    return request('filter', query).then(result => (id === latestFilter ? result : null));
+                },
+                
+                layout: function(scale) {
+                    return request('layout', scale);
+                },
+                
+                stageOffset: function(project) {
+                    return offsets.get(project);
+                },
+                
+                terminate: function() {
+                    port.terminate();
+                    pending.clear();
+                }
+            };
+        },
+        
+        /**
+         * Worker running this library's search and facet index code; null if workers are unavailable
+         */
+        createWorker: function(onMessage, onError) {
+            if (typeof Worker === 'undefined' || typeof Blob === 'undefined' || typeof URL === 'undefined') {
+                return this.createLocal(onMessage);
+            }
+            const url = URL.createObjectURL(new Blob([this.source()], { type: 'text/javascript' }));
+            let worker;
+            try {
+                worker = new Worker(url);
+            } catch (error) {
+                URL.revokeObjectURL(url);
+                return this.createLocal(onMessage);
+            }
+            worker.onmessage = event => {
+                URL.revokeObjectURL(url);
+                onMessage(event.data);
+            };
+            worker.onerror = event => {
+                event.preventDefault();
+                onError(event.message || 'worker error');
+            };
+            return {
+                local: false,
+                postMessage: (message, transfer) => worker.postMessage(message, transfer),
+                terminate: () => {
+                    worker.terminate();
+                    URL.revokeObjectURL(url);
+                }
+            };
+        },
+        
+        /**
+         * Script of the worker: the search and facet index code plus workerMain
+         */
+        source: function() {
+            return [
+                "'use strict';",
+                'const window = self;',
+                `const CQSS_SearchIndex = ${this.serialize(CQSS_SearchIndex)};`,
+                `const CQSS_FacetIndex = ${this.serialize(CQSS_FacetIndex)};`,
+                `(${this.workerMain.toString()})(self);`
+            ].join('\n');
+        },
+        
+        /**
+         * The worker's message handler run on the main thread, answering asynchronously like a worker
+         */
+        createLocal: function(onMessage) {
+            const scope = {
+                postMessage: message => onMessage(message)
+            };
+            this.workerMain(scope);
+            return {
+                local: true,
+                postMessage: message => setTimeout(() => scope.onmessage({ data: message }), 0),
+                terminate: () => {}
+            };
+        },
+        
+        /**
+         * Source of an object literal of plain values and functions (methods keep their code)
+         */
+        serialize: function(object) {
+            const members = Object.keys(object).map(key => {
+                const value = object[key];
+                return `${key}: ${typeof value === 'function' ? value.toString() : JSON.stringify(value)}`;
+            });
+            return `{\n${members.join(',\n')}\n}`;
+        },
+        
+        /**
+         * Message handler of the worker; must only use its argument and the search and facet index globals
+         */
+        workerMain: function(scope) {
+            let stageBounds = null;
+            let lastProgress = null;
+            let starts = null;
+            let ends = null;
+            let searchIndex = null;
+            let facets = null;
+            
+            // 'YYYY-MM-DDTHH:MM:SS' in local time, as d3.timeParse('%Y-%m-%dT%H:%M:%S') reads it
+            const parsed = new Map();
+            function parseDate(text) {
+                let time = parsed.get(text);
+                if (time === undefined) {
+                    time = new Date(+text.slice(0, 4), +text.slice(5, 7) - 1, +text.slice(8, 10),
+                        +text.slice(11, 13) || 0, +text.slice(14, 16) || 0, +text.slice(17, 19) || 0).getTime();
+                    parsed.set(text, time);
+                }
+                return time;
+            }
+            
+            const handlers = {
+                load: function(data) {
+                    stageBounds = data.stageBounds;
+                    lastProgress = data.lastProgress;
+                    const stageCount = data.dates.length / 2;
+                    starts = new Float64Array(stageCount);
+                    ends = new Float64Array(stageCount);
+                    for (let i = 0; i < stageCount; i++) {
+                        starts[i] = parseDate(data.dates[2 * i]);
+                        ends[i] = parseDate(data.dates[2 * i + 1]);
+                    }
+                    parsed.clear();
+                    searchIndex = CQSS_SearchIndex.build(data.texts.map(text => ({ text: text })), ['text']);
+                    facets = CQSS_FacetIndex.load(data.facetIndex, data.facetRecords);
+                    return { result: { projects: lastProgress.length, stages: stageCount } };
+                },
+                
+                filter: function(query) {
+                    const selections = query.selections || {};
+                    let mask = null;
+                    if (query.search || query.progress) {
+                        // match() returns its cached flags, so narrow a copy
+                        const flags = query.search
+                            ? Uint8Array.from(searchIndex.match(query.search))
+                            : new Uint8Array(lastProgress.length).fill(1);
+                        if (query.progress) {
+                            const [min, max] = query.progress.split('-').map(Number);
+                            for (let i = 0; i < flags.length; i++) {
+                                if (lastProgress[i] < min || lastProgress[i] > max) flags[i] = 0;
+                            }
+                        }
+                        mask = facets.fromFlags(flags);
+                    }
+                    
+                    const indices = Uint32Array.from(facets.indices(facets.select(selections, mask)));
+                    const counts = {};
+                    const transfer = [indices.buffer];
+                    Object.keys(facets.facets).forEach(name => {
+                        counts[name] = Uint32Array.from(facets.valueCounts(name, selections, mask));
+                        transfer.push(counts[name].buffer);
+                    });
+                    if (mask) transfer.push(mask.buffer);
+                    return { result: { indices: indices, counts: counts, mask: mask }, transfer: transfer };
+                },
+                
+                layout: function(scale) {
+                    const [domainStart, domainEnd] = scale.domain;
+                    const ratio = scale.width / (domainEnd - domainStart);
+                    const minWidth = scale.minWidth || 0;
+                    const x = new Float64Array(starts.length);
+                    const width = new Float64Array(starts.length);
+                    for (let i = 0; i < starts.length; i++) {
+                        x[i] = Math.max(0, (starts[i] - domainStart) * ratio);
+                        width[i] = Math.max(minWidth, (ends[i] - starts[i]) * ratio);
+                    }
+                    return { result: { x: x, width: width }, transfer: [x.buffer, width.buffer] };
+                }
+            };
+            
+            scope.onmessage = function(event) {
+                const message = event.data;
+                try {
+                    const answer = handlers[message.type](message.data);
+                    scope.postMessage({ id: message.id, result: answer.result }, answer.transfer || []);
+                } catch (error) {
+                    scope.postMessage({ id: message.id, error: String(error && error.message || error) });
+                }
+            };
+        }
+    };
+    
+    /**
+     * Adaptive Time Axis
+     *
+     * Picks the tick granularity (day, week, month, quarter or year) from the
+     * pixel width of a day, so the number of ticks, grid lines and separators
+     * depends on the chart width rather than on how long the date range is.
+     * Weekends are shaded with a single repeating pattern, and only while a
+     * day is wide enough to see them.
+     */
+    window.CQSS_TimeAxis = {
+        // Narrowest gap between tick labels, in pixels
+        MIN_TICK_SPACING: 48,
+        // Weekends are shaded only while a day is at least this many pixels wide
+        WEEKEND_MIN_DAY_WIDTH: 4,
+        
+        /**
+         * Granularity levels from finest to coarsest (built on demand; d3 loads after this file)
+         */
+        levels: function() {
+            const dayNames = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+            const formatDay = d3.timeFormat('%m/%d');
+            return [
+                { name: 'day', days: 1, interval: d3.timeDay, major: d3.timeWeek,
+                  format: d => dayNames[d.getDay()] + '\n' + formatDay(d) },
+                { name: 'week', days: 7, interval: d3.timeWeek, major: d3.timeMonth,
+                  format: d3.timeFormat('%m/%d') },
+                { name: 'month', days: 30, interval: d3.timeMonth, major: d3.timeYear,
+                  format: d3.timeFormat('%b %Y') },
+                { name: 'quarter', days: 91, interval: d3.timeMonth.every(3), major: d3.timeYear,
+                  format: d => `Q${Math.floor(d.getMonth() / 3) + 1} ${d.getFullYear()}` },
+                { name: 'year', days: 365, interval: d3.timeYear, major: null,
+                  format: d3.timeFormat('%Y') }
+            ];
+        },
+        
+        /**
+         * Width of one day on a time scale, in pixels
+         */
+        dayWidth: function(scale) {
+            const start = scale.domain()[0];
+            return scale(d3.timeDay.offset(start, 1)) - scale(start);
+        },
+        
+        /**
+         * The finest level whose ticks are at least minSpacing pixels apart
+         *
+         * Returns the level plus dayWidth and showWeekends.
+         */
+        choose: function(scale, minSpacing) {
+            const dayWidth = this.dayWidth(scale);
+            const spacing = minSpacing || this.MIN_TICK_SPACING;
+            const levels = this.levels();
+            const level = levels.find(candidate => candidate.days * dayWidth >= spacing) || levels[levels.length - 1];
+            return Object.assign({
+                dayWidth: dayWidth,
+                showWeekends: dayWidth >= this.WEEKEND_MIN_DAY_WIDTH
+            }, level);
+        },
+        
+        /**
+         * Create or update an SVG pattern shading Saturdays and Sundays; returns its fill URL
+         */
+        weekendPattern: function(defs, id, scale, color) {
+            const dayWidth = this.dayWidth(scale);
+            let pattern = defs.select(`#${id}`);
+            if (pattern.empty()) {
+                pattern = defs.append('pattern')
+                    .attr('id', id)
+                    .attr('patternUnits', 'userSpaceOnUse')
+                    .attr('y', 0)
+                    .attr('height', 1);
+                pattern.append('rect')
+                    .attr('y', 0)
+                    .attr('height', 1)
+                    .attr('fill', color);
+            }
+            pattern.attr('x', scale(d3.timeSaturday.ceil(scale.domain()[0])))
+                .attr('width', 7 * dayWidth);
+            pattern.select('rect')
+                .attr('x', 0)
+                .attr('width', 2 * dayWidth);
+            return `url(#${id})`;
+        },
+        
+        /**
+         * Weekend bands [{x, width}] across a time scale, e.g. for CQSS_CanvasRenderer
+         */
+        weekendBands: function(scale) {
+            const [start, end] = scale.domain();
+            const dayWidth = this.dayWidth(scale);
+            return d3.timeSaturday.range(d3.timeDay.offset(start, -1), end)
+                .map(saturday => ({ x: scale(saturday), width: 2 * dayWidth }));
+        }
+    };
+    
+    /**
+     * Zoom and Pan
+     *
+     * Ctrl/Cmd + wheel, a trackpad pinch and the zoom buttons change how wide
+     * a day is, anchored at the pointer (or the middle of the view); panning
+     * stays native scrolling. d3.zoom holds the transform, whose x is the
+     * plot's offset from the viewport's left edge and follows the scroll
+     * position. Zoom events are coalesced into one redraw per animation frame
+     * that widens the content and moves the existing bars, grid lines and
+     * labels in place, so row recycling, selection and filters are unaffected.
+     */
+    window.CQSS_Zoom = {
+        // Zooming in stops once a day is this many pixels wide
+        MAX_DAY_WIDTH: 240,
+        // Scale factor of one zoom button press
+        STEP: 1.5,
+        
+        /**
+         * Make a horizontally scrolling viewport zoomable
+         *
+         * Options:
+         *   width      - plot width in pixels at scale 1
+         *   dayWidth   - width of one day at scale 1 (zooming in stops at MAX_DAY_WIDTH)
+         *   offsetLeft - x of the plot inside the viewport's scrolled content (default: 0)
+         *   minScale   - smallest scale (default: the whole plot fits the viewport, at most 1)
+         *   maxScale   - largest scale
+         *   onZoom     - function(k, controller) that resizes the content for scale k;
+         *                tracked elements are moved right after it
+         *
+         * Returns a controller with scale(), track(root, selector), zoomBy(factor),
+         * zoomIn(), zoomOut(), reset() and destroy().
+         */
+        attach: function(viewport, options) {
+            if (viewport.__cqssZoom) {
+                viewport.__cqssZoom.destroy();
+            }
+            
+            const offsetLeft = options.offsetLeft || 0;
+            const visibleWidth = viewport.clientWidth - offsetLeft;
+            const minScale = options.minScale !== undefined
+                ? options.minScale
+                : Math.min(1, visibleWidth > 0 ? visibleWidth / options.width : 1);
+            const maxScale = options.maxScale !== undefined
+                ? options.maxScale
+                : Math.max(1, options.dayWidth ? this.MAX_DAY_WIDTH / options.dayWidth : 1);
+            const step = this.STEP;
+            const selection = d3.select(viewport);
+            const tracked = new Map(); // root element -> selector of its zoomable descendants
+            let k = 1;
+            let pending = null;
+            let frame = null;
+            let syncing = false;
+            
+            // Remember an element's geometry at scale 1, from its position at the current scale
+            function remember(element) {
+                const isSvg = element instanceof SVGElement;
+                const x = isSvg ? element.getAttribute('x') : element.style.left;
+                const width = isSvg ? element.getAttribute('width') : element.style.width;
+                element.__cqssZoom = {
+                    x: x === null || x === '' ? null : parseFloat(x) / k,
+                    width: width === null || width === '' ? null : parseFloat(width) / k
+                };
+            }
+            
+            function place(element) {
+                const base = element.__cqssZoom;
+                if (element instanceof SVGElement) {
+                    if (base.x !== null) element.setAttribute('x', base.x * k);
+                    if (base.width !== null) element.setAttribute('width', base.width * k);
+                    return;
+                }
+                if (base.x !== null) element.style.left = (base.x * k) + 'px';
+                if (base.width !== null) {
+                    const width = (base.width * k) + 'px';
+                    element.style.width = width;
+                    // Fixed-width columns pin their size with min/max widths too
+                    if (element.style.minWidth) element.style.minWidth = width;
+                    if (element.style.maxWidth) element.style.maxWidth = width;
+                }
+            }
+            
+            // Apply the latest transform: resize the content, move tracked elements, then scroll
+            function apply() {
+                frame = null;
+                const transform = pending;
+                pending = null;
+                k = transform.k;
+                options.onZoom(k, controller);
+                tracked.forEach((selector, root) => {
+                    if (!root.isConnected) {
+                        tracked.delete(root);
+                        return;
+                    }
+                    root.querySelectorAll(selector).forEach(element => {
+                        if (element.__cqssZoom) place(element);
+                    });
+                });
+                viewport.scrollLeft = offsetLeft - transform.x;
+                sync();
+            }
+            
+            // Keep the stored transform in step with the scroll position so the next zoom anchors correctly
+            function sync() {
+                if (frame !== null) return;
+                syncing = true;
+                selection.call(zoom.transform, d3.zoomIdentity.translate(offsetLeft - viewport.scrollLeft, 0).scale(k));
+                syncing = false;
+            }
+            
+            const zoom = d3.zoom()
+                .scaleExtent([minScale, maxScale])
+                // Plain wheel, drag and touch keep scrolling the viewport
+                .filter(event => event.type === 'wheel' && (event.ctrlKey || event.metaKey))
+                .touchable(() => false)
+                .on('zoom', event => {
+                    if (syncing) return;
+                    pending = event.transform;
+                    if (frame === null) {
+                        frame = requestAnimationFrame(apply);
+                    }
+                });
+            
+            // Middle of the visible part of the viewport, in the viewport's coordinates
+            function center() {
+                return [viewport.clientWidth / 2, 0];
+            }
+            
+            const controller = {
+                /**
+                 * Current scale (1 = unzoomed)
+                 */
+                scale: function() {
+                    return k;
+                },
+                
+                /**
+                 * Move the elements under root matching selector with the zoom
+                 *
+                 * Their x and width (attributes for SVG, left and width styles
+                 * for HTML) are read as laid out at the current scale. Call again
+                 * after re-rendering root's content, e.g. from a renderRow callback.
+                 */
+                track: function(root, selector) {
+                    tracked.set(root, selector);
+                    root.querySelectorAll(selector).forEach(remember);
+                },
+                
+                /**
+                 * Multiply the scale by factor around the middle of the view
+                 */
+                zoomBy: function(factor) {
+                    selection.call(zoom.scaleBy, factor, center());
+                },
+                
+                zoomIn: function() {
+                    controller.zoomBy(step);
+                },
+                
+                zoomOut: function() {
+                    controller.zoomBy(1 / step);
+                },
+                
+                /**
+                 * Return to scale 1 around the middle of the view
+                 */
+                reset: function() {
+                    selection.call(zoom.scaleTo, 1, center());
+                },
+                
+                /**
+                 * Remove the zoom behavior and listeners
+                 */
+                destroy: function() {
+                    selection.on('.zoom', null);
+                    viewport.removeEventListener('scroll', sync);
+                    if (frame !== null) cancelAnimationFrame(frame);
+                    frame = null;
+                    tracked.clear();
+                    delete viewport.__cqssZoom;
+                }
+            };
+            
+            selection.call(zoom);
+            viewport.addEventListener('scroll', sync, { passive: true });
+            viewport.__cqssZoom = controller;
+            sync();
+            return controller;
+        },
+        
+        /**
+         * Wire the #zoom-in, #zoom-out and #zoom-reset buttons, if present, to a controller
+         */
+        bindControls: function(controller) {
+            const actions = {
+                'zoom-in': controller.zoomIn,
+                'zoom-out': controller.zoomOut,
+                'zoom-reset': controller.reset
+            };
+            Object.keys(actions).forEach(id => {
+                const button = document.getElementById(id);
+                if (button) {
+                    button.onclick = () => actions[id]();
+                }
+            });
+        }
+    };
+    
+    /**
+     * Virtualized Row Rendering
+     *
+     * Renders only the rows in or near the viewport and recycles their DOM
+     * nodes while scrolling, so the node count stays constant however many
+     * projects there are. Rows can be HTML elements (absolutely positioned in
+     * an inner sizer div) or SVG groups (translated inside the given <g>).
+     */
+    window.CQSS_VirtualRows = {
+        // Below this many rows everything is rendered up front
+        DEFAULT_MIN_ROWS: 200,
+        // Extra rows rendered above and below the viewport
+        DEFAULT_OVERSCAN: 8,
+        
+        /**
+         * Render items into container as virtual rows
+         *
+         * Options:
+         *   viewport   - scrolling element that determines visible rows (default: container)
+         *   rowHeight  - row pitch in pixels
+         *   renderRow  - function(element, item, index) that (re)builds a row's content
+         *   createRow  - optional function() returning a new row element
+         *   offsetTop  - SVG only: y of the first row inside the owner <svg>
+         *   overscan   - rows rendered beyond each edge of the viewport
+         *   minRows    - render all rows when there are at most this many
+         *
+         * Returns a controller with update(), setItems(items), refresh(),
+         * scrollToIndex(i) and destroy().
+         */
+        render: function(container, items, options) {
+            if (container.__cqssVirtualRows) {
+                container.__cqssVirtualRows.destroy();
+            }
+            
+            const isSvg = container instanceof SVGElement;
+            const viewport = options.viewport || container;
+            let rowHeight = options.rowHeight;
+            let offsetTop = options.offsetTop || 0;
+            const overscan = options.overscan !== undefined ? options.overscan : this.DEFAULT_OVERSCAN;
+            const minRows = options.minRows !== undefined ? options.minRows : this.DEFAULT_MIN_ROWS;
+            let virtual = items.length > minRows;
+            let listening = false;
+            
+            // HTML rows live in a sizer that gives the container its full scroll height
+            let canvas = container;
+            if (!isSvg) {
+                canvas = document.createElement('div');
+                canvas.className = 'cqss-virtual-rows';
+                canvas.style.position = 'relative';
+                canvas.style.width = '100%';
+                container.appendChild(canvas);
+            }
+            
+            const createRow = options.createRow || function() {
+                return isSvg
+                    ? document.createElementNS('http://www.w3.org/2000/svg', 'g')
+                    : document.createElement('div');
+            };
+            
+            const assigned = new Map(); // row index -> element
+            const spare = [];
+            let frame = null;
+            
+            function setCanvasHeight() {
+                if (!isSvg) {
+                    canvas.style.height = (items.length * rowHeight) + 'px';
+                }
+            }
+            
+            function placeRow(element, index) {
+                const y = index * rowHeight;
+                if (isSvg) {
+                    element.setAttribute('transform', `translate(0,${y})`);
+                    element.removeAttribute('display');
+                } else {
+                    element.style.position = 'absolute';
+                    element.style.left = '0';
+                    element.style.right = '0';
+                    element.style.top = y + 'px';
+                    element.style.display = '';
+                }
+            }
+            
+            function hideRow(element) {
+                if (isSvg) {
+                    element.setAttribute('display', 'none');
+                } else {
+                    element.style.display = 'none';
+                }
+            }
+            
+            // Position of the first row relative to the top of the viewport
+            function rowsOffset() {
+                const rowsTop = isSvg
+                    ? container.ownerSVGElement.getBoundingClientRect().top + offsetTop
+                    : canvas.getBoundingClientRect().top;
+                return rowsTop - viewport.getBoundingClientRect().top;
+            }
+            
+            function visibleRange() {
+                if (!virtual) return [0, items.length];
+                
+                const scrolled = -rowsOffset();
+                const first = Math.max(0, Math.floor(scrolled / rowHeight) - overscan);
+                const last = Math.min(items.length, Math.ceil((scrolled + viewport.clientHeight) / rowHeight) + overscan);
+                return [first, Math.max(first, last)];
+            }
+            
+            /**
+             * Assign nodes to the visible rows; nodes in reusable (item -> node)
+             * already show their item and are only moved into place
+             */
+            function layout(reusable) {
+                frame = null;
+                const [first, last] = visibleRange();
+                
+                assigned.forEach((element, index) => {
+                    if (index < first || index >= last) {
+                        assigned.delete(index);
+                        spare.push(element);
+                    }
+                });
+                
+                if (reusable) {
+                    for (let index = first; index < last; index++) {
+                        const element = reusable.get(items[index]);
+                        if (element) {
+                            reusable.delete(items[index]);
+                            placeRow(element, index);
+                            assigned.set(index, element);
+                        }
+                    }
+                    reusable.forEach(element => spare.push(element));
+                }
+                
+                for (let index = first; index < last; index++) {
+                    if (assigned.has(index)) continue;
+                    let element = spare.pop();
+                    if (!element) {
+                        element = createRow();
+                        canvas.appendChild(element);
+                    }
+                    placeRow(element, index);
+                    options.renderRow(element, items[index], index);
+                    assigned.set(index, element);
+                }
+                
+                // Unused nodes stay in the DOM for reuse
+                spare.forEach(hideRow);
+            }
+            
+            const controller = {
+                items: items,
+                
+                /**
+                 * Render rows entering the viewport, reusing nodes of rows that left it
+                 */
+                update: function() {
+                    layout(null);
+                },
+                
+                /**
+                 * Show a new list of items (e.g. after filtering) without rebuilding
+                 *
+                 * Rows whose item is still shown keep their node and content and are
+                 * only moved; nodes of hidden items are recycled for newly shown ones.
+                 * changes may set a new rowHeight or offsetTop, which re-renders the rows.
+                 */
+                setItems: function(newItems, changes) {
+                    changes = changes || {};
+                    const geometryChanged = (changes.rowHeight !== undefined && changes.rowHeight !== rowHeight) ||
+                        (changes.offsetTop !== undefined && changes.offsetTop !== offsetTop);
+                    if (changes.rowHeight !== undefined) rowHeight = changes.rowHeight;
+                    if (changes.offsetTop !== undefined) offsetTop = changes.offsetTop;
+                    
+                    const reusable = new Map();
+                    assigned.forEach((element, index) => {
+                        if (geometryChanged) {
+                            spare.push(element);
+                        } else {
+                            reusable.set(items[index], element);
+                        }
+                    });
+                    assigned.clear();
+                    
+                    items = newItems;
+                    controller.items = newItems;
+                    virtual = items.length > minRows;
+                    if (virtual) listen();
+                    setCanvasHeight();
+                    layout(reusable);
+                },
+                
+                /**
+                 * Rebuild every rendered row (e.g. after row content changed)
+                 */
+                refresh: function() {
+                    assigned.forEach((element, index) => options.renderRow(element, items[index], index));
+                },
+                
+                /**
+                 * Scroll the viewport so a row is visible
+                 */
+                scrollToIndex: function(index) {
+                    const rowTop = rowsOffset() + index * rowHeight;
+                    if (rowTop < 0 || rowTop + rowHeight > viewport.clientHeight) {
+                        viewport.scrollTop += rowTop - (viewport.clientHeight - rowHeight) / 2;
+                    }
+                },
+                
+                /**
+                 * Number of row nodes currently in the DOM
+                 */
+                nodeCount: function() {
+                    return assigned.size + spare.length;
+                },
+                
+                /**
+                 * Remove rows and listeners
+                 */
+                destroy: function() {
+                    viewport.removeEventListener('scroll', schedule);
+                    window.removeEventListener('resize', schedule);
+                    listening = false;
+                    if (frame !== null) cancelAnimationFrame(frame);
+                    if (isSvg) {
+                        assigned.forEach(element => element.remove());
+                        spare.forEach(element => element.remove());
+                    } else {
+                        canvas.remove();
+                    }
+                    assigned.clear();
+                    spare.length = 0;
+                    delete container.__cqssVirtualRows;
+                }
+            };
+            
+            // Coalesce scroll and resize events into one update per frame
+            function schedule() {
+                if (frame === null) {
+                    frame = requestAnimationFrame(controller.update);
+                }
+            }
+            
+            function listen() {
+                if (listening) return;
+                viewport.addEventListener('scroll', schedule, { passive: true });
+                window.addEventListener('resize', schedule);
+                listening = true;
+            }
+            
+            if (virtual) listen();
+            setCanvasHeight();
+            
+            container.__cqssVirtualRows = controller;
+            controller.update();
+            return controller;
+        }
+    };
+    
+    /**
+     * Canvas Rendering Backend
+     *
+     * Draws stage bars, progress fills, background bands and the today line on
+     * a single viewport-sized canvas instead of one element per stage. Bars of
+     * the visible rows are batched into one path per fill style, and tooltips
+     * and clicks are resolved through a d3.quadtree of bar positions rather
+     * than per-element event listeners.
+     */
+    window.CQSS_CanvasRenderer = {
+        /**
+         * Draw rows of bars into host, redrawing the visible part on scroll
+         *
+         * Options:
+         *   viewport      - scrolling element (default: host)
+         *   width, height - plot size in pixels
+         *   offsetLeft    - x of the plot inside host (default: 0)
+         *   offsetTop     - y of the first row inside host (default: 0)
+         *   rows          - row items
+         *   rowHeight     - row pitch in pixels
+         *   barTop        - y of the bars inside a row
+         *   barHeight     - bar height in pixels
+         *   radius        - bar corner radius
+         *   bars          - function(item) returning [{x, width, color, opacity, progress}];
+         *                   called once per item, the bars are reused when rows change
+         *   progressColor - fill drawn over the completed part (default: the bar colour, opaque)
+         *   bands         - background bands [{x, width}], e.g. weekends, filled with bandColor
+         *   todayX        - x of the today line, if any (todayColor)
+         *   scaleX        - zoom scale the x coordinates above are given at (default: 1, see CQSS_Zoom)
+         *   onHover       - function(hit, event) when the pointer enters a bar
+         *   onMove        - function(hit, event) while the pointer moves over a bar
+         *   onLeave       - function(event) when the pointer leaves a bar
+         *   onClick       - function(hit, event) when a bar is clicked
+         *
+         * A hit is {item, index, stageIndex, bar}. Returns a controller with
+         * redraw(), setItems(rows), setZoom(k), hitTest(x, y), select(hit) and destroy().
+         */
+        render: function(host, options) {
+            if (host.__cqssCanvas) {
+                host.__cqssCanvas.destroy();
+            }
+            
+            const viewport = options.viewport || host;
+            let rows = options.rows;
+            let rowHeight = options.rowHeight;
+            let barTop = options.barTop || 0;
+            let plotHeight = options.height;
+            const barHeight = options.barHeight;
+            const radius = options.radius || 0;
+            const offsetLeft = options.offsetLeft || 0;
+            let offsetTop = options.offsetTop || 0;
+            // Horizontal geometry is kept at scale 1 and multiplied by scaleX when drawn
+            let scaleX = options.scaleX || 1;
+            let bands = unscaleBands(options.bands || []);
+            let todayX = options.todayX !== undefined && options.todayX !== null ? options.todayX / scaleX : null;
+            const bandColor = options.bandColor || 'rgba(0, 0, 0, 0.04)';
+            const todayColor = options.todayColor || '#dc3545';
+            const selectedColor = options.selectedColor || '#212529';
+            
+            // Bars are built once per item; rows only change their vertical position
+            const barCache = new WeakMap();
+            let rowBars = [];
+            let maxBarWidth = 0;
+            let quadtree = null;
+            
+            function unscaleBands(scaledBands) {
+                return scaledBands.map(band => ({ x: band.x / scaleX, width: band.width / scaleX }));
+            }
+            
+            // Position every bar: grouped by row for drawing, indexed by position for hit-testing
+            function layoutBars() {
+                rowBars = new Array(rows.length);
+                const allBars = [];
+                rows.forEach((item, index) => {
+                    let bars = barCache.get(item);
+                    if (!bars) {
+                        bars = options.bars(item);
+                        bars.forEach((bar, stageIndex) => {
+                            bar.stageIndex = stageIndex;
+                            bar.x /= scaleX;
+                            bar.width /= scaleX;
+                            if (bar.width > maxBarWidth) maxBarWidth = bar.width;
+                        });
+                        barCache.set(item, bars);
+                    }
+                    const y = index * rowHeight + barTop;
+                    bars.forEach(bar => {
+                        bar.y = y;
+                        bar.index = index;
+                        allBars.push(bar);
+                    });
+                    rowBars[index] = bars;
+                });
+                quadtree = d3.quadtree()
+                    .x(bar => bar.x)
+                    .y(bar => bar.y)
+                    .addAll(allBars);
+            }
+            layoutBars();
+            
+            if (getComputedStyle(host).position === 'static') {
+                host.style.position = 'relative';
+            }
+            const canvas = document.createElement('canvas');
+            canvas.className = 'cqss-canvas-layer';
+            canvas.style.position = 'absolute';
+            canvas.style.left = '0';
+            canvas.style.top = '0';
+            host.appendChild(canvas);
+            const context = canvas.getContext('2d');
+            
+            let view = { left: 0, top: 0, width: 0, height: 0 };
+            let frame = null;
+            let hovered = null;
+            let selected = null; // selected bar
+            
+            // Part of the host's content area currently visible in the viewport
+            function visibleRect() {
+                let left, top;
+                if (viewport === host) {
+                    left = host.scrollLeft;
+                    top = host.scrollTop;
+                } else {
+                    const hostRect = host.getBoundingClientRect();
+                    const viewportRect = viewport.getBoundingClientRect();
+                    left = viewportRect.left + viewport.clientLeft - hostRect.left;
+                    top = viewportRect.top + viewport.clientTop - hostRect.top;
+                }
+                left = Math.max(0, left);
+                top = Math.max(0, top);
+                return {
+                    left: left,
+                    top: top,
+                    width: Math.max(0, Math.min(viewport.clientWidth, offsetLeft + options.width * scaleX - left)),
+                    height: Math.max(0, Math.min(viewport.clientHeight, offsetTop + plotHeight - top))
+                };
+            }
+            
+            // Path of a bar, or of its first fraction (the progress fill)
+            function addBarPath(bar, fraction) {
+                const x = bar.x * scaleX;
+                const width = bar.width * scaleX * fraction;
+                if (radius && context.roundRect) {
+                    context.roundRect(x, bar.y, width, barHeight, Math.min(radius, width / 2));
+                } else {
+                    context.rect(x, bar.y, width, barHeight);
+                }
+            }
+            
+            function fillBatches(batches) {
+                batches.forEach(batch => {
+                    context.globalAlpha = batch.opacity;
+                    context.fillStyle = batch.color;
+                    context.beginPath();
+                    batch.bars.forEach(bar => addBarPath(bar, batch.progress ? bar.progress / 100 : 1));
+                    context.fill();
+                });
+                context.globalAlpha = 1;
+            }
+            
+            function draw() {
+                frame = null;
+                view = visibleRect();
+                const ratio = window.devicePixelRatio || 1;
+                const pixelWidth = Math.round(view.width * ratio);
+                const pixelHeight = Math.round(view.height * ratio);
+                if (canvas.width !== pixelWidth || canvas.height !== pixelHeight) {
+                    canvas.width = pixelWidth;
+                    canvas.height = pixelHeight;
+                    canvas.style.width = view.width + 'px';
+                    canvas.style.height = view.height + 'px';
+                }
+                canvas.style.left = view.left + 'px';
+                canvas.style.top = view.top + 'px';
+                
+                context.setTransform(ratio, 0, 0, ratio, 0, 0);
+                context.clearRect(0, 0, view.width, view.height);
+                context.translate(offsetLeft - view.left, offsetTop - view.top);
+                
+                // Visible window in plot coordinates
+                const left = view.left - offsetLeft;
+                const right = left + view.width;
+                const top = view.top - offsetTop;
+                const bottom = top + view.height;
+                
+                if (bands.length) {
+                    context.fillStyle = bandColor;
+                    context.beginPath();
+                    bands.forEach(band => {
+                        const x = band.x * scaleX;
+                        const width = band.width * scaleX;
+                        if (x < right && x + width > left) {
+                            context.rect(x, top, width, view.height);
+                        }
+                    });
+                    context.fill();
+                }
+                
+                // One path per fill style for all visible bars, and one per style for progress fills
+                const barBatches = new Map();
+                const progressBatches = new Map();
+                const first = Math.max(0, Math.floor(top / rowHeight));
+                const last = Math.min(rows.length, Math.ceil(bottom / rowHeight));
+                for (let index = first; index < last; index++) {
+                    rowBars[index].forEach(bar => {
+                        if (bar.x * scaleX > right || (bar.x + bar.width) * scaleX < left) return;
+                        
+                        const opacity = bar.opacity !== undefined ? bar.opacity : 1;
+                        const key = bar.color + '|' + opacity;
+                        if (!barBatches.has(key)) {
+                            barBatches.set(key, { color: bar.color, opacity: opacity, progress: false, bars: [] });
+                        }
+                        barBatches.get(key).bars.push(bar);
+                        
+                        if (bar.progress > 0 && bar.progress < 100) {
+                            const progressColor = options.progressColor || bar.color;
+                            if (!progressBatches.has(progressColor)) {
+                                progressBatches.set(progressColor, { color: progressColor, opacity: 1, progress: true, bars: [] });
+                            }
+                            progressBatches.get(progressColor).bars.push(bar);
+                        }
+                    });
+                }
+                fillBatches(barBatches);
+                fillBatches(progressBatches);
+                
+                if (selected && selected.y + barHeight >= top && selected.y <= bottom) {
+                    context.strokeStyle = selectedColor;
+                    context.lineWidth = 2;
+                    context.beginPath();
+                    addBarPath(selected, 1);
+                    context.stroke();
+                }
+                
+                if (todayX !== null && todayX * scaleX >= left && todayX * scaleX <= right) {
+                    context.strokeStyle = todayColor;
+                    context.lineWidth = 2;
+                    context.beginPath();
+                    context.moveTo(todayX * scaleX, top);
+                    context.lineTo(todayX * scaleX, bottom);
+                    context.stroke();
+                }
+            }
+            
+            // Pointer position in plot coordinates
+            function plotPoint(event) {
+                const rect = canvas.getBoundingClientRect();
+                return [
+                    event.clientX - rect.left + view.left - offsetLeft,
+                    event.clientY - rect.top + view.top - offsetTop
+                ];
+            }
+            
+            const controller = {
+                /**
+                 * Redraw on the next animation frame
+                 */
+                redraw: function() {
+                    if (frame === null) {
+                        frame = requestAnimationFrame(draw);
+                    }
+                },
+                
+                /**
+                 * Show a new list of rows (e.g. after filtering) and redraw
+                 *
+                 * changes may set a new height, rowHeight, barTop or offsetTop.
+                 */
+                setItems: function(newRows, changes) {
+                    changes = changes || {};
+                    if (changes.height !== undefined) plotHeight = changes.height;
+                    if (changes.rowHeight !== undefined) rowHeight = changes.rowHeight;
+                    if (changes.barTop !== undefined) barTop = changes.barTop;
+                    if (changes.offsetTop !== undefined) offsetTop = changes.offsetTop;
+                    
+                    rows = newRows;
+                    hovered = null;
+                    layoutBars();
+                    // Keep the selection only while its project is still shown
+                    if (selected && !(rowBars[selected.index] || []).includes(selected)) selected = null;
+                    controller.redraw();
+                },
+                
+                /**
+                 * Redraw at zoom scale k (see CQSS_Zoom)
+                 *
+                 * changes may set new bands or todayX, given at scale k.
+                 */
+                setZoom: function(k, changes) {
+                    changes = changes || {};
+                    scaleX = k;
+                    if (changes.bands !== undefined) bands = unscaleBands(changes.bands);
+                    if (changes.todayX !== undefined) todayX = changes.todayX === null ? null : changes.todayX / scaleX;
+                    controller.redraw();
+                },
+                
+                /**
+                 * Topmost bar under a point in plot coordinates, or null
+                 */
+                hitTest: function(x, y) {
+                    // The quadtree holds bars at scale 1
+                    x /= scaleX;
+                    let found = null;
+                    quadtree.visit((node, x0, y0, x1, y1) => {
+                        if (!node.length) {
+                            let leaf = node;
+                            do {
+                                const bar = leaf.data;
+                                if (x >= bar.x && x <= bar.x + bar.width && y >= bar.y && y <= bar.y + barHeight &&
+                                    (!found || bar.stageIndex > found.stageIndex)) {
+                                    found = bar;
+                                }
+                            } while ((leaf = leaf.next));
+                        }
+                        // Skip quadrants whose bars all start too far away to cover the point
+                        return x0 > x || x1 < x - maxBarWidth || y0 > y || y1 < y - barHeight;
+                    });
+                    return found && { item: rows[found.index], index: found.index, stageIndex: found.stageIndex, bar: found };
+                },
+                
+                /**
+                 * Outline a bar as selected (null clears the selection)
+                 */
+                select: function(hit) {
+                    selected = hit ? hit.bar : null;
+                    controller.redraw();
+                },
+                
+                /**
+                 * Remove the canvas and its listeners
+                 */
+                destroy: function() {
+                    viewport.removeEventListener('scroll', controller.redraw);
+                    window.removeEventListener('resize', controller.redraw);
+                    if (frame !== null) cancelAnimationFrame(frame);
+                    canvas.remove();
+                    delete host.__cqssCanvas;
+                }
+            };
+            
+            canvas.addEventListener('mousemove', event => {
+                const [x, y] = plotPoint(event);
+                const hit = controller.hitTest(x, y);
+                if (hovered && (!hit || hit.bar !== hovered.bar)) {
+                    if (options.onLeave) options.onLeave(event);
+                }
+                if (hit && (!hovered || hit.bar !== hovered.bar)) {
+                    if (options.onHover) options.onHover(hit, event);
+                } else if (hit && options.onMove) {
+                    options.onMove(hit, event);
+                }
+                hovered = hit;
+                canvas.style.cursor = hit ? 'pointer' : '';
+            });
+            
+            canvas.addEventListener('mouseleave', event => {
+                if (hovered && options.onLeave) options.onLeave(event);
+                hovered = null;
+            });
+            
+            canvas.addEventListener('click', event => {
+                const [x, y] = plotPoint(event);
+                const hit = controller.hitTest(x, y);
+                controller.select(hit);
+                if (hit) {
+                    event.stopPropagation();
+                    if (options.onClick) options.onClick(hit, event);
+                }
+            });
+            
+            viewport.addEventListener('scroll', controller.redraw, { passive: true });
+            window.addEventListener('resize', controller.redraw);
+            
+            host.__cqssCanvas = controller;
+            draw();
+            return controller;
         }
     };
     
@@ -0,0 +1,50 @@
+/**
+ * CQSS D3.js Loader (bundled pages)
+ * Stand-in for static/js/d3-loader.js when D3.js is part of the page bundle (see src/bundler.py)
+ */
+
+(function(window) {
+    'use strict';
+
+    const error = typeof window.d3 === 'undefined'
+        ? new Error('D3.js is missing from the page bundle')
+        : null;
+
+    /**
+     * Same API as the runtime loader; D3.js is already in the page, so nothing is fetched
+     */
+    window.CQSS_D3Loader = {
+        load: function() {
+            return error ? Promise.reject(error) : Promise.resolve(window.d3);
+        },
+
+        isLoaded: function() {
+            return !error;
+        },
+
+        getState: function() {
+            return {
+                loaded: !error,
+                loading: false,
+                error: error,
+                retryCount: 0
+            };
+        }
+    };
+
+    // Convenience method for backward compatibility
+    window.loadD3 = function(callback) {
+        window.CQSS_D3Loader.load()
+            .then(d3 => {
+                if (typeof callback === 'function') {
+                    callback(null, d3);
+                }
+            })
+            .catch(loadError => {
+                if (typeof callback === 'function') {
+                    callback(loadError, null);
+                }
+            });
+    };
+
+})(window);
@@ -0,0 +1,268 @@
+/**
+ * CQSS Payload Decoder
+ * Expands the compact (optionally gzip+base64) project payload into the
+ * projectData array every template expects. Inlined by the generator.
+ */
+
+(function(window) {
+    'use strict';
+
+    const SECONDS_PER_DAY = 86400;
+    const SUPPORTED_VERSION = 1;
+
+    // DEFLATE (RFC 1951) length and distance tables
+    const LENGTH_BASE = [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 17, 19, 23, 27, 31, 35, 43, 51, 59, 67, 83, 99, 115, 131, 163, 195, 227, 258];
+    const LENGTH_EXTRA = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 0];
+    const DIST_BASE = [1, 2, 3, 4, 5, 7, 9, 13, 17, 25, 33, 49, 65, 97, 129, 193, 257, 385, 513, 769, 1025, 1537, 2049, 3073, 4097, 6145, 8193, 12289, 16385, 24577];
+    const DIST_EXTRA = [0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10, 11, 11, 12, 12, 13, 13];
+    const CODE_LENGTH_ORDER = [16, 17, 18, 0, 8, 7, 9, 6, 10, 5, 11, 4, 12, 3, 13, 2, 14, 1, 15];
+
+    /**
+     * Build a canonical Huffman decoding table from code lengths
+     */
+    function buildHuffman(lengths) {
+        const counts = new Uint16Array(16);
+        const offsets = new Uint16Array(16);
+        const symbols = new Uint16Array(lengths.length);
+
+        for (let i = 0; i < lengths.length; i++) counts[lengths[i]]++;
+        counts[0] = 0;
+        for (let len = 1; len < 15; len++) offsets[len + 1] = offsets[len] + counts[len];
+        for (let i = 0; i < lengths.length; i++) {
+            if (lengths[i]) symbols[offsets[lengths[i]]++] = i;
+        }
+        return { counts: counts, symbols: symbols };
+    }
+
+    /**
+     * Synchronous raw DEFLATE decoder (the page builds projectData synchronously)
+     */
+    function inflate(source) {
+        let pos = 0;
+        let bitBuffer = 0;
+        let bitCount = 0;
+        let output = new Uint8Array(Math.max(1024, source.length * 4));
+        let outLength = 0;
+
+        function bits(n) {
+            while (bitCount < n) {
+                if (pos >= source.length) throw new Error('Compressed payload is truncated');
+                bitBuffer |= source[pos++] << bitCount;
+                bitCount += 8;
+            }
+            const value = bitBuffer & ((1 << n) - 1);
+            bitBuffer >>>= n;
+            bitCount -= n;
+            return value;
+        }
+
+        function ensureCapacity(extra) {
+            if (outLength + extra <= output.length) return;
+            let size = output.length * 2;
+            while (size < outLength + extra) size *= 2;
+            const grown = new Uint8Array(size);
+            grown.set(output.subarray(0, outLength));
+            output = grown;
+        }
+
+        function decodeSymbol(table) {
+            let code = 0, first = 0, index = 0;
+            for (let len = 1; len < 16; len++) {
+                code |= bits(1);
+                const count = table.counts[len];
+                if (code - count < first) return table.symbols[index + (code - first)];
+                index += count;
+                first = (first + count) << 1;
+                code <<= 1;
+            }
+            throw new Error('Invalid Huffman code in compressed payload');
+        }
+
+        function inflateBlock(literals, distances) {
+            for (;;) {
+                let symbol = decodeSymbol(literals);
+                if (symbol < 256) {
+                    ensureCapacity(1);
+                    output[outLength++] = symbol;
+                } else if (symbol === 256) {
+                    return;
+                } else {
+                    symbol -= 257;
+                    const length = LENGTH_BASE[symbol] + bits(LENGTH_EXTRA[symbol]);
+                    const distSymbol = decodeSymbol(distances);
+                    const distance = DIST_BASE[distSymbol] + bits(DIST_EXTRA[distSymbol]);
+                    ensureCapacity(length);
+                    for (let i = 0; i < length; i++, outLength++) {
+                        output[outLength] = output[outLength - distance];
+                    }
+                }
+            }
+        }
+
+        let fixedTables = null;
+        function getFixedTables() {
+            if (!fixedTables) {
+                const lengths = new Uint8Array(288);
+                lengths.fill(8, 0, 144);
+                lengths.fill(9, 144, 256);
+                lengths.fill(7, 256, 280);
+                lengths.fill(8, 280, 288);
+                fixedTables = [buildHuffman(lengths), buildHuffman(new Uint8Array(30).fill(5))];
+            }
+            return fixedTables;
+        }
+
+        function readDynamicTables() {
+            const literalCount = bits(5) + 257;
+            const distanceCount = bits(5) + 1;
+            const codeLengthCount = bits(4) + 4;
+
+            const codeLengths = new Uint8Array(19);
+            for (let i = 0; i < codeLengthCount; i++) codeLengths[CODE_LENGTH_ORDER[i]] = bits(3);
+            const codeLengthTable = buildHuffman(codeLengths);
+
+            const lengths = new Uint8Array(literalCount + distanceCount);
+            let i = 0;
+            while (i < lengths.length) {
+                const symbol = decodeSymbol(codeLengthTable);
+                if (symbol < 16) {
+                    lengths[i++] = symbol;
+                } else {
+                    let repeat, value = 0;
+                    if (symbol === 16) {
+                        if (i === 0) throw new Error('Invalid code length repeat in compressed payload');
+                        value = lengths[i - 1];
+                        repeat = 3 + bits(2);
+                    } else if (symbol === 17) {
+                        repeat = 3 + bits(3);
+                    } else {
+                        repeat = 11 + bits(7);
+                    }
+                    lengths.fill(value, i, i + repeat);
+                    i += repeat;
+                }
+            }
+            return [
+                buildHuffman(lengths.subarray(0, literalCount)),
+                buildHuffman(lengths.subarray(literalCount))
+            ];
+        }
+
+        let lastBlock = 0;
+        while (!lastBlock) {
+            lastBlock = bits(1);
+            const type = bits(2);
+            if (type === 0) {
+                // Stored block: realign to a byte boundary and copy
+                bitBuffer = 0;
+                bitCount = 0;
+                const length = source[pos] | (source[pos + 1] << 8);
+                pos += 4;
+                ensureCapacity(length);
+                output.set(source.subarray(pos, pos + length), outLength);
+                outLength += length;
+                pos += length;
+            } else if (type === 1) {
+                const tables = getFixedTables();
+                inflateBlock(tables[0], tables[1]);
+            } else if (type === 2) {
+                const tables = readDynamicTables();
+                inflateBlock(tables[0], tables[1]);
+            } else {
+                throw new Error('Invalid block type in compressed payload');
+            }
+        }
+        return output.subarray(0, outLength);
+    }
+
+    window.CQSS_PayloadDecoder = {
+        /**
+         * Decode base64 gzip data to text
+         */
+        gunzipText: function(base64) {
+            const binary = atob(base64);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+
+            if (bytes[0] !== 0x1f || bytes[1] !== 0x8b || bytes[2] !== 8) {
+                throw new Error('Payload is not gzip data');
+            }
+            const flags = bytes[3];
+            let pos = 10;
+            if (flags & 4) pos += 2 + (bytes[pos] | (bytes[pos + 1] << 8)); // FEXTRA
+            if (flags & 8) while (bytes[pos++] !== 0); // FNAME
+            if (flags & 16) while (bytes[pos++] !== 0); // FCOMMENT
+            if (flags & 2) pos += 2; // FHCRC
+
+            return new TextDecoder('utf-8').decode(inflate(bytes.subarray(pos)));
+        },
+
+        /**
+         * Expand a compact payload (object, or gzip+base64 string) into project objects
+         */
+        decode: function(payload) {
+            if (typeof payload === 'string') {
+                payload = JSON.parse(this.gunzipText(payload));
+            }
+            if (payload.version !== SUPPORTED_VERSION) {
+                throw new Error(`Unsupported payload version: ${payload.version}`);
+            }
+
+            const dicts = payload.dicts;
+            const projects = payload.projects;
+            const stages = payload.stages;
+            const unit = payload.unit;
+            const base = payload.base;
+
+            // Many stages share a date, so format each offset once
+            const isoCache = new Map();
+            function isoDate(offset) {
+                let value = isoCache.get(offset);
+                if (value === undefined) {
+                    value = new Date((base + offset * unit) * 1000).toISOString().slice(0, 19);
+                    isoCache.set(offset, value);
+                }
+                return value;
+            }
+
+            const ids = projects.id;
+            const projectData = new Array(projects.name.length);
+            let stageIndex = 0;
+
+            for (let i = 0; i < projectData.length; i++) {
+                const stageCount = projects.stage_count[i];
+                const projectStages = new Array(stageCount);
+                let firstStart = Infinity;
+                let lastEnd = -Infinity;
+
+                for (let j = 0; j < stageCount; j++, stageIndex++) {
+                    const start = stages.start[stageIndex];
+                    const end = stages.end[stageIndex];
+                    if (start < firstStart) firstStart = start;
+                    if (end > lastEnd) lastEnd = end;
+                    projectStages[j] = {
+                        name: dicts.stage_name[stages.name[stageIndex]],
+                        start: isoDate(start),
+                        end: isoDate(end),
+                        duration_days: Math.floor((end - start) * unit / SECONDS_PER_DAY),
+                        progress_percent: stages.progress[stageIndex],
+                        status: dicts.status[stages.status[stageIndex]]
+                    };
+                }
+
+                projectData[i] = {
+                    id: `project_${Array.isArray(ids) ? ids[i] : ids.range_start + i}`,
+                    name: projects.name[i],
+                    category: dicts.category[projects.category[i]],
+                    priority: dicts.priority[projects.priority[i]],
+                    description: projects.description[i],
+                    team_lead: dicts.team_lead[projects.team_lead[i]],
+                    stages: projectStages,
+                    total_duration_days: Math.floor((lastEnd - firstStart) * unit / SECONDS_PER_DAY)
+                };
+            }
+            return projectData;
+        }
+    };
+
+})(window);
@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+# Deterministic synthetic portfolios (benchmarks/synthetic_portfolio.py)
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from synthetic_portfolio import write_portfolio_csv
+
+DATA_DIR = ROOT / 'data'
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep every test's processed-data cache and served assets apart"""
+    path = tmp_path / 'cache'
+    monkeypatch.setenv('CQSS_CACHE_DIR', str(path))
+    return path
+
+
+@pytest.fixture(scope='session')
+def legacy_csv(tmp_path_factory):
+    path = tmp_path_factory.mktemp('portfolios') / 'legacy.csv'
+    write_portfolio_csv(path, 'legacy', 300)
+    return path
+
+
+@pytest.fixture(scope='session')
+def multistage_csv(tmp_path_factory):
+    path = tmp_path_factory.mktemp('portfolios') / 'multistage.csv'
+    write_portfolio_csv(path, 'multistage', 300, stages='2-6')
+    return path
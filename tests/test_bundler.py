@@ -0,0 +1,61 @@
+"""The minifier must not change what the shared scripts do"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from src.bundler import ASSETS_DIRNAME, BUNDLE_FILES, bundle_source, minify_js, render_shared_assets
+
+NODE = shutil.which('node')
+needs_node = pytest.mark.skipif(NODE is None, reason="needs node")
+
+SNIPPETS = [
+    "var a = 10; // comment\nvar b = a / 2 / 5; console.log(a, b);",
+    "var s = 'a // b'; var t = \"/* c */\"; console.log(s, t, /ab+c/g.test('xabbc') /* c */ ? 1 : 2);",
+    "var n = 2; console.log(`t ${n + 2} // ${'x'}`);",
+    "function f(x) { return\n/re/.test(x) }\nconsole.log(f('re'));",
+    "var a = 1, c = 1; a = a\n++c\nconsole.log(a, c);",
+    "var x = 4 /2/ 1; var r = [/[/]/.source, 1 / 2]; console.log(x, r.join());",
+    "console.log(((a) => a * 2)(3), typeof /x/ === 'object');"
+]
+
+
+def run_node(source):
+    return subprocess.run([NODE, '-e', source], capture_output=True, text=True, check=True).stdout
+
+
+@needs_node
+@pytest.mark.parametrize('source', SNIPPETS)
+def test_minified_snippet_behaves_the_same(source):
+    assert run_node(minify_js(source)) == run_node(source)
+
+
+def test_comments_and_whitespace_are_removed():
+    minified = minify_js("var a = 1; // one\n\n/* two */\nvar b  =  a;\n")
+    assert 'one' not in minified and 'two' not in minified
+    assert minified.split() == ['var', 'a=1;', 'var', 'b=a;']
+
+
+@needs_node
+@pytest.mark.parametrize('path', [path for path, minify in BUNDLE_FILES if minify], ids=lambda path: path.name)
+def test_minified_shared_scripts_parse(tmp_path, path):
+    minified = tmp_path / path.name
+    minified.write_text(minify_js(path.read_text(encoding='utf-8')), encoding='utf-8')
+    subprocess.run([NODE, '--check', str(minified)], check=True)
+
+
+def test_inline_bundle_cannot_close_its_script_element(tmp_path):
+    element = render_shared_assets('inline', tmp_path / 'chart.html')
+    assert element.count('</script>') == 1 and element.endswith('</script>')
+
+
+def test_hashed_bundle_is_written_once_under_its_digest(tmp_path):
+    bundle, digest = bundle_source()
+    element = render_shared_assets('hashed', tmp_path / 'chart.html')
+    asset = tmp_path / ASSETS_DIRNAME / f"cqss-bundle.{digest}.min.js"
+
+    assert element == f'<script src="{ASSETS_DIRNAME}/{asset.name}"></script>'
+    assert asset.read_text(encoding='utf-8') == bundle
+    assert render_shared_assets('hashed', tmp_path / 'other.html') == element
+    assert len(list(asset.parent.iterdir())) == 1
@@ -0,0 +1,93 @@
+"""Processed-data cache: hits, and never unpickling what another user could have planted"""
+
+import os
+import stat
+
+import pytest
+
+from src.cache import AtomicFile, ProcessedDataCache, default_cache_dir, private_dir
+from src.gantt_generator import GanttChartGenerator, load_project_data
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'getuid'), reason="needs POSIX file ownership")
+
+
+def mode(path):
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+def test_unchanged_input_is_a_hit(legacy_csv):
+    cache = ProcessedDataCache()
+    dataset, date_range = load_project_data(str(legacy_csv), cache)
+    cached, cached_range = load_project_data(str(legacy_csv), cache)
+
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert cached.to_records() == dataset.to_records()
+    assert cached_range == date_range
+
+
+def test_cache_is_private(cache_dir, legacy_csv):
+    cache = ProcessedDataCache()
+    load_project_data(str(legacy_csv), cache)
+
+    assert default_cache_dir() == cache_dir
+    assert mode(cache_dir) == 0o700
+    entries = list(cache.cache_dir.glob('*.pickle'))
+    assert len(entries) == 1 and mode(entries[0]) == 0o600
+
+
+def test_entries_of_other_users_are_not_loaded(legacy_csv, monkeypatch):
+    cache = ProcessedDataCache()
+    load_project_data(str(legacy_csv), cache)
+
+    # Seen as another user, the entry is a miss
+    monkeypatch.setattr(os, 'getuid', lambda: os.stat(cache.cache_dir).st_uid + 1)
+    key = next(cache.cache_dir.glob('*.pickle')).stem
+    assert cache.get(key) is None
+    assert cache.misses == 2
+
+
+def test_cache_dir_of_another_user_is_refused(cache_dir, monkeypatch):
+    private_dir(cache_dir)
+    monkeypatch.setattr(os, 'getuid', lambda: os.stat(cache_dir).st_uid + 1)
+    with pytest.raises(PermissionError):
+        default_cache_dir()
+
+
+def test_existing_cache_dir_is_made_private(cache_dir):
+    cache_dir.mkdir(mode=0o777)
+    os.chmod(cache_dir, 0o777)
+    default_cache_dir()
+    assert mode(cache_dir) == 0o700
+
+
+def test_unwritable_cache_dir_disables_the_cache(tmp_path, monkeypatch, legacy_csv, caplog):
+    # Below a regular file, so even root cannot create it
+    (tmp_path / 'file').write_text('')
+    monkeypatch.setenv('CQSS_CACHE_DIR', str(tmp_path / 'file' / 'cache'))
+    generator = GanttChartGenerator()
+    generator.generate_chart(str(legacy_csv), str(tmp_path / 'chart.html'))
+    generator.generate_chart(str(legacy_csv), str(tmp_path / 'chart.html'))
+
+    assert generator.cache.disabled
+    assert (generator.cache.misses, generator.cache.hits) == (2, 0)
+    assert 'Processed data cache disabled' in caplog.text
+
+
+def test_atomic_file_follows_umask(tmp_path):
+    previous = os.umask(0o027)
+    try:
+        with AtomicFile(tmp_path / 'page.html') as f:
+            f.write(b'<html></html>')
+    finally:
+        os.umask(previous)
+    assert mode(tmp_path / 'page.html') == 0o640
+
+
+def test_atomic_file_keeps_existing_mode(tmp_path):
+    path = tmp_path / 'page.html'
+    path.write_bytes(b'old')
+    os.chmod(path, 0o600)
+    with AtomicFile(path) as f:
+        f.write(b'<html></html>')
+    assert mode(path) == 0o600
+    assert path.read_bytes() == b'<html></html>'
@@ -0,0 +1,60 @@
+"""Every way of producing a chart page must write the same bytes"""
+
+import io
+
+import pytest
+
+from src.cache import AtomicFile
+from src.gantt_generator import GanttChartGenerator, load_project_data
+
+
+def generate_chart(csv_path, output_path, **kwargs):
+    GanttChartGenerator(use_cache=False).generate_chart(str(csv_path), str(output_path), **kwargs)
+    return output_path.read_bytes()
+
+
+@pytest.mark.parametrize('portfolio', ['legacy_csv', 'multistage_csv'])
+@pytest.mark.parametrize('chunk_size', [7, 64, 10000])
+def test_chunked_output_matches_generate_chart(request, tmp_path, portfolio, chunk_size):
+    csv_path = request.getfixturevalue(portfolio)
+    chunked = generate_chart(csv_path, tmp_path / 'chunked.html', chunk_size=chunk_size)
+    assert chunked == generate_chart(csv_path, tmp_path / 'full.html')
+
+
+@pytest.mark.parametrize('payload_format', ['json', 'compact', 'compact-gzip'])
+def test_streamed_page_matches_generate_chart(tmp_path, multistage_csv, payload_format):
+    generator = GanttChartGenerator(use_cache=False, payload_format=payload_format)
+    generator.generate_chart(str(multistage_csv), str(tmp_path / 'chart.html'))
+    expected = (tmp_path / 'chart.html').read_bytes()
+    dataset, date_range = load_project_data(str(multistage_csv))
+
+    stream = io.BytesIO()
+    written = generator.write_html(dataset, date_range, stream)
+    assert stream.getvalue() == expected and written == len(expected)
+    assert generator.render_bytes(dataset, date_range) == expected
+    # Plain records render the same page as the dataset
+    assert generator.render_bytes(dataset.to_records(), date_range) == expected
+
+
+def test_write_file_keeps_an_identical_file(tmp_path, legacy_csv):
+    generator = GanttChartGenerator()
+    dataset, date_range = load_project_data(str(legacy_csv))
+    output_path = tmp_path / 'chart.html'
+    generator.write_file(dataset, date_range, str(output_path))
+    first_write = output_path.stat().st_mtime_ns
+
+    generator.write_file(dataset, date_range, str(output_path))
+    assert generator.last_write_skipped
+    assert output_path.stat().st_mtime_ns == first_write
+
+
+def test_failed_write_leaves_the_previous_file(tmp_path):
+    output_path = tmp_path / 'chart.html'
+    output_path.write_bytes(b'previous')
+    with pytest.raises(RuntimeError):
+        with AtomicFile(output_path) as f:
+            f.write(b'partial')
+            raise RuntimeError("render failed")
+
+    assert output_path.read_bytes() == b'previous'
+    assert list(tmp_path.iterdir()) == [output_path]
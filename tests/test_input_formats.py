@@ -0,0 +1,85 @@
+"""Parquet, Feather and Arrow CSV input must give the same records as the pandas CSV reader"""
+
+import io
+
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from src.gantt_generator import load_project_data
+from src.input_formats import resolve_input_format
+
+pytest.importorskip('pyarrow')
+
+LEGACY_DATES = ['preparing_start', 'preparing_end', 'execution_end']
+
+
+def records(path, **kwargs):
+    dataset, date_range = load_project_data(str(path), engine='pandas', **kwargs)
+    return dataset.to_records(), date_range
+
+
+@pytest.fixture(params=['legacy_csv', 'multistage_csv'])
+def portfolio(request):
+    return request.getfixturevalue(request.param)
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.feather'])
+def test_typed_formats_match_csv(tmp_path, portfolio, suffix):
+    df = pd.read_csv(portfolio)
+    for column in LEGACY_DATES:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column])
+    # An unused column is not read
+    df['notes'] = 'ignored'
+    path = tmp_path / f'portfolio{suffix}'
+    df.to_parquet(path) if suffix == '.parquet' else df.to_feather(path)
+
+    assert records(path) == records(portfolio)
+
+
+def test_arrow_csv_matches_csv(portfolio):
+    assert records(portfolio, input_format='arrow-csv') == records(portfolio)
+
+
+def test_arrow_csv_keeps_wall_clock_time(tmp_path):
+    df = pd.read_csv(DATA_DIR / 'sample_projects.csv')
+    for column in LEGACY_DATES:
+        df[column] = df[column] + 'T09:30:00+05:00'
+    path = tmp_path / 'offsets.csv'
+    df.to_csv(path, index=False)
+
+    arrow, date_range = records(path, input_format='arrow-csv')
+    assert (arrow, date_range) == records(path)
+    assert arrow[0]['stages'][0]['start'] == '2024-01-15T09:30:00'
+
+
+def test_arrow_csv_empty_cells(tmp_path):
+    df = pd.read_csv(DATA_DIR / 'sample_projects.csv')
+    df.loc[0, 'description'] = None
+    path = tmp_path / 'empty_text.csv'
+    df.to_csv(path, index=False)
+    assert records(path, input_format='arrow-csv') == records(path)
+
+    df.loc[1, 'execution_end'] = None
+    df.to_csv(path, index=False)
+    with pytest.raises(ValueError) as expected:
+        records(path)
+    with pytest.raises(ValueError) as error:
+        records(path, input_format='arrow-csv')
+    assert str(error.value) == str(expected.value)
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.feather'])
+def test_sample_files_match_csv(suffix):
+    assert records(DATA_DIR / f'sample_projects{suffix}') == records(DATA_DIR / 'sample_projects.csv')
+
+
+def test_format_resolution():
+    assert resolve_input_format('projects.PQ') == 'parquet'
+    assert resolve_input_format('projects.arrow') == 'feather'
+    assert resolve_input_format('projects.txt') == 'csv'
+    assert resolve_input_format(io.BytesIO(b'')) == 'csv'
+    assert resolve_input_format('projects.parquet', 'csv') == 'csv'
+    with pytest.raises(ValueError, match="Unknown input format"):
+        resolve_input_format('projects.csv', 'xlsx')
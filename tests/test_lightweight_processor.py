@@ -0,0 +1,53 @@
+"""The stdlib engine hands anything it cannot read exactly to pandas"""
+
+import csv
+import json
+
+import pytest
+
+from conftest import DATA_DIR
+from src.gantt_generator import load_project_data
+from src.lightweight_processor import LightweightProcessor, UnsupportedInput
+
+
+def write_stages_csv(path, stages):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['project_name', 'category', 'priority', 'description', 'team_lead', 'stages'])
+        writer.writerow(['Alpha', 'Dev', 'High', 'Text', 'Lead', json.dumps(stages)])
+    return path
+
+
+@pytest.mark.parametrize('portfolio', ['legacy_csv', 'multistage_csv', 'sample_projects', 'mock_three_months'])
+def test_stdlib_engine_matches_pandas(request, portfolio):
+    if portfolio.endswith('_csv'):
+        csv_path = request.getfixturevalue(portfolio)
+    else:
+        csv_path = DATA_DIR / f'{portfolio}.csv'
+    dataset = LightweightProcessor().load_dataset(str(csv_path))
+    baseline, date_range = load_project_data(str(csv_path), engine='pandas')
+
+    assert dataset.to_records() == baseline.to_records()
+    assert dataset.date_range() == date_range
+
+
+@pytest.mark.parametrize('start', [['2024-01-01'], {'date': '2024-01-01'}, None, ''])
+def test_malformed_stage_date_is_unsupported(tmp_path, start):
+    csv_path = write_stages_csv(tmp_path / 'stages.csv',
+                                [{'name': 'Planning', 'start': start, 'end': '2024-02-01', 'progress': 50}])
+    with pytest.raises(UnsupportedInput):
+        LightweightProcessor().load_dataset(str(csv_path))
+    # The pandas processor then reports the error
+    with pytest.raises(ValueError, match="Row 0, Stage 0: Invalid date format"):
+        load_project_data(str(csv_path), engine='stdlib')
+
+
+def test_non_string_stage_date_falls_back_to_pandas(tmp_path):
+    # pandas reads a number as nanoseconds since the epoch; the stdlib engine leaves that to it
+    csv_path = write_stages_csv(tmp_path / 'stages.csv',
+                                [{'name': 'Planning', 'start': 20240101, 'end': '2024-02-01', 'progress': 50}])
+    with pytest.raises(UnsupportedInput):
+        LightweightProcessor().load_dataset(str(csv_path))
+    stdlib, _ = load_project_data(str(csv_path), engine='stdlib')
+    pandas, _ = load_project_data(str(csv_path), engine='pandas')
+    assert stdlib.to_records() == pandas.to_records()
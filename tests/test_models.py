@@ -0,0 +1,109 @@
+"""GanttDataset.to_records() must equal the row-by-row dicts the processor used to build"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from src.data_processor import ProjectDataProcessor
+from src.models import GanttDataset
+
+LEGACY_DATES = ['preparing_start', 'preparing_end', 'execution_end']
+
+
+def legacy_project(idx, row):
+    return {
+        'id': f"project_{idx}",
+        'name': row['project_name'],
+        'category': row['category'],
+        'priority': row['priority'],
+        'description': row['description'],
+        'team_lead': row['team_lead'],
+        'stages': [
+            {
+                'name': 'Preparing',
+                'start': row['preparing_start'].isoformat(),
+                'end': row['preparing_end'].isoformat(),
+                'duration_days': (row['preparing_end'] - row['preparing_start']).days,
+                'progress_percent': 100,
+                'status': row.get('preparing_status', 'normal')
+            },
+            {
+                'name': 'Execution',
+                'start': row['preparing_end'].isoformat(),
+                'end': row['execution_end'].isoformat(),
+                'duration_days': (row['execution_end'] - row['preparing_end']).days,
+                'progress_percent': int(row['progress_percent']),
+                'status': row.get('execution_status', 'normal')
+            }
+        ],
+        'total_duration_days': (row['execution_end'] - row['preparing_start']).days
+    }
+
+
+def multistage_project(idx, row):
+    stages, starts, ends = [], [], []
+    for stage in json.loads(row['stages']):
+        start, end = pd.to_datetime(stage['start']), pd.to_datetime(stage['end'])
+        stages.append({
+            'name': stage['name'],
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'duration_days': (end - start).days,
+            'progress_percent': int(stage['progress']),
+            'status': stage.get('status', 'normal')
+        })
+        starts.append(start)
+        ends.append(end)
+    return {
+        'id': f"project_{idx}",
+        'name': row['project_name'],
+        'category': row['category'],
+        'priority': row['priority'],
+        'description': row['description'],
+        'team_lead': row['team_lead'],
+        'stages': stages,
+        'total_duration_days': (max(ends) - min(starts)).days
+    }
+
+
+def row_by_row_records(path):
+    """The original iterrows() conversion"""
+    df = pd.read_csv(path)
+    if 'stages' in df.columns:
+        return [multistage_project(idx, row) for idx, row in df.iterrows()]
+    for column in LEGACY_DATES:
+        df[column] = pd.to_datetime(df[column])
+    return [legacy_project(idx, row) for idx, row in df.iterrows()]
+
+
+@pytest.fixture(params=['legacy_csv', 'multistage_csv', 'sample_projects', 'mock_three_months'])
+def portfolio(request):
+    if request.param.endswith('_csv'):
+        return request.getfixturevalue(request.param)
+    return DATA_DIR / f'{request.param}.csv'
+
+
+def test_records_match_row_by_row_conversion(portfolio):
+    processor = ProjectDataProcessor()
+    dataset = processor.process_to_dataset(processor.load_csv(str(portfolio)))
+
+    assert dataset.to_records() == row_by_row_records(portfolio)
+
+
+def test_from_records_round_trip(portfolio):
+    processor = ProjectDataProcessor()
+    records = processor.process_to_gantt_data(processor.load_csv(str(portfolio)))
+    dataset = GanttDataset.from_records(records)
+
+    assert dataset.to_records() == records
+    assert [record for batch in dataset.iter_record_batches(7) for record in batch] == records
+
+
+def test_select_keeps_project_ids(legacy_csv):
+    processor = ProjectDataProcessor()
+    records = processor.process_to_gantt_data(processor.load_csv(str(legacy_csv)))
+    dataset = GanttDataset.from_records(records)
+
+    assert dataset.select([4, 0, 9]).to_records() == [records[4], records[0], records[9]]
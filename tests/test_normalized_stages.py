@@ -0,0 +1,83 @@
+"""Projects plus stages tables and long-format tables must give the same records as JSON stages cells"""
+
+import pandas as pd
+import pytest
+
+from bench_normalized_stages import write_normalized_csvs
+from src.cache import ProcessedDataCache
+from src.data_processor import ProjectDataProcessor
+from src.gantt_generator import load_project_data
+
+
+@pytest.fixture
+def tables(tmp_path, multistage_csv):
+    paths = tmp_path / 'projects.csv', tmp_path / 'stages.csv', tmp_path / 'long.csv'
+    write_normalized_csvs(multistage_csv, *paths)
+    return paths
+
+
+def records(path, **kwargs):
+    dataset, date_range = load_project_data(str(path), engine='pandas', **kwargs)
+    return dataset.to_records(), date_range
+
+
+def test_two_file_matches_json_cells(tables, multistage_csv):
+    projects_path, stages_path, _ = tables
+    processor = ProjectDataProcessor()
+    dataset = processor.process_normalized_to_dataset(*processor.load_normalized(str(projects_path), str(stages_path)))
+
+    assert dataset.to_records() == records(multistage_csv)[0]
+    assert records(projects_path, stages_file=str(stages_path)) == records(multistage_csv)
+
+
+def test_long_format_matches_json_cells(tables, multistage_csv):
+    assert records(tables[2]) == records(multistage_csv)
+
+
+def test_long_format_parquet_matches_csv(tmp_path, tables):
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'long.parquet'
+    pd.read_csv(tables[2], dtype=str).to_parquet(path)
+
+    assert records(path) == records(tables[2])
+
+
+def test_stages_file_is_cached(tables, multistage_csv):
+    projects_path, stages_path, _ = tables
+    cache = ProcessedDataCache()
+    first = load_project_data(str(projects_path), cache, stages_file=str(stages_path))
+    second = load_project_data(str(projects_path), cache, stages_file=str(stages_path))
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert second[0].to_records() == first[0].to_records()
+
+    # An edited stages table is a different entry
+    stages = pd.read_csv(stages_path, dtype=str)
+    stages.loc[0, 'progress'] = '1'
+    stages.to_csv(stages_path, index=False)
+    load_project_data(str(projects_path), cache, stages_file=str(stages_path))
+    assert (cache.misses, cache.hits) == (2, 1)
+
+
+@pytest.mark.parametrize('edit, message', [
+    (lambda projects, stages: (pd.concat([projects, projects.iloc[:1]], ignore_index=True), stages),
+     "Project row 300: Duplicate project_id 'P0'"),
+    (lambda projects, stages: (projects, stages.assign(project_id=stages['project_id'].replace('P1', 'P999'))),
+     "Unknown project_id 'P999'"),
+    (lambda projects, stages: (projects, stages[stages['project_id'] != 'P2']),
+     "Project row 2: Stages must be a non-empty list"),
+    (lambda projects, stages: (projects, stages.assign(end=stages['end'].where(stages.index != 5))),
+     "Stage row 5: Missing required field 'end'"),
+    (lambda projects, stages: (projects.drop(columns='team_lead'), stages),
+     "Missing required columns for projects table"),
+    (lambda projects, stages: (projects, stages.drop(columns='progress')),
+     "Missing required columns for stages table"),
+])
+def test_invalid_tables(tables, edit, message):
+    projects_path, stages_path, _ = tables
+    projects, stages = edit(pd.read_csv(projects_path, dtype=str), pd.read_csv(stages_path, dtype=str))
+    projects.to_csv(projects_path, index=False)
+    stages.to_csv(stages_path, index=False)
+
+    with pytest.raises(ValueError, match='Error loading project data') as error:
+        ProjectDataProcessor().load_normalized(str(projects_path), str(stages_path))
+    assert message in str(error.value)
@@ -0,0 +1,64 @@
+"""The compact payloads must decode in the browser to the same projects as the JSON payload"""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from conftest import DATA_DIR
+from src.gantt_generator import load_project_data
+from src.payload import encode_compact_payload, iter_project_data, render_project_data
+
+NODE = shutil.which('node')
+needs_node = pytest.mark.skipif(NODE is None, reason="needs node")
+
+
+def decode_in_node(expression):
+    """Evaluate a payload expression like a chart page does and return the projects"""
+    source = f"const window = {{}};\nconst projectData = {expression};\nprocess.stdout.write(JSON.stringify(projectData));"
+    result = subprocess.run([NODE, '-'], input=source, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def dataset_of(path):
+    return load_project_data(str(path), engine='pandas')[0]
+
+
+@pytest.fixture(params=['legacy_csv', 'multistage_csv', 'sample_projects', 'mock_three_months'])
+def dataset(request):
+    if request.param.endswith('_csv'):
+        return dataset_of(request.getfixturevalue(request.param))
+    return dataset_of(DATA_DIR / f'{request.param}.csv')
+
+
+@needs_node
+@pytest.mark.parametrize('payload_format', ['compact', 'compact-gzip'])
+def test_compact_payload_decodes_to_json_payload(dataset, payload_format):
+    expected = json.loads(render_project_data(dataset, 'json'))
+    assert decode_in_node(render_project_data(dataset, payload_format)) == expected
+
+
+@needs_node
+@pytest.mark.parametrize('payload_format', ['compact', 'compact-gzip'])
+def test_times_of_day_and_scattered_ids(tmp_path, payload_format):
+    path = tmp_path / 'times.csv'
+    path.write_text(
+        "project_name,category,priority,preparing_start,preparing_end,execution_end,progress_percent,"
+        "description,team_lead\n"
+        "Alpha,Dev,High,2024-01-01 08:30,2024-01-02 00:00,2024-02-01 17:45,50,</script> in text,Lead\n"
+        "Beta,Ops,Low,2024-01-03 00:00,2024-01-09 00:00,2024-03-01 00:00,0,,Lead\n"
+        "Gamma,Dev,High,2024-01-05 12:00,2024-01-20 00:00,2024-04-01 09:15,100,Third,Other\n"
+    )
+    dataset = dataset_of(path).select([2, 0])
+    compact = encode_compact_payload(dataset)
+    assert compact['unit'] == 1 and isinstance(compact['projects']['id'], list)
+    expected = json.loads(render_project_data(dataset, 'json'))
+    assert decode_in_node(render_project_data(dataset, payload_format)) == expected
+
+
+@pytest.mark.parametrize('payload_format', ['json', 'compact', 'compact-gzip'])
+def test_pieces_join_to_the_payload(legacy_csv, payload_format):
+    dataset = dataset_of(legacy_csv)
+    pieces = list(iter_project_data(dataset, payload_format, batch_size=7))
+    assert ''.join(pieces) == render_project_data(dataset, payload_format)
@@ -0,0 +1,146 @@
+"""Serve mode must answer with the generator's pages, honour ETags and gzip, and refuse anything outside its root"""
+
+import gzip
+import re
+import shutil
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from conftest import DATA_DIR
+from src.gantt_generator import GanttChartGenerator, load_project_data
+from src.server import ChartService, create_server
+
+
+@pytest.fixture
+def root(tmp_path, legacy_csv):
+    root = tmp_path / 'inputs'
+    (root / 'nested').mkdir(parents=True)
+    shutil.copy(legacy_csv, root / 'legacy.csv')
+    shutil.copy(DATA_DIR / 'sample_projects.csv', root / 'nested' / 'sample.csv')
+    (tmp_path / 'secret.csv').write_text('not served\n')
+    return root
+
+
+@pytest.fixture
+def service(root):
+    return ChartService(str(root), use_cache=False)
+
+
+@pytest.fixture
+def base_url(service):
+    server = create_server(service, host='127.0.0.1', port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f'http://{host}:{port}'
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def get(url, **headers):
+    """Status, headers and body of a GET request; error statuses are returned, not raised"""
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def test_index_lists_inputs(base_url):
+    status, headers, body = get(base_url + '/')
+    assert status == 200
+    assert headers['Content-Type'].startswith('text/html')
+    assert b'legacy.csv' in body and b'nested/sample.csv' in body
+    assert b'secret.csv' not in body
+
+
+@pytest.mark.parametrize('relative_path', ['legacy.csv', 'nested/sample.csv'])
+def test_chart_matches_generator(base_url, service, root, relative_path):
+    status, headers, body = get(f'{base_url}/chart?input={relative_path}&style=minimal')
+    assert status == 200
+    assert headers['ETag']
+
+    dataset, date_range = load_project_data(str(root / relative_path), engine='pandas')
+    generator = GanttChartGenerator(style='minimal', use_cache=False, bundle='hashed')
+    assert body == generator.render_bytes(dataset, date_range, str(service._page_anchor))
+
+
+def test_etag_revalidation_and_gzip(base_url):
+    url = f'{base_url}/chart?input=legacy.csv'
+    status, headers, body = get(url)
+    etag = headers['ETag']
+
+    status, headers, revalidated = get(url, **{'If-None-Match': etag})
+    assert status == 304
+    assert revalidated == b''
+    assert headers['ETag'] == etag
+
+    status, headers, compressed = get(url, **{'Accept-Encoding': 'gzip, deflate'})
+    assert status == 200
+    assert headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(compressed) == body
+    # Each coding is its own representation with its own strong validator
+    gzip_etag = headers['ETag']
+    assert gzip_etag != etag
+
+    status, headers, _ = get(url, **{'If-None-Match': gzip_etag, 'Accept-Encoding': 'gzip'})
+    assert status == 304
+    assert headers['ETag'] == gzip_etag
+
+
+@pytest.mark.parametrize('accept_encoding, gzipped', [
+    ('gzip', True),
+    ('br, *', True),
+    ('gzip;q=0', False),
+    ('gzip; q=0.0, identity', False),
+    ('*;q=0', False),
+    ('deflate', False),
+])
+def test_accept_encoding_quality(base_url, accept_encoding, gzipped):
+    headers = get(f'{base_url}/chart?input=legacy.csv', **{'Accept-Encoding': accept_encoding})[1]
+    assert (headers['Content-Encoding'] == 'gzip') is gzipped
+
+
+def test_changed_input_is_rendered_again(base_url, root):
+    url = f'{base_url}/chart?input=nested/sample.csv'
+    etag = get(url)[1]['ETag']
+    shutil.copy(root / 'legacy.csv', root / 'nested' / 'sample.csv')
+
+    status, headers, body = get(url, **{'If-None-Match': etag})
+    assert status == 200
+    assert headers['ETag'] != etag
+
+
+@pytest.mark.parametrize('query', [
+    'input=missing.csv',
+    'input=../secret.csv',
+    'input=%2E%2E/secret.csv',
+    'input=legacy.csv&priority=Nonexistent'
+])
+def test_unknown_inputs_are_not_found(base_url, query):
+    status, headers, body = get(f'{base_url}/chart?{query}')
+    assert status == 404
+    assert b'not served' not in body
+
+
+@pytest.mark.parametrize('query', ['', 'input=legacy.csv&style=unknown', 'input=legacy.csv&payload=xml'])
+def test_bad_requests(base_url, query):
+    assert get(f'{base_url}/chart?{query}')[0] == 400
+
+
+def test_page_bundle_is_served(base_url):
+    body = get(f'{base_url}/chart?input=legacy.csv')[2].decode('utf-8')
+    name = re.search(r'src="[^"]*?assets/(cqss-bundle\.[0-9a-f]+\.min\.js)"', body).group(1)
+
+    status, headers, script = get(f'{base_url}/assets/{name}')
+    assert status == 200
+    assert headers['Content-Type'].startswith(('application/javascript', 'text/javascript'))
+    assert 'immutable' in headers['Cache-Control']
+    assert script
+
+    assert get(f'{base_url}/assets/cqss-bundle.0000.min.js')[0] == 404
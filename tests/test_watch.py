@@ -0,0 +1,98 @@
+"""Watch mode must write exactly what a full generation of the same file writes"""
+
+import shutil
+
+import pytest
+
+from src.gantt_generator import GanttChartGenerator
+from src.watch import IncrementalChartBuilder
+
+
+def generate_chart(csv_path, output_path):
+    GanttChartGenerator(use_cache=False).generate_chart(str(csv_path), str(output_path))
+    return output_path.read_bytes()
+
+
+def rename_projects(csv_path, rename):
+    """Replace the project_name (first column) of each row with rename(row_number, name)"""
+    header, *rows = csv_path.read_text().splitlines()
+    rows = [f"{rename(number, name)},{rest}" for number, (name, rest) in enumerate(row.split(',', 1) for row in rows)]
+    csv_path.write_text('\n'.join([header, *rows]) + '\n')
+
+
+@pytest.fixture(params=['legacy_csv', 'multistage_csv'])
+def watched(request, tmp_path):
+    csv_path = tmp_path / 'watched.csv'
+    shutil.copy(request.getfixturevalue(request.param), csv_path)
+    builder = IncrementalChartBuilder(str(csv_path), str(tmp_path / 'watch.html'), GanttChartGenerator(use_cache=False))
+    builder.rebuild(csv_path.read_bytes())
+    return csv_path, builder
+
+
+def test_initial_build_matches_generate_chart(watched, tmp_path):
+    csv_path, builder = watched
+    assert builder.output_path.read_bytes() == generate_chart(csv_path, tmp_path / 'full.html')
+
+
+def test_numeric_looking_name_matches_generate_chart(watched, tmp_path):
+    csv_path, builder = watched
+    rename_projects(csv_path, lambda number, name: '2024' if number == 3 else name)
+    timings = builder.rebuild(csv_path.read_bytes())
+
+    assert timings['changed_rows'] == 1
+    output = builder.output_path.read_bytes()
+    assert b'"name": "2024"' in output
+    assert output == generate_chart(csv_path, tmp_path / 'full.html')
+
+
+def test_all_numeric_names_match_generate_chart(watched, tmp_path):
+    csv_path, builder = watched
+    rename_projects(csv_path, lambda number, name: str(number) if number % 2 else name)
+    builder.rebuild(csv_path.read_bytes())
+    rename_projects(csv_path, lambda number, name: str(number))
+    builder.rebuild(csv_path.read_bytes())
+
+    assert builder.output_path.read_bytes() == generate_chart(csv_path, tmp_path / 'full.html')
+
+
+def test_long_format_is_rejected(tmp_path):
+    csv_path = tmp_path / 'long.csv'
+    csv_path.write_text(
+        "project_id,project_name,category,priority,description,team_lead,name,start,end,progress\n"
+        "a,Alpha,Dev,High,Text,Lead,Planning,2024-01-01,2024-02-01,50\n"
+    )
+    builder = IncrementalChartBuilder(str(csv_path), str(tmp_path / 'watch.html'), GanttChartGenerator())
+    with pytest.raises(ValueError, match="one row per project"):
+        builder.poll()
+
+
+
+def us_date(row):
+    """The row with its preparing_start date rewritten from YYYY-MM-DD to MM/DD/YYYY"""
+    date = row.split(',')[3]
+    year, month, day = date.split('-')
+    return row.replace(date, f'{month}/{day}/{year}', 1)
+
+
+@pytest.mark.parametrize('edited_row', [5, 0])
+def test_date_format_is_inferred_from_the_whole_file(tmp_path, legacy_csv, edited_row):
+    csv_path = tmp_path / 'watched.csv'
+    shutil.copy(legacy_csv, csv_path)
+    builder = IncrementalChartBuilder(str(csv_path), str(tmp_path / 'watch.html'), GanttChartGenerator(use_cache=False))
+    builder.rebuild(csv_path.read_bytes())
+
+    # A full load infers the format from the first row and rejects dates in any other
+    header, *rows = csv_path.read_text().splitlines()
+    original = rows[edited_row]
+    rows[edited_row] = us_date(original)
+    csv_path.write_text('\n'.join([header, *rows]) + '\n')
+    with pytest.raises(ValueError) as expected:
+        generate_chart(csv_path, tmp_path / 'full.html')
+    with pytest.raises(ValueError) as error:
+        builder.rebuild(csv_path.read_bytes())
+    assert str(error.value) == str(expected.value)
+
+    rows[edited_row] = original
+    csv_path.write_text('\n'.join([header, *rows]) + '\n')
+    builder.rebuild(csv_path.read_bytes())
+    assert builder.output_path.read_bytes() == generate_chart(csv_path, tmp_path / 'full.html')